@@ -1,17 +1,36 @@
 // === OX500 LOGS LOADER ===
 // Fetches paginated log data from /data/*.json endpoints.
-// No state — pure async fetch functions.
+// Only state: the data manifest mapping page files to content-hashed names.
 
 const DATA_ROOT = '/data';
-const LOGS_META_PATH = `${DATA_ROOT}/logs-pages-meta.json`;
+const SITE_STATE_FILE = 'site-state.json';
+const LOGS_META_FILE = 'logs-pages-meta.json';
 
-function logsPagePath(pageNum) {
-  return `${DATA_ROOT}/logs-page-${pageNum}.json`;
+let dataManifestPromise = null;
+
+function logsPageFile(pageNum) {
+  return `logs-page-${pageNum}.json`;
+}
+
+function logsTextFile(pageNum) {
+  return `logs-text-${pageNum}.json`;
+}
+
+function disruptionPageFile(slug, pageNum) {
+  return `disruption/${slug}-page-${pageNum}.json`;
+}
+
+function logsSincePath(id) {
+  return `${DATA_ROOT}/since/${encodeURIComponent(id)}.json`;
 }
 
-async function fetchJson(url) {
+function dataUrl(file) {
+  return `${DATA_ROOT}/${file.split('/').map(encodeURIComponent).join('/')}`;
+}
+
+async function fetchJson(url, cache = 'no-cache') {
   try {
-    const res = await fetch(url, { cache: 'no-cache' });
+    const res = await fetch(url, { cache });
     if (!res.ok) return null;
     return await res.json();
   } catch (_) {
@@ -19,12 +38,67 @@ async function fetchJson(url) {
   }
 }
 
+// Pages of builds with --hash-data name the manifest on <body>; without it
+// the data files keep their plain names and there is nothing to fetch.
+function loadDataManifest() {
+  if (!dataManifestPromise) {
+    const manifestPath = document.body?.dataset?.dataManifest || '';
+    dataManifestPromise = manifestPath
+      ? fetchJson(manifestPath).then((manifest) =>
+        manifest && manifest.files && typeof manifest.files === 'object' ? manifest.files : {}
+      )
+      : Promise.resolve({});
+  }
+  return dataManifestPromise;
+}
+
+// Page files listed in the manifest are named by their content and never
+// change, so the HTTP cache may answer for them without revalidating.
+async function fetchDataFile(file) {
+  const files = await loadDataManifest();
+  const hashed = files[file];
+  return hashed ? fetchJson(dataUrl(hashed), 'default') : fetchJson(dataUrl(file));
+}
+
+// Drop the cached manifest once new logs are known, so later fetches see their pages.
+export function forgetDataManifest() {
+  dataManifestPromise = null;
+}
+
 export async function fetchLogsPagesMeta() {
-  return fetchJson(LOGS_META_PATH);
+  return fetchDataFile(LOGS_META_FILE);
 }
 
 export async function fetchLogsPage(pageNum) {
   if (!pageNum || pageNum < 1) return null;
-  const page = await fetchJson(logsPagePath(pageNum));
+  const page = await fetchDataFile(logsPageFile(pageNum));
   return Array.isArray(page) ? page : null;
 }
+
+// Bodies of the logs listed on a page, keyed by log id: { text, excerpt }.
+export async function fetchLogsTextPage(pageNum) {
+  if (!pageNum || pageNum < 1) return null;
+  const shard = await fetchDataFile(logsTextFile(pageNum));
+  return shard && typeof shard === 'object' && !Array.isArray(shard) ? shard : null;
+}
+
+// One page of a disruption's logs: { slug, name, count, total_pages, page, logs }.
+export async function fetchDisruptionPage(slug, pageNum) {
+  if (!slug || !pageNum || pageNum < 1) return null;
+  const page = await fetchDataFile(disruptionPageFile(slug, pageNum));
+  return page && Array.isArray(page.logs) ? page : null;
+}
+
+// Logs published after `id`, newest first. null when `id` is older than the
+// feed's checkpoints: the caller has to reload the pages instead. The feed
+// keeps its plain names with --hash-data, as the client derives them from `id`.
+export async function fetchLogsSince(id) {
+  if (!id) return null;
+  const feed = await fetchJson(logsSincePath(id));
+  return feed && Array.isArray(feed.logs) ? feed : null;
+}
+
+export async function fetchSiteState() {
+  const state = await fetchDataFile(SITE_STATE_FILE);
+  return state && typeof state === 'object' ? state : null;
+}
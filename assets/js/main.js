@@ -12,6 +12,7 @@ import { initGlitch } from './modules/glitch.js';
 import { initAnomalyEngine } from './modules/anomaly-engine.js';
 import { initMobileLogs } from './modules/mobile-logs/index.js';
 import { initNextLogLabel } from './modules/next-log-label.js';
+import { initSiteState } from './modules/site-state.js';
 import { initLayoutPlacement } from './modules/layout-placement.js';
 
 const CRITICAL_INITIALIZERS = [
@@ -21,6 +22,7 @@ const CRITICAL_INITIALIZERS = [
   initTopbarStatus,
   initSystemPhaseUi,
   initNextLogLabel,
+  initSiteState,
   initLayoutPlacement,
 ];
 
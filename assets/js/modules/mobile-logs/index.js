@@ -17,6 +17,8 @@ import {
   isFromDisruption,
   setFromDisruption,
   maybePrefetchAroundListIndex,
+  refreshNewLogs,
+  loadDisruption,
 } from './store.js';
 import {
   renderEntry,
@@ -129,8 +131,10 @@ export function initMobileLogs() {
     updateControls();
   }
 
-  function showCurrentDisruptionList() {
-    renderDisruptionList(els, mobileQuery, _getCurrentEntry(), stampEl);
+  async function showCurrentDisruptionList() {
+    const entry = _getCurrentEntry();
+    if (entry) await loadDisruption(disruptionKey(entry));
+    renderDisruptionList(els, mobileQuery, entry, stampEl);
     updateControls();
   }
 
@@ -192,6 +196,7 @@ export function initMobileLogs() {
     if (tab === 'disruption') {
       const latestDisruption = navController.getLatestDisruptionEntry();
       if (!latestDisruption) return;
+      await loadDisruption(disruptionKey(latestDisruption));
       showDisruptionList(latestDisruption, false, false);
       return;
     }
@@ -246,6 +251,7 @@ export function initMobileLogs() {
 
         e.preventDefault();
         if (!(await ensureBaseLogsReady())) return;
+        await loadDisruption(slug);
 
         const entry = pickEntryForDisruptionSlug(slug);
         if (!entry) return;
@@ -342,6 +348,16 @@ export function initMobileLogs() {
     updateControls();
   });
 
+  // === NEW LOGS ===
+  // A tab left open catches up from the small since/ feed instead of refetching pages.
+
+  document.addEventListener('visibilitychange', () => {
+    if (document.hidden) return;
+    refreshNewLogs().then((added) => {
+      if (added) updateControls();
+    });
+  });
+
   updateControls();
 }
 
@@ -4,9 +4,8 @@
 import { disruptionKey, getCurrentEntry, setLogStamp } from './renderer.js';
 import {
   getLogs,
-  maxLoadedPage,
-  minLoadedPage,
-  getState,
+  nextOlderPage,
+  nextNewerPage,
   loadPage,
 } from './store.js';
 
@@ -76,14 +75,13 @@ export function applyDisruptionListTarget(targetEntry, stampEl, setCurrentEntryI
 }
 
 export async function maybeLoadAdjacentPageForDirection(direction) {
-  const state = getState();
   if (direction < 0) {
-    const olderPage = maxLoadedPage() + 1;
-    if (olderPage <= state.totalPages) await loadPage(olderPage);
+    const olderPage = nextOlderPage();
+    if (olderPage) await loadPage(olderPage);
     return;
   }
   if (direction > 0) {
-    const newerPage = minLoadedPage() - 1;
-    if (newerPage >= 1) await loadPage(newerPage);
+    const newerPage = nextNewerPage();
+    if (newerPage) await loadPage(newerPage);
   }
 }
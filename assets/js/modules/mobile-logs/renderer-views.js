@@ -5,6 +5,8 @@ import {
   setCurrentEntryId,
   maybePrefetchAroundCurrent,
   getState,
+  hasLogText,
+  ensureLogText,
 } from './store.js';
 import {
   toLogHtml,
@@ -103,6 +105,15 @@ export function renderEntry(els, mobileQuery, entry, stampEl, recentLogsRoot, up
   markCurrentRecentLog(recentLogsRoot, currentId);
   markCurrentDisruptionNode(entry);
 
+  if (!hasLogText(entry)) {
+    // Body lives in the page's text shard; fill it in once fetched.
+    ensureLogText(entry).then((loaded) => {
+      if (!loaded || getState().currentEntryId !== currentId) return;
+      if (textEl.dataset.viewMode !== 'entry') return;
+      textEl.innerHTML = titleHtml + toLogHtml(entry.text || '');
+    });
+  }
+
   if (document.body) {
     document.body.dataset.logLevel = currentId;
   }
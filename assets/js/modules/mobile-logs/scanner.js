@@ -3,7 +3,13 @@
 // renders results, and handles deep-text-search toggle.
 
 import { utils } from '../../core/utils.js';
-import { ensureAllLogsLoaded, isLoaded, setFromSearch, setFromDisruption } from './store.js';
+import {
+  ensureAllLogsLoaded,
+  ensureAllLogTextLoaded,
+  isLoaded,
+  setFromSearch,
+  setFromDisruption,
+} from './store.js';
 import {
   renderDisruptionList,
   setViewMode,
@@ -49,6 +55,7 @@ export function renderScanResults(els, q, options) {
 export async function openScan(els, _mobileQuery) {
   await ensureAllLogsLoaded();
   if (!isLoaded()) return;
+  if (getScannerState().deepTextSearchEnabled) await ensureAllLogTextLoaded();
   setFromSearch(true);
   setFromDisruption(false);
   setViewMode(els, 'scan');
@@ -113,6 +120,12 @@ export function initScannerListeners(els, mobileQuery, stampEl, recentLogsRoot,
         e.preventDefault();
         toggleDeepSearch();
         renderScanResults(els, scanInput?.value || '');
+        if (getScannerState().deepTextSearchEnabled) {
+          // Text and excerpts come from the text shards; rescan once they are in.
+          ensureAllLogTextLoaded().then(() => {
+            renderScanResults(els, scanInput?.value || '', { keepLimit: true });
+          });
+        }
         return;
       }
 
@@ -9,6 +9,67 @@ export function getLoadedPageBoundary(loadedPages, comparator) {
   return comparator(...loadedPages);
 }
 
+// Pages run newest first (1 = newest) unless the meta says they are
+// oldest-anchored: then first_page holds the oldest logs, head_page the
+// newest, and only the head page changes when a log is published.
+export function applyPagesMeta(state, meta) {
+  const total = Number(meta?.total_pages);
+  if (!(total > 0)) return false;
+  state.totalPages = Math.max(state.totalPages, total);
+  state.pageSize = Number(meta.page_size) || 0;
+  state.anchored = meta.order === 'oldest-anchored';
+  if (state.anchored) {
+    state.newestPage = Number(meta.head_page);
+    state.oldestPage = Number(meta.first_page);
+  } else {
+    state.newestPage = 1;
+    state.oldestPage = state.totalPages;
+  }
+  return true;
+}
+
+// Newest-first pages move by one entry per published log, so held entries
+// keep a rank (0 = newest) and their page in pageById follows it. Pages of
+// oldest-anchored entries never move and stay as they came.
+export function setEntryRank(state, id, rank) {
+  if (state.anchored || !(state.pageSize > 0)) return;
+  state.rankById.set(id, rank);
+  state.pageById.set(id, Math.floor(rank / state.pageSize) + 1);
+}
+
+export function shiftEntryRanks(state, added) {
+  if (state.anchored || !(state.pageSize > 0) || !added) return;
+  state.rankById.forEach((rank, id) => setEntryRank(state, id, rank + added));
+  // text shards loaded so far hold other logs than their page numbers do now
+  state.loadedTextPages.clear();
+}
+
+function olderStep(state) {
+  return state.oldestPage >= state.newestPage ? 1 : -1;
+}
+
+export function isPageInRange(state, pageNum) {
+  const lo = Math.min(state.newestPage, state.oldestPage);
+  const hi = Math.max(state.newestPage, state.oldestPage);
+  return pageNum >= lo && pageNum <= hi;
+}
+
+export function pagesNewestFirst(state) {
+  const pages = [];
+  if (!state.totalPages) return pages;
+  const step = olderStep(state);
+  for (let p = state.newestPage; isPageInRange(state, p); p += step) pages.push(p);
+  return pages;
+}
+
+// Page just past the loaded ones on the older (or newer) side; 0 if none.
+export function adjacentPage(state, older) {
+  if (!state.loadedPages.size) return 0;
+  const step = older ? olderStep(state) : -olderStep(state);
+  const pageNum = getLoadedPageBoundary(state.loadedPages, step > 0 ? Math.max : Math.min) + step;
+  return isPageInRange(state, pageNum) ? pageNum : 0;
+}
+
 export function resolveStampId(stampEl) {
   const stampMatch = (stampEl?.textContent || '').match(/(?:\bLOG\b\s+)?(\d+)/i);
   return utils.normalizeId(stampMatch ? stampMatch[1] : '');
@@ -18,8 +79,10 @@ export function rebuildFromLoadedPages(state) {
   const uniqueById = new Map();
   const pages = Array.from(state.loadedPages).sort((a, b) => a - b);
 
-  pages.forEach((pageNum) => {
-    const part = state.pagePayloads.get(pageNum);
+  const parts = pages.map((pageNum) => state.pagePayloads.get(pageNum));
+  parts.push(state.looseEntries);
+
+  parts.forEach((part) => {
     if (!Array.isArray(part) || !part.length) return;
     part.forEach((entry) => {
       const id = utils.normalizeId(entry?.id);
@@ -46,12 +109,12 @@ export function computePrefetchPages(state, currentIndex, totalLength, edgeThres
   const jobs = [];
 
   if (nearStart) {
-    const nextOlderPage = getLoadedPageBoundary(state.loadedPages, Math.max) + 1;
-    if (nextOlderPage <= state.totalPages) jobs.push(nextOlderPage);
+    const nextOlderPage = adjacentPage(state, true);
+    if (nextOlderPage) jobs.push(nextOlderPage);
   }
   if (nearEnd) {
-    const nextNewerPage = getLoadedPageBoundary(state.loadedPages, Math.min) - 1;
-    if (nextNewerPage >= 1) jobs.push(nextNewerPage);
+    const nextNewerPage = adjacentPage(state, false);
+    if (nextNewerPage) jobs.push(nextNewerPage);
   }
   return jobs;
 }
@@ -1,16 +1,29 @@
 // === MOBILE LOGS — STORE ===
 // Owns all log data. Handles paginated loading, deduplication,
-// index resolution, and prefetch logic.
+// index resolution, and prefetch logic. Pages list logs without
+// their bodies; text and excerpt arrive per page on demand.
 // No DOM access except reading body.dataset for currentIndex.
 
 import { utils } from '../../core/utils.js';
-import { fetchLogsPagesMeta, fetchLogsPage } from '../../core/logs-loader.js';
+import {
+  fetchLogsPagesMeta,
+  fetchLogsPage,
+  fetchLogsTextPage,
+  fetchLogsSince,
+  fetchDisruptionPage,
+  forgetDataManifest,
+} from '../../core/logs-loader.js';
 import { bus } from '../../core/event-bus.js';
 import {
-  getLoadedPageBoundary,
+  applyPagesMeta,
+  isPageInRange,
+  pagesNewestFirst,
+  adjacentPage,
   resolveStampId,
   rebuildFromLoadedPages,
   computePrefetchPages,
+  setEntryRank,
+  shiftEntryRanks,
 } from './store-internals.js';
 
 // === STATE ===
@@ -21,9 +34,21 @@ const state = {
   logsById: new Map(),
 
   totalPages: 0,
+  pageSize: 0,
+  anchored: false,
+  newestPage: 1,
+  oldestPage: 0,
   loadedPages: new Set(),
   loadingPagePromises: new Map(),
   pagePayloads: new Map(),
+  // entries that came from the since/ feed or disruption files, not a logs page
+  looseEntries: [],
+  pageById: new Map(),
+  rankById: new Map(),
+  loadedDisruptions: new Set(),
+  loadingDisruptionPromises: new Map(),
+  loadedTextPages: new Set(),
+  loadingTextPromises: new Map(),
   logsPagesMetaCache: null,
 
   loaded: false,
@@ -52,12 +77,12 @@ export function setFromSearch(v) { state.fromSearch = Boolean(v); }
 export function isFromDisruption() { return state.fromDisruption; }
 export function setFromDisruption(v) { state.fromDisruption = Boolean(v); }
 
-export function maxLoadedPage() {
-  return getLoadedPageBoundary(state.loadedPages, Math.max);
+export function nextOlderPage() {
+  return adjacentPage(state, true);
 }
 
-export function minLoadedPage() {
-  return getLoadedPageBoundary(state.loadedPages, Math.min);
+export function nextNewerPage() {
+  return adjacentPage(state, false);
 }
 
 export function resolveCurrentIndex(stampEl) {
@@ -73,7 +98,7 @@ export function resolveCurrentIndex(stampEl) {
 
 export async function loadPage(pageNum) {
   if (!pageNum || pageNum < 1) return false;
-  if (state.totalPages && pageNum > state.totalPages) return false;
+  if (state.totalPages && !isPageInRange(state, pageNum)) return false;
   if (state.loadedPages.has(pageNum)) return true;
   if (state.loadingPagePromises.has(pageNum)) {
     return await state.loadingPagePromises.get(pageNum);
@@ -82,8 +107,15 @@ export async function loadPage(pageNum) {
   const promise = (async () => {
     try {
       const page = await fetchLogsPage(pageNum);
-      if (!Array.isArray(page) || !page.length) return false;
+      // an oldest-anchored page may be empty when no log was published in its id range
+      if (!Array.isArray(page)) return false;
       state.pagePayloads.set(pageNum, page);
+      page.forEach((entry, index) => {
+        const id = utils.normalizeId(entry?.id);
+        if (!id) return;
+        state.pageById.set(id, pageNum);
+        setEntryRank(state, id, (pageNum - 1) * state.pageSize + index);
+      });
       state.loadedPages.add(pageNum);
       rebuildFromLoadedPages(state);
       bus.emit('logs:pageLoaded', { page: pageNum });
@@ -113,9 +145,8 @@ export async function ensureLoaded() {
       meta = await fetchLogsPagesMeta();
       state.logsPagesMetaCache = meta || {};
     }
-    if (meta && Number(meta.total_pages) > 0) {
-      state.totalPages = Number(meta.total_pages);
-      await loadPage(1);
+    if (applyPagesMeta(state, meta)) {
+      await loadPage(state.newestPage);
       state.loaded = state.orderedIds.length > 0;
     }
   })().finally(() => {
@@ -137,12 +168,9 @@ export async function ensureAllLogsLoaded() {
         meta = await fetchLogsPagesMeta();
         state.logsPagesMetaCache = meta || {};
       }
-      const declaredTotal = Number(meta?.total_pages);
-      if (declaredTotal > 0) {
-        state.totalPages = Math.max(state.totalPages, declaredTotal);
-      }
+      applyPagesMeta(state, meta);
       if (state.totalPages <= 1) { state.allLogsLoaded = true; return; }
-      for (let p = 2; p <= state.totalPages; p++) await loadPage(p);
+      for (const p of pagesNewestFirst(state)) await loadPage(p);
       state.allLogsLoaded = true;
     })().finally(() => { state.allLogsLoadingPromise = null; });
   }
@@ -150,6 +178,137 @@ export async function ensureAllLogsLoaded() {
   await state.allLogsLoadingPromise;
 }
 
+// Feed entries come newest first and ahead of every held log, so their index
+// is their rank; other entries only know their page and are ranked at its top.
+function addLooseEntries(entries, fromFeed = false) {
+  entries.forEach((entry, index) => {
+    const id = utils.normalizeId(entry?.id);
+    if (!id || state.logsById.has(id)) return;
+    const pageNum = Number(entry.page);
+    if (pageNum > 0) {
+      state.pageById.set(id, pageNum);
+      setEntryRank(state, id, fromFeed ? index : (pageNum - 1) * state.pageSize);
+    }
+    state.looseEntries.push(entry);
+  });
+}
+
+// === DISRUPTIONS ===
+
+// Load every log of one disruption from data/disruption/<slug>-page-N.json,
+// usually a single file, instead of walking the whole logs index.
+export async function loadDisruption(slug) {
+  const key = String(slug || '').trim();
+  if (!key) return false;
+  if (state.loadedDisruptions.has(key)) return true;
+  if (state.loadingDisruptionPromises.has(key)) {
+    return await state.loadingDisruptionPromises.get(key);
+  }
+
+  const promise = (async () => {
+    try {
+      const first = await fetchDisruptionPage(key, 1);
+      if (!first) return false;
+      const pages = [first];
+      for (let p = 2; p <= Number(first.total_pages); p++) {
+        const page = await fetchDisruptionPage(key, p);
+        if (page) pages.push(page);
+      }
+      pages.forEach((page) => addLooseEntries(page.logs));
+      rebuildFromLoadedPages(state);
+      state.loadedDisruptions.add(key);
+      return true;
+    } catch (_) {
+      return false;
+    } finally {
+      state.loadingDisruptionPromises.delete(key);
+    }
+  })();
+
+  state.loadingDisruptionPromises.set(key, promise);
+  return await promise;
+}
+
+// === NEW LOGS ===
+
+// Merge the logs published since the newest one held, from data/since/.
+// Returns how many were added.
+export async function refreshNewLogs() {
+  if (!state.loaded || !state.orderedIds.length) return 0;
+  const feed = await fetchLogsSince(state.orderedIds[state.orderedIds.length - 1]);
+  if (!feed) return 0;
+
+  const added = feed.logs.filter((entry) => {
+    const id = utils.normalizeId(entry?.id);
+    return id && !state.logsById.has(id);
+  });
+  if (!added.length) return 0;
+
+  added.forEach((entry) => {
+    const pageNum = Number(entry.page);
+    // that page's text shard now has bodies the loaded copy lacks
+    if (pageNum > 0) state.loadedTextPages.delete(pageNum);
+  });
+  // newest-first: every held log moved down by as many entries as were published
+  shiftEntryRanks(state, added.length);
+  addLooseEntries(added, true);
+  forgetDataManifest();
+  state.logsPagesMetaCache = null;
+  rebuildFromLoadedPages(state);
+  bus.emit('logs:updated', { added: added.length });
+  return added.length;
+}
+
+// === LOG TEXT ===
+
+export function hasLogText(entry) {
+  return typeof entry?.text === 'string';
+}
+
+export async function loadTextPage(pageNum) {
+  if (!pageNum || pageNum < 1) return false;
+  if (state.loadedTextPages.has(pageNum)) return true;
+  if (state.loadingTextPromises.has(pageNum)) {
+    return await state.loadingTextPromises.get(pageNum);
+  }
+
+  const promise = (async () => {
+    try {
+      const shard = await fetchLogsTextPage(pageNum);
+      if (!shard) return false;
+      Object.entries(shard).forEach(([id, body]) => {
+        const entry = state.logsById.get(utils.normalizeId(id));
+        if (entry && body) Object.assign(entry, body);
+      });
+      state.loadedTextPages.add(pageNum);
+      return true;
+    } catch (_) {
+      return false;
+    } finally {
+      state.loadingTextPromises.delete(pageNum);
+    }
+  })();
+
+  state.loadingTextPromises.set(pageNum, promise);
+  return await promise;
+}
+
+export async function ensureLogText(entry) {
+  if (hasLogText(entry)) return true;
+  const pageNum = state.pageById.get(utils.normalizeId(entry?.id));
+  if (!pageNum || !(await loadTextPage(pageNum))) return false;
+  // an entry ranked at its page's top may have moved one page further
+  if (!hasLogText(entry) && !state.anchored && isPageInRange(state, pageNum + 1)) {
+    await loadTextPage(pageNum + 1);
+  }
+  return true;
+}
+
+export async function ensureAllLogTextLoaded() {
+  await ensureAllLogsLoaded();
+  for (const p of pagesNewestFirst(state)) await loadTextPage(p);
+}
+
 export function maybePrefetchAroundCurrent(stampEl) {
   if (!state.loaded || !state.totalPages || !state.orderedIds.length) return;
   const idx = resolveCurrentIndex(stampEl);
@@ -157,14 +316,14 @@ export function maybePrefetchAroundCurrent(stampEl) {
 
   // Approaching older logs boundary → prefetch next (older) page
   if (idx <= 10) {
-    const nextOlderPage = maxLoadedPage() + 1;
-    if (nextOlderPage <= state.totalPages) loadPage(nextOlderPage);
+    const olderPage = nextOlderPage();
+    if (olderPage) loadPage(olderPage);
   }
 
   // Approaching newer logs boundary → prefetch previous (newer) page
   if (state.orderedIds.length - 1 - idx <= 10) {
-    const nextNewerPage = minLoadedPage() - 1;
-    if (nextNewerPage >= 1) loadPage(nextNewerPage);
+    const newerPage = nextNewerPage();
+    if (newerPage) loadPage(newerPage);
   }
 }
 
@@ -0,0 +1,48 @@
+// === SITE STATE ===
+// Fills the site-wide fragments (recent logs, disruption nodes, available
+// count, next log countdown) that builds with --shared-fragments leave out
+// of log and disruption pages. No-op on pages without placeholders.
+
+import { fetchSiteState } from '../core/logs-loader.js';
+import { initNextLogLabel } from './next-log-label.js';
+
+const FRAGMENT_SELECTOR = '[data-site-fragment]';
+
+// === INIT ===
+
+export function initSiteState() {
+  const placeholders = document.querySelectorAll(FRAGMENT_SELECTOR);
+  if (!placeholders.length) return;
+
+  fetchSiteState().then((state) => {
+    if (!state) return;
+    applyFragments(placeholders, state.fragments || {});
+    applyAvailableCount(state.available_count);
+    applyNextLog(state.next_log_utc);
+  });
+}
+
+// === PRIVATE ===
+
+function applyFragments(placeholders, fragments) {
+  placeholders.forEach((el) => {
+    const html = fragments[el.dataset.siteFragment];
+    if (typeof html === 'string') el.outerHTML = html;
+  });
+}
+
+function applyAvailableCount(value) {
+  const availEl = document.getElementById('avail');
+  const count = String(value || '').trim();
+  if (!availEl || !count) return;
+  // boot.js locks #avail to its build value; move the lock before updating.
+  availEl.dataset.buildValue = count;
+  if (!availEl.dataset.dynamicValue) availEl.textContent = count;
+}
+
+function applyNextLog(value) {
+  const el = document.getElementById('nextLogCountdown');
+  if (!el || !value) return;
+  el.dataset.nextLog = value;
+  initNextLogLabel();
+}
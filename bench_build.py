@@ -0,0 +1,576 @@
+"""
+Benchmarks for the build.py hot paths.
+
+    python bench_build.py render [--iterations N]
+    python bench_build.py pipeline [--sizes 1000,10000,100000,1000000] [--repeat N] [--output results.json]
+    python bench_build.py compare BASELINE.json CANDIDATE.json
+    python bench_build.py ingest [--sizes 100000,300000]
+    python bench_build.py source [--sizes 10000,100000] [--repeat N]
+
+The pipeline benchmark generates synthetic archives and times the Python stages
+directly (no esbuild, no network), writing pages into a temporary directory.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import build
+
+BENCH_RESULTS_DIR = build.BUILD_CACHE / "bench"
+
+
+# =========================================================
+# RENDER MICROBENCHMARK
+# =========================================================
+def sample_log_page_mapping(template: build.CompiledTemplate) -> dict:
+    """Realistic values for every slot of the log template, taken from logs.json."""
+    data = json.loads(build.read_text(build.ROOT / "logs.json"))
+    log = data["logs"][0]
+    base_url = data["site"]["base_url"].rstrip("/")
+    mapping = {key: f"value-{key.lower()}" for key in template.slots}
+    mapping.update(
+        {
+            "LOG_TEXT": build.format_log_text(log.get("text", "")),
+            "PREVIOUS_LOG_TEXT_PLAIN": build.esc(" ".join(str(log.get("text", "")).split())),
+            "JSONLD": build.jsonld_log_creative_work(
+                base_url,
+                "/logs/2025/12/log-01612-im-not-done.html",
+                str(log["id"]),
+                build.derive_mobile_log_entry_title(log),
+                str(log.get("text", "")),
+                str(log.get("date", "")),
+                build.derive_mobile_disruption_title(log),
+                f"{base_url}/disruption/im-not-done.html",
+                data["site"]["og_image"],
+            ),
+        }
+    )
+    return mapping
+
+
+def time_per_call(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def bench_render(iterations: int) -> None:
+    base_url = "https://ox500.com"
+    source = build.read_text(build.ROOT / "template-log.html")
+    template = build.CompiledTemplate(source, "template-log.html", base_url)
+    mapping = sample_log_page_mapping(template)
+
+    def legacy():
+        page = build.render(source, mapping, "template-log.html")
+        return build.rewrite_css_links(page, base_url)
+
+    def compiled():
+        return template.render(mapping)
+
+    if legacy() != compiled():
+        raise SystemExit("render mismatch: compiled template output differs from render + rewrite_css_links")
+
+    compile_s = time_per_call(lambda: build.CompiledTemplate(source, "template-log.html", base_url), 50)
+    legacy_s = time_per_call(legacy, iterations)
+    compiled_s = time_per_call(compiled, iterations)
+    print(f"template-log.html: {len(source)} chars, {len(template.slots)} slots, {iterations} iterations")
+    print(f"  compile once:                 {compile_s * 1e6:9.1f} us")
+    print(f"  render + rewrite_css_links:   {legacy_s * 1e6:9.1f} us/page")
+    print(f"  CompiledTemplate.render:      {compiled_s * 1e6:9.1f} us/page")
+    print(f"  speedup:                      {legacy_s / compiled_s:9.1f}x")
+
+
+# =========================================================
+# SYNTHETIC ARCHIVE
+# =========================================================
+WORDS = (
+    "signal static wire ghost pulse core drift noise cold fire rust glass "
+    "echo voltage storm orbit hollow burn fracture silence engine night"
+).split()
+
+
+@dataclass(frozen=True)
+class ArchiveSpec:
+    logs: int
+    text_chars: int = 600
+    logs_per_disruption: int = 8
+    series_share: float = 0.5
+    ungrouped_share: float = 0.05
+    future_share: float = 0.02
+    logs_per_day: int = 4
+    seed: int = 500
+
+
+def generate_archive(spec: ArchiveSpec) -> dict:
+    """
+    logs.json-shaped payload with spec.logs records. Ids and dates ascend together
+    (as ingest_logs requires); the last future_share of logs is dated after today.
+    Consecutive runs of logs_per_disruption logs share a disruption; series_share of
+    those runs use the 'series' field (DISRUPTION_SERIES // ...), the rest 'disruption'.
+    """
+    rng = random.Random(spec.seed)
+    future = int(spec.logs * spec.future_share)
+    past = spec.logs - future
+    today = build.utc_today()
+    first_day = today - timedelta(days=max(past - 1, 0) // spec.logs_per_day)
+
+    def words(count: int) -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(count))
+
+    def text_body(n: int) -> str:
+        # the first line feeds the page description, which must be unique per log
+        lines = [f"transmission {n} {words(3)}"]
+        size = len(lines[0])
+        while size < spec.text_chars:
+            line = words(rng.randint(3, 8))
+            lines.append(line if rng.random() > 0.15 else "")
+            size += len(line) + 1
+        return "\n".join(lines)
+
+    logs = []
+    group_name = ""
+    group_field = "series"
+    for i in range(spec.logs):
+        if i < past:
+            day = first_day + timedelta(days=i // spec.logs_per_day)
+        else:
+            day = today + timedelta(days=1 + (i - past) // spec.logs_per_day)
+        if i % spec.logs_per_disruption == 0:
+            group_name = f"{words(2).upper()} {i // spec.logs_per_disruption}"
+            group_field = "series" if rng.random() < spec.series_share else "disruption"
+        title = words(rng.randint(2, 5)).upper()
+        log = {
+            "id": f"{i + 1:05d}",
+            "title": title,
+            "date": day.isoformat(),
+            "tag": "DISRUPTION",
+            "slug": build.slugify(title),
+            "excerpt": words(10),
+            "text": text_body(i + 1),
+        }
+        if rng.random() >= spec.ungrouped_share:
+            prefix = "DISRUPTION_SERIES" if group_field == "series" else "DISRUPTION"
+            log[group_field] = f"{prefix} // {group_name}"
+        logs.append(log)
+
+    return {
+        "site": {
+            "base_url": "https://bench.invalid",
+            "site_title": "OX500 // CORE INTERFACE",
+            "og_image": "/assets/img/og-image.jpg",
+            "youtube": "https://www.youtube.com/@ox500core",
+            "default_lang": "en",
+        },
+        "system": {
+            "core_start_utc": f"{first_day.isoformat()}T00:00:00Z",
+            "system_id": "OX500_CORE",
+            "sys_ver": "01.00",
+        },
+        "logs": logs,
+    }
+
+
+# =========================================================
+# PIPELINE BENCHMARK
+# =========================================================
+def timed(timings: dict, name: str, fn, *args, **kwargs):
+    start = time.perf_counter()
+    with build.OutputWriter():  # outputs are flushed inside the timing, as at the end of a build stage
+        value = fn(*args, **kwargs)
+    timings[name] = time.perf_counter() - start
+    return value
+
+
+def bench_pipeline_once(spec: ArchiveSpec, out_dir: Path, skip_pages: bool) -> dict:
+    """Time each Python stage of the build for one synthetic archive; outputs go to out_dir/dist."""
+    source_path = out_dir / "logs.json"
+    with open(source_path, "w", encoding="utf-8") as f:
+        json.dump(generate_archive(spec), f, ensure_ascii=False, indent=2)
+    timings = {}
+    dist = out_dir / "dist"
+    build.set_output_root(dist)
+    source = None
+    try:
+        source = timed(timings, "load_source", build.stage_load_and_validate_source, source_path)
+        logs = source["logs"]
+        logs_sorted, next_log_utc = timed(timings, "prepare_logs", build.stage_prepare_logs, logs)
+        disruptions, disruption_order = timed(
+            timings, "stage_group_disruptions", build.stage_group_disruptions, logs_sorted
+        )
+
+        site = source["site"]
+        t_log, _, t_node = build.stage_load_templates(site["base_url"])
+        ctx = build.SiteContext(
+            base_url=site["base_url"],
+            lang=site["default_lang"],
+            og_image=site["og_image"],
+            youtube=site["youtube"],
+            bandcamp="",
+            github_repo="",
+            core_start=source["core_start"],
+            sys_ver=source["sys_ver"],
+            site_title=site["site_title"],
+            available_count=f"{len(logs_sorted):04d}",
+            asset_version="bench0000000",
+            asset_css_url="/assets/css/style.css?v=bench0000000",
+            asset_js_url="/assets/js/bundle.js?v=bench0000000",
+            site_mode="test",
+            robots_meta="",
+            data_manifest_url="",
+        )
+        manifest = build.BuildManifest("bench")
+        shared = {
+            "logs_sorted": logs_sorted,
+            "disruption_order": disruption_order,
+            "disruptions": disruptions,
+            "ctx": ctx,
+            "next_log_utc": next_log_utc,
+            "seo_registry": {"title": {}, "description": {}, "canonical": {}},
+            "seo_warnings": [],
+            "seo_infos": [],
+            "url": build.make_url_path,
+            "disruption_rel": build.make_disruption_rel_path,
+            "manifest": manifest,
+        }
+        sitemap_entries = []
+        if not skip_pages:
+            timed(
+                timings, "stage_build_log_pages", build.stage_build_log_pages,
+                t_log=t_log, sitemap_entries=sitemap_entries, **shared,
+            )
+            timed(
+                timings, "stage_build_disruption_pages", build.stage_build_disruption_pages,
+                t_node=t_node, sitemap_entries=sitemap_entries, **shared,
+            )
+
+        home_vm = timed(
+            timings, "compose_home_view_models", build.compose_home_view_models,
+            logs_sorted=logs_sorted, disruptions=disruptions, disruption_order=disruption_order,
+            ctx=ctx, url=shared["url"], disruption_rel=shared["disruption_rel"],
+        )
+        timed(
+            timings, "stage_export_json_data", build.stage_export_json_data,
+            logs_sorted=logs_sorted, disruptions_nav_payload=home_vm["disruptions_nav_payload"],
+            manifest=manifest, disruptions=disruptions,
+        )
+        timed(
+            timings, "stage_write_robots_and_sitemap", build.stage_write_robots_and_sitemap,
+            ctx.base_url, logs_sorted, sitemap_entries, ctx.site_mode,
+        )
+    finally:
+        build.set_output_root(build.DIST_LIVE)
+        if source is not None:
+            source["text_store"].close()
+
+    return {
+        "spec": asdict(spec),
+        "published_logs": len(logs_sorted),
+        "disruptions": len(disruptions),
+        "stages": {name: round(seconds, 6) for name, seconds in timings.items()},
+        "total_seconds": round(sum(timings.values()), 6),
+    }
+
+
+def bench_pipeline(args) -> None:
+    runs = []
+    for size in args.sizes:
+        spec = ArchiveSpec(
+            logs=size,
+            text_chars=args.text_chars,
+            logs_per_disruption=args.logs_per_disruption,
+            series_share=args.series_share,
+            ungrouped_share=args.ungrouped_share,
+            future_share=args.future_share,
+            seed=args.seed,
+        )
+        result = None
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory(prefix="ox500-bench-") as tmp:
+                attempt = bench_pipeline_once(spec, Path(tmp), args.skip_pages)
+            if result is not None:
+                # best of N per stage; the spread between runs is mostly scheduler noise
+                attempt["stages"] = {
+                    name: min(seconds, result["stages"][name]) for name, seconds in attempt["stages"].items()
+                }
+                attempt["total_seconds"] = round(sum(attempt["stages"].values()), 6)
+            result = attempt
+        result["repeat"] = args.repeat
+        runs.append(result)
+        print(f"{size} logs ({result['published_logs']} published, {result['disruptions']} disruptions)")
+        for name, seconds in result["stages"].items():
+            print(f"  {name:32} {seconds:9.3f} s  {seconds / size * 1e6:9.1f} us/log")
+        print(f"  {'total':32} {result['total_seconds']:9.3f} s")
+
+    output = args.output or BENCH_RESULTS_DIR / f"pipeline-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "generated_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "code_version": build.compute_code_version(),
+        "python": platform.python_version(),
+        "minify_html": build._MINIFY_HTML_AVAILABLE,
+        "runs": runs,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    print(f"Results written to {output}")
+
+
+def compare_results(baseline_path: Path, candidate_path: Path) -> None:
+    """Per-stage seconds of two pipeline result files, matched by archive size."""
+    baseline = json.loads(build.read_text(baseline_path))
+    candidate = json.loads(build.read_text(candidate_path))
+    print(f"baseline  {baseline['code_version']}  {baseline['generated_utc']}")
+    print(f"candidate {candidate['code_version']}  {candidate['generated_utc']}")
+    candidate_runs = {run["spec"]["logs"]: run for run in candidate["runs"]}
+    for base_run in baseline["runs"]:
+        size = base_run["spec"]["logs"]
+        cand_run = candidate_runs.get(size)
+        if cand_run is None:
+            continue
+        if base_run["spec"] != cand_run["spec"]:
+            print(f"{size} logs: WARNING archive specs differ")
+        print(f"{size} logs")
+        stage_names = list(base_run["stages"]) + [n for n in cand_run["stages"] if n not in base_run["stages"]]
+        rows = [(name, base_run["stages"].get(name), cand_run["stages"].get(name)) for name in stage_names]
+        rows.append(("total", base_run["total_seconds"], cand_run["total_seconds"]))
+        for name, before, after in rows:
+            if before is None or after is None:
+                print(f"  {name:32} {before if before is not None else '-':>9} -> {after if after is not None else '-':>9}")
+                continue
+            ratio = after / before if before else float("inf")
+            print(f"  {name:32} {before:9.3f} -> {after:9.3f} s  {ratio:6.2f}x")
+
+
+# =========================================================
+# INGEST BENCHMARK
+# =========================================================
+def validate_logs(logs: list) -> None:
+    """build.py's first ingest pass before ingest_logs(): ids and dates only, all errors at once."""
+    errors = []
+    seen_ids = {}
+    for idx, log in enumerate(logs):
+        ctx = f"logs[{idx}]"
+        log_id_int = None
+
+        try:
+            log_id_int = build.parse_log_id_strict(log.get("id"), f"{ctx}.id")
+        except ValueError as exc:
+            errors.append(str(exc))
+            continue
+
+        if log_id_int in seen_ids:
+            first_idx = seen_ids[log_id_int]
+            errors.append(
+                f"{ctx}.id: duplicate id '{log_id_int}' (first seen at logs[{first_idx}].id)"
+            )
+            continue
+        seen_ids[log_id_int] = idx
+
+        try:
+            build.parse_iso_date_strict(log.get("date", ""), f"{ctx}.date (id={log.get('id', '')})")
+        except ValueError as exc:
+            errors.append(str(exc))
+            continue
+
+    if errors:
+        raise build.invalid_logs_error(errors)
+
+
+def enrich_logs(logs: list, core_date) -> list:
+    """build.py's second ingest pass before ingest_logs(): parses ids and dates again to build the records."""
+    enriched = []
+    for log in logs:
+        log_id_int = build.parse_log_id_strict(log.get("id"), "enrich_logs.id")
+        log_date = build.parse_iso_date_strict(log.get("date", ""), f"enrich_logs.date (id={log.get('id', '')})")
+        enriched.append(build.LogRecord(log, log_id_int, log_date, core_date))
+    return enriched
+
+
+def legacy_ingest(logs_raw: list, core_date) -> list:
+    """The multi-pass ingest build.py used before ingest_logs(), kept for comparison."""
+    validate_logs(logs_raw)
+    logs = enrich_logs(logs_raw, core_date)
+    logs_by_id = sorted(logs, key=lambda item: item.id_int)
+    for i in range(1, len(logs_by_id)):
+        if logs_by_id[i].date_obj < logs_by_id[i - 1].date_obj:
+            raise build.date_order_error(logs_by_id[i - 1], logs_by_id[i])
+    path_owner = {}
+    for log in logs:
+        existing = path_owner.get(log.url)
+        if existing is not None:
+            raise build.path_collision_error(existing, log)
+        path_owner[log.url] = log
+    return logs
+
+
+def bench_ingest(sizes: list[int], repeat: int) -> None:
+    for size in sizes:
+        data = generate_archive(ArchiveSpec(logs=size))
+        core_date = datetime.fromisoformat(data["system"]["core_start_utc"].replace("Z", "+00:00")).date()
+        logs_raw = data["logs"]
+        legacy = legacy_ingest(logs_raw, core_date)
+        single = build.ingest_logs(logs_raw, core_date)
+        if [r.hash_fields() for r in legacy] != [r.hash_fields() for r in single]:
+            raise SystemExit(f"ingest mismatch at {size} logs")
+        del legacy, single
+
+        legacy_s = min(time_per_call(lambda: legacy_ingest(logs_raw, core_date), 1) for _ in range(repeat))
+        single_s = min(time_per_call(lambda: build.ingest_logs(logs_raw, core_date), 1) for _ in range(repeat))
+        print(f"{size} logs (best of {repeat})")
+        print(f"  validate + enrich + checks:   {legacy_s:8.3f} s  {legacy_s / size * 1e6:7.2f} us/log")
+        print(f"  ingest_logs (single pass):    {single_s:8.3f} s  {single_s / size * 1e6:7.2f} us/log")
+        print(f"  speedup:                      {legacy_s / single_s:8.2f}x")
+
+
+# =========================================================
+# SOURCE LAYOUT BENCHMARK
+# =========================================================
+def load_source_quietly(path: Path, hash_cache: build.FileHashCache | None = None) -> dict:
+    """Load path, through the snapshot cache when a hash_cache is given."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        if hash_cache is None:
+            source = build.stage_load_and_validate_source(path)
+        else:
+            source = build.stage_load_source_cached("bench", hash_cache, path)
+    source["text_store"].close()
+    return source
+
+
+def load_store_quietly(path: Path, hash_cache: build.FileHashCache, db_path: Path) -> dict:
+    """Load path through the sqlite log store and group its published logs."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        source = build.stage_load_source_sqlite("bench", hash_cache, path, db_path)
+        logs_sorted, _ = build.stage_prepare_logs(source["logs"])
+        build.stage_group_disruptions(logs_sorted, [])
+    source["text_store"].close()
+    return source
+
+
+def bench_source(sizes: list[int], repeat: int) -> None:
+    """
+    logs.json vs a logs/ shard directory with no index, a current index, and 1%
+    of shards touched; then a warm start from the parsed-source snapshot, and
+    the sqlite log store rebuilt and current (both including the disruption
+    grouping, which the store answers with queries).
+    """
+    previous_index, previous_snapshots = build.SOURCE_INDEX_PATH, build.SOURCE_SNAPSHOT_DIR
+    try:
+        for size in sizes:
+            with tempfile.TemporaryDirectory(prefix="ox500-bench-") as tmp:
+                root = Path(tmp)
+                source_path = root / "logs.json"
+                with open(source_path, "w", encoding="utf-8") as f:
+                    json.dump(generate_archive(ArchiveSpec(logs=size)), f, ensure_ascii=False, indent=2)
+                logs_dir = root / "logs"
+                build.split_logs_json(source_path, logs_dir, root / "site.json")
+                index_path = root / "source-index.json"
+                build.SOURCE_INDEX_PATH = index_path
+                build.SOURCE_SNAPSHOT_DIR = root / "snapshots"
+                hash_cache = build.FileHashCache(root / "hashes.json", "sha256")
+                shards = sorted(logs_dir.iterdir())
+                touched = shards[:: max(1, len(shards) // max(1, size // 100))]
+
+                def cold():
+                    index_path.unlink(missing_ok=True)
+                    load_source_quietly(logs_dir)
+
+                def touch_some():
+                    for path in touched:
+                        st = path.stat()
+                        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+                    load_source_quietly(logs_dir)
+
+                source = load_source_quietly(source_path, hash_cache)
+                if source["digest"] != load_source_quietly(logs_dir)["digest"]:
+                    raise SystemExit(f"source digest mismatch at {size} logs")
+                logs_sorted, _ = build.stage_prepare_logs(source["logs"])
+                build.save_source_snapshot(source, logs_sorted, build.stage_group_disruptions(logs_sorted), [])
+                del source, logs_sorted
+                db_path = root / "logs.sqlite"
+
+                def store_rebuild():
+                    db_path.unlink(missing_ok=True)
+                    load_store_quietly(source_path, hash_cache, db_path)
+
+                rows = [
+                    ("logs.json (streamed)", lambda: load_source_quietly(source_path)),
+                    ("logs/ without index", cold),
+                    ("logs/ with current index", lambda: load_source_quietly(logs_dir)),
+                    (f"logs/ with {len(touched)} touched", touch_some),
+                    ("logs.json snapshot hit", lambda: load_source_quietly(source_path, hash_cache)),
+                    ("sqlite store rebuilt", store_rebuild),
+                    ("sqlite store current", lambda: load_store_quietly(source_path, hash_cache, db_path)),
+                ]
+                print(f"{size} logs (best of {repeat})")
+                for label, fn in rows:
+                    seconds = min(time_per_call(fn, 1) for _ in range(repeat))
+                    print(f"  {label:30} {seconds:8.3f} s  {seconds / size * 1e6:7.2f} us/log")
+    finally:
+        build.SOURCE_INDEX_PATH, build.SOURCE_SNAPSHOT_DIR = previous_index, previous_snapshots
+
+
+def parse_sizes(value: str) -> list[int]:
+    sizes = [int(part) for part in value.split(",") if part.strip()]
+    if not sizes or any(size <= 0 for size in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive integers, e.g. 1000,10000")
+    return sizes
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks for build.py.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_render = sub.add_parser("render", help="compiled template vs render() + rewrite_css_links()")
+    p_render.add_argument("--iterations", type=int, default=2000)
+
+    p_pipeline = sub.add_parser("pipeline", help="time the Python build stages on synthetic archives")
+    p_pipeline.add_argument("--sizes", type=parse_sizes, default=[1000, 10000], help="comma-separated log counts")
+    p_pipeline.add_argument("--text-chars", type=int, default=ArchiveSpec.text_chars)
+    p_pipeline.add_argument("--logs-per-disruption", type=int, default=ArchiveSpec.logs_per_disruption)
+    p_pipeline.add_argument("--series-share", type=float, default=ArchiveSpec.series_share)
+    p_pipeline.add_argument("--ungrouped-share", type=float, default=ArchiveSpec.ungrouped_share)
+    p_pipeline.add_argument("--future-share", type=float, default=ArchiveSpec.future_share)
+    p_pipeline.add_argument("--seed", type=int, default=ArchiveSpec.seed)
+    p_pipeline.add_argument("--repeat", type=int, default=1, help="run each size N times and keep the best time per stage")
+    p_pipeline.add_argument("--skip-pages", action="store_true", help="skip the HTML page stages (large archives)")
+    p_pipeline.add_argument("--output", type=Path, help=f"results file (default: {BENCH_RESULTS_DIR.name}/pipeline-<utc>.json under .build-cache)")
+
+    p_ingest = sub.add_parser("ingest", help="single-pass ingest_logs vs the legacy multi-pass ingest")
+    p_ingest.add_argument("--sizes", type=parse_sizes, default=[100000, 300000], help="comma-separated log counts")
+    p_ingest.add_argument("--repeat", type=int, default=3)
+
+    p_source = sub.add_parser("source", help="load logs.json vs logs/ shards with and without the index")
+    p_source.add_argument("--sizes", type=parse_sizes, default=[10000, 100000], help="comma-separated log counts")
+    p_source.add_argument("--repeat", type=int, default=3)
+
+    p_compare = sub.add_parser("compare", help="compare two pipeline result files")
+    p_compare.add_argument("baseline", type=Path)
+    p_compare.add_argument("candidate", type=Path)
+
+    args = parser.parse_args(argv)
+    if args.command in ("pipeline", "ingest", "source") and args.repeat < 1:
+        parser.error("--repeat must be >= 1")
+    if args.command == "render":
+        bench_render(args.iterations)
+    elif args.command == "pipeline":
+        bench_pipeline(args)
+    elif args.command == "ingest":
+        bench_ingest(args.sizes, args.repeat)
+    elif args.command == "source":
+        bench_source(args.sizes, args.repeat)
+    elif args.command == "compare":
+        compare_results(args.baseline, args.candidate)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,32 @@
-﻿import json
+﻿import argparse
+import codecs
+import contextlib
+import cProfile
+import json
 import os
+import pickle
 import re
 import shutil
+import sqlite3
 import filecmp
+import functools
 import hashlib
+import importlib.metadata
+import io
 import unicodedata
+import multiprocessing
 import subprocess
 import sys
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import asdict, astuple, dataclass, replace
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import html
+import pstats
+import tracemalloc
 
 try:
     import minify_html as _minify_html
@@ -18,11 +34,46 @@ try:
 except ImportError:
     _MINIFY_HTML_AVAILABLE = False
 
+try:
+    import fcntl as _fcntl
+    _FICLONE = 0x40049409  # linux/fs.h: clone a file's extents (reflink)
+except ImportError:
+    _fcntl = None
+
+try:
+    import xxhash as _xxhash
+    _XXHASH_AVAILABLE = True
+except ImportError:
+    _XXHASH_AVAILABLE = False
+
 # =========================================================
 # CONFIG / CONSTANTS
 # =========================================================
 ROOT = Path(__file__).parent
-DIST = ROOT / "dist"
+DIST = ROOT / "dist"                        # where outputs go; a staging dir while a build runs
+DIST_LIVE = DIST                            # what the web server serves: a link into DIST_BUILDS_DIR
+DIST_BUILDS_DIR = ROOT / ".dist-builds"     # one directory per staged build
+DIST_BUILDS_KEPT = 2                        # the live build and the one it replaced
+BUILD_CACHE = ROOT / ".build-cache"
+BUILD_MANIFEST_PATH = BUILD_CACHE / "build-manifest.json"
+ASSET_HASH_CACHE_PATH = BUILD_CACHE / "asset-hashes.json"
+ESBUILD_CACHE_DIR = BUILD_CACHE / "esbuild"
+BUILD_REPORT_DIR = DIST / "_build"
+SOURCE_JSON_PATH = ROOT / "logs.json"
+SOURCE_SHARDS_DIR = ROOT / "logs"           # alternative layout: one file per log ...
+SOURCE_SITE_PATH = ROOT / "site.json"       # ... plus site and system objects here
+SOURCE_INDEX_PATH = BUILD_CACHE / "source-index.json"
+SOURCE_INDEX_VERSION = 1
+SOURCE_SNAPSHOT_DIR = BUILD_CACHE / "source-snapshots"
+LOG_STORE_PATH = BUILD_CACHE / "logs.sqlite"  # with --log-store sqlite; readable by other tools
+LOG_STORE_SCHEMA_VERSION = 1
+FRAGMENT_CACHE_DIR = BUILD_CACHE / "fragments"
+FRAGMENT_CACHE_MAX_BYTES = 512 << 20
+FRAGMENT_CACHE_PAGE_KINDS = frozenset({"minify-html"})  # whole pages: kept apart under their own cap
+FRAGMENT_CACHE_PAGE_MAX_BYTES = 64 << 20
+LOG_SHARD_SUFFIXES = (".json", ".md")
+ASSET_HASH_ALGOS = ("sha256", "blake2b", "xxh3")
+ASSET_HASH_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
 
 # =========================================================
@@ -38,11 +89,15 @@ JS_MINIFY       = True              # set False for easier debugging
 # Assets paths (generated)
 ASSETS_CSS_REL = Path("assets") / "css" / "style.css"
 ASSETS_CSS_DIST = DIST / ASSETS_CSS_REL
+ASSET_MANIFEST_REL = Path("manifest.json")
+FINGERPRINTED_ASSETS = (ASSETS_CSS_REL, JS_BUNDLE_REL)
 
 
 # Assets paths (static copy)
 ASSETS_SRC = ROOT / "assets"
 ASSETS_DIST = DIST / "assets"
+ASSETS_UNPUBLISHED = ("css", "js")  # sources of style.css and bundle.js; the site never serves them
+ASSET_PUBLISH_MANIFEST_PATH = BUILD_CACHE / "published-assets.json"
 
 BG_SRC = ASSETS_SRC / "bg"
 BG_DIST = ASSETS_DIST / "bg"
@@ -52,10 +107,32 @@ HOME_DISRUPTION_LIMIT = 3
 HOME_DISRUPTION_PREVIEW_LOGS = 6
 DISRUPTION_INDEX_PAGE_SIZE = 50
 LOG_INDEX_PAGE_SIZE = 50
+DISRUPTION_LOG_PAGE_SIZE = 50       # logs per data/disruption/<slug>-page-N.json
+DATA_PAGINATIONS = ("newest-first", "oldest-anchored")  # page order of data/*-page-N.json
+DELTA_FEED_CHECKPOINTS = 30         # newest logs that get a data/since/<id>.json
 CLEAN_DIST_ON_BUILD = True
 SHOW_PREV_NEXT_TITLES_IN_TEXT = False
+RENDER_CHUNK_SIZE = 64              # pages per process-pool task with --jobs > 1
+SITE_STATE_FILE = "site-state.json"  # below data/, hashed and listed in data/manifest.json like the pages
+DATA_MANIFEST_REL = Path("data") / "manifest.json"  # logical data file -> content-hashed name
+DATA_HASH_LENGTH = 10
+SITE_STATE_AVAILABLE_PLACEHOLDER = "----"
+SEO_DESCRIPTION_MAX_CHARS = 155
+SOURCE_READ_CHUNK = 1 << 20         # bytes per read while streaming logs.json
+JSON_CUT_TOKEN_CHARS = 6            # longest token a chunk end can cut short: a \uXXXX escape
+LOG_STORE_BLOCK_ROWS = 256          # rows per fetch from the sqlite log store
+LOG_STORE_CACHED_BLOCKS = 4
+OUTPUT_WRITER_THREADS = 4           # per stage, and per render worker process
+OUTPUT_WRITER_BATCH = 16            # files per hand-over to a writer thread
+OUTPUT_WRITER_QUEUE = 64            # files handed over but not yet written
 
 TOKEN_RE = re.compile(r"\{\{([A-Z0-9_]+)\}\}")
+JSON_WS_RE = re.compile(r"[ \t\n\r]*")
+SLUG_QUOTES_RE = re.compile(r"['']")
+SLUG_SEPARATORS_RE = re.compile(r"[^a-z0-9]+")
+SLUG_DASHES_RE = re.compile(r"-{2,}")
+LOG_TITLE_PREFIX_RE = re.compile(r"^LOG\s*\d+\s*//\s*", re.IGNORECASE)
+DISRUPTION_TITLE_PREFIX_RE = re.compile(r"^DISRUPTION(?:_SERIES)?\s*//\s*", re.IGNORECASE)
 
 
 @dataclass(frozen=True)
@@ -71,8 +148,30 @@ class SiteContext:
     site_title: str
     available_count: str
     asset_version: str
+    asset_css_url: str
+    asset_js_url: str
     site_mode: str
     robots_meta: str
+    data_manifest_url: str  # set on <body> with --hash-data, so the client knows to fetch it
+
+
+@dataclass(frozen=True)
+class BuildOptions:
+    incremental: bool = False
+    jobs: int = 1
+    shared_fragments: bool = False
+    fingerprint_assets: bool = False
+    asset_hash: str = "sha256"
+    stage_workers: int = 4
+    trace_memory: bool = False
+    profile: bool = False
+    split_source: str | None = None
+    log_store: str = "memory"
+    fragment_cache: bool = True
+    link_assets: bool = True
+    staging: bool = True
+    pagination: str = "newest-first"
+    hash_data: bool = False
 
 # =========================================================
 # FALLBACK TEMPLATES
@@ -102,7 +201,7 @@ FALLBACK_DISRUPTION_TEMPLATE = """<!DOCTYPE html>
   <meta name="twitter:description" content="{{OG_DESC}}" />
   <meta name="twitter:image" content="{{OG_IMAGE}}" />
 
-  <link rel="stylesheet" href="/assets/css/style.css?v={{ASSET_VERSION}}" />
+  <link rel="stylesheet" href="{{ASSET_CSS_URL}}" />
 
   <script type="application/ld+json">
   {{JSONLD}}
@@ -183,12 +282,14 @@ FALLBACK_DISRUPTION_TEMPLATE = """<!DOCTYPE html>
 # GENERIC HELPERS
 # =========================================================
 def slugify(s: str) -> str:
-    s = unicodedata.normalize("NFKD", (s or ""))
-    s = s.encode("ascii", "ignore").decode("ascii")
+    s = s or ""
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s)
+        s = s.encode("ascii", "ignore").decode("ascii")
     s = s.lower().strip()
-    s = re.sub(r"['']", "", s)
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    s = SLUG_QUOTES_RE.sub("", s)
+    s = SLUG_SEPARATORS_RE.sub("-", s)
+    s = SLUG_DASHES_RE.sub("-", s).strip("-")
     return s or "node"
 
 
@@ -227,6 +328,7 @@ def first_line(text: str, max_chars: int = 150) -> str:
     return line[:max_chars].rstrip()
 
 
+@functools.lru_cache(maxsize=4096)
 def cleanup_disruption_text(raw_text: str) -> str:
     text = str(raw_text or "").strip()
     text = re.sub(r"^DISRUPTION(?:_SERIES)?\s*//\s*", "", text, flags=re.IGNORECASE)
@@ -240,14 +342,15 @@ def derive_mobile_disruption_title(log: dict) -> str:
     if clean:
         return clean
     raw_series = str(log.get("series") or log.get("disruption") or "").strip()
-    raw_title = re.sub(r"^LOG\s*\d+\s*//\s*", "", str(log.get("title", "")).strip(), flags=re.IGNORECASE)
-    title = cleanup_disruption_text(raw_series) or raw_title
+    title = cleanup_disruption_text(raw_series)
+    if not title:
+        title = LOG_TITLE_PREFIX_RE.sub("", str(log.get("title", "")).strip())
     return title or "UNTITLED"
 
 
 def derive_mobile_log_entry_title(log: dict) -> str:
-    title = re.sub(r"^LOG\s*\d+\s*//\s*", "", str(log.get("title", "")).strip(), flags=re.IGNORECASE)
-    title = re.sub(r"^DISRUPTION(?:_SERIES)?\s*//\s*", "", title, flags=re.IGNORECASE)
+    title = LOG_TITLE_PREFIX_RE.sub("", str(log.get("title", "")).strip())
+    title = DISRUPTION_TITLE_PREFIX_RE.sub("", title)
     return title.strip() or "UNTITLED"
 
 
@@ -256,18 +359,44 @@ def read_text(path: Path) -> str:
         return f.read()
 
 
-def write_text(path: Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+def write_text(path: Path, content: str, context: str | None = None) -> None:
+    """
+    Write an output file (HTML is minified first). Inside a build stage the
+    stage's OutputWriter does the work on its threads; context names the page
+    in the error if that fails.
+    """
+    writer = current_output_writer()
+    if writer is not None:
+        writer.submit(path, content, context)
+    else:
+        write_output_file(path, content)
+
+
+def write_output_file(path: Path, content: str, made_dirs: set | None = None) -> None:
+    """write_text's work; made_dirs holds the directories already known to exist."""
+    parent = path.parent
+    if made_dirs is None or parent not in made_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        if made_dirs is not None:
+            made_dirs.add(parent)
 
+    minify_in = minify_out = 0
     if _MINIFY_HTML_AVAILABLE and path.suffix == ".html":
         try:
-            content = _minify_html.minify(
-                content,
-                minify_js=False,
-                minify_css=False,
-                keep_closing_tags=True,
-                keep_html_and_head_opening_tags=True,
+            source = content
+            minified = cached_fragment(
+                "minify-html",
+                source,
+                lambda: _minify_html.minify(
+                    source,
+                    minify_js=False,
+                    minify_css=False,
+                    keep_closing_tags=True,
+                    keep_html_and_head_opening_tags=True,
+                ),
             )
+            minify_in, minify_out = utf8_size(content), utf8_size(minified)
+            content = minified
         except Exception:
             pass
 
@@ -279,8 +408,12 @@ def write_text(path: Path, content: str) -> None:
         except (OSError, UnicodeDecodeError):
             pass
 
+    # outputs carried over from the live build are hardlinks; never write through one
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
     with open(path, "w", encoding="utf-8") as f:
         f.write(content)
+    record_write(minify_out or utf8_size(content), minify_in, minify_out)
 
 
 def load_home_inline_css() -> str:
@@ -293,10 +426,15 @@ def load_home_inline_css() -> str:
     return css.replace("</style", "<\\/style")
 
 
+def copy_file_recorded(src: Path, dst: Path) -> None:
+    shutil.copy2(src, dst)
+    record_write(os.path.getsize(dst))
+
+
 def copy_file_if_changed(src: Path, dst: Path) -> None:
     dst.parent.mkdir(parents=True, exist_ok=True)
     if CLEAN_DIST_ON_BUILD:
-        shutil.copy2(src, dst)
+        copy_file_recorded(src, dst)
         return
     if dst.exists():
         try:
@@ -304,15 +442,41 @@ def copy_file_if_changed(src: Path, dst: Path) -> None:
                 return
         except (OSError, UnicodeDecodeError):
             pass
-    shutil.copy2(src, dst)
+    copy_file_recorded(src, dst)
 
 
-def copy_tree_if_changed(src_root: Path, dst_root: Path) -> None:
-    for p in src_root.rglob("*"):
-        if not p.is_file():
-            continue
-        rel = p.relative_to(src_root)
-        copy_file_if_changed(p, dst_root / rel)
+def publish_file(src: Path, dst: Path, methods: list[str]) -> str:
+    """
+    Put src at dst by the first of methods that works: "reflink" (a
+    copy-on-write clone), "hardlink" or "copy". A method that fails is dropped
+    from methods, so the rest of the build does not retry it. dst is removed
+    first: writing into an existing hardlink would change its source.
+    Returns the method used.
+    """
+    dst.unlink(missing_ok=True)
+    for method in list(methods):
+        try:
+            if method == "reflink":
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    _fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                shutil.copystat(src, dst)
+            elif method == "hardlink":
+                os.link(src, dst)
+            else:
+                shutil.copy2(src, dst)
+            return method
+        except OSError:
+            dst.unlink(missing_ok=True)
+            if method == "copy":
+                raise
+            methods.remove(method)
+    raise RuntimeError(f"no way to publish {src} left in {methods}")
+
+
+def remove_empty_dirs(path: Path, stop: Path, keep: tuple = ()) -> None:
+    while path != stop and path not in keep and path.is_dir() and not any(path.iterdir()):
+        path.rmdir()
+        path = path.parent
 
 
 def esc(value) -> str:
@@ -348,9 +512,12 @@ def utc_today_iso() -> str:
     return utc_today().isoformat()
 
 
-def make_log_rel_path(log: dict) -> Path:
-    y, m = ym_from_date(log.get("date", ""))
-    return Path("logs") / y / m / f'log-{log["id"]}-{log["slug"]}.html'
+def make_log_url(log_id: str, log_date, slug: str) -> str:
+    return f"/logs/{log_date.year:04d}/{log_date.month:02d}/log-{log_id}-{slug}.html"
+
+
+def make_log_rel_path(log_id: str, log_date, slug: str) -> Path:
+    return Path(make_log_url(log_id, log_date, slug)[1:])
 
 
 def make_url_path(rel_path: Path) -> str:
@@ -421,11 +588,143 @@ def rewrite_css_links(html_str: str, base_url: str) -> str:
     return html_str
 
 
-def compute_asset_version() -> str:
-    """Deterministic hash for cache-busting based on source assets + templates."""
-    hasher = hashlib.sha256()
+class CompiledTemplate:
+    """
+    Template split once into literal and slot segments.
+    Rendering is a single join. The first render checks the template's slots
+    against the mapping's keys once (every page of a template gets the same
+    keys) and raises a ValueError listing the tokens the mapping lacks.
+    """
+
+    __slots__ = ("name", "source", "slots", "_parts", "_slot_positions", "_checked")
+
+    def __init__(self, source: str, name: str, base_url: str = ""):
+        self.name = name
+        # Legacy stylesheet hrefs live in the template markup, never in page values,
+        # so the rewrite is applied to the source once instead of to every page.
+        self.source = rewrite_css_links(source, base_url)
+        parts = []
+        slot_positions = []
+        pos = 0
+        for match in TOKEN_RE.finditer(self.source):
+            parts.append(self.source[pos:match.start()])
+            slot_positions.append((len(parts), match.group(1)))
+            parts.append("")
+            pos = match.end()
+        parts.append(self.source[pos:])
+        self._parts = parts
+        self._slot_positions = tuple(slot_positions)
+        self.slots = frozenset(key for _, key in slot_positions)
+        self._checked = False
+
+    def check_tokens(self, keys, context: str | None = None) -> None:
+        unresolved = sorted(self.slots - set(keys))
+        if unresolved:
+            message = f"Unresolved template tokens in '{self.name}': {unresolved}"
+            if context:
+                message = f"{message} | context: {context}"
+            raise ValueError(message)
+
+    def render(self, mapping: dict, context: str | None = None) -> str:
+        if not self._checked:
+            self.check_tokens(mapping.keys(), context)
+            self._checked = True
+        parts = self._parts.copy()
+        for index, key in self._slot_positions:
+            value = mapping[key]
+            parts[index] = "" if value is None else str(value)
+        return "".join(parts)
+
+
+# =========================================================
+# ASSET HASHING
+# =========================================================
+def new_hasher(algo: str):
+    if algo == "xxh3":
+        if not _XXHASH_AVAILABLE:
+            raise ValueError("asset hash 'xxh3' requires the xxhash package")
+        return _xxhash.xxh3_128()
+    return hashlib.new(algo)
+
+
+def file_digest(path: Path, algo: str = "sha256") -> str:
+    hasher = new_hasher(algo)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class FileHashCache:
+    """
+    Content digests keyed by (path, size, mtime_ns), persisted between builds.
+    Unchanged files are never re-read; misses are hashed on a thread pool.
+    Safe to share between concurrently running stages.
+    """
+
+    def __init__(self, path: Path, algo: str, entries: dict | None = None):
+        self.path = path
+        self.algo = algo
+        self.entries = entries or {}
+        self.hits = 0
+        self.misses = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path, algo: str) -> "FileHashCache":
+        try:
+            data = json.loads(read_text(path))
+        except (OSError, ValueError):
+            return cls(path, algo)
+        if not isinstance(data, dict) or data.get("algo") != algo or not isinstance(data.get("entries"), dict):
+            return cls(path, algo)
+        return cls(path, algo, data["entries"])
+
+    def digests(self, paths: list[Path]) -> dict[Path, str]:
+        # the lock covers the cache lookups and updates only, so stages hash their misses concurrently
+        started = time.perf_counter()
+        result = {}
+        pending = []
+        stats = [(path, path.stat()) for path in paths]
+        with self._lock:
+            for path, st in stats:
+                cached = self.entries.get(path.as_posix())
+                if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                    result[path] = cached[2]
+                else:
+                    pending.append((path, st))
+            self.hits += len(result)
+
+        hashed = []
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(ASSET_HASH_WORKERS, len(pending))) as pool:
+                hashed = list(pool.map(lambda item: file_digest(item[0], self.algo), pending))
+
+        with self._lock:
+            for (path, st), digest in zip(pending, hashed):
+                self.entries[path.as_posix()] = [st.st_size, st.st_mtime_ns, digest]
+                result[path] = digest
+            self.misses += len(pending)
+            self.seconds += time.perf_counter() - started
+        return result
+
+    def save(self) -> None:
+        live = {key: value for key, value in self.entries.items() if Path(key).exists()}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"algo": self.algo, "entries": dict(sorted(live.items()))}, f, indent=0)
+
+
+def compute_asset_version(source_digest: str = "", hash_cache: FileHashCache | None = None) -> str:
+    """
+    Deterministic hash for cache-busting based on source assets + templates.
+    The archive enters as its source_digest (compute_source_digest), which is the
+    same for logs.json and logs/ shards; without one, publishing a log does not
+    change the version embedded in every page.
+    """
+    hash_cache = hash_cache or FileHashCache(ASSET_HASH_CACHE_PATH, "sha256")
     paths = [
-        ROOT / "logs.json",
         ROOT / "template-index.html",
         ROOT / "template-log.html",
         ROOT / "template-series.html",
@@ -433,11 +732,16 @@ def compute_asset_version() -> str:
     ]
     if ASSETS_SRC.exists():
         paths.extend(p for p in ASSETS_SRC.rglob("*") if p.is_file())
-    for path in sorted({p for p in paths if p.exists()}, key=lambda x: x.as_posix()):
-        hasher.update(path.as_posix().encode("utf-8"))
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
+    paths = sorted({p for p in paths if p.exists()}, key=lambda x: x.as_posix())
+
+    digests = hash_cache.digests(paths)
+    hasher = hashlib.sha256()
+    for path in paths:
+        hasher.update(path.relative_to(ROOT).as_posix().encode("utf-8"))
+        hasher.update(digests[path].encode("ascii"))
+    if source_digest:
+        hasher.update(b"source")
+        hasher.update(source_digest.encode("ascii"))
     return hasher.hexdigest()[:12]
 
 
@@ -449,24 +753,845 @@ def derive_sensor_code(asset_version: str) -> str:
     return f"0x{head}-{tail:02d}"
 
 
+def fingerprinted_rel_path(rel_path: Path, digest: str) -> Path:
+    return rel_path.with_name(f"{rel_path.stem}.{digest}{rel_path.suffix}")
+
+
+def resolve_asset_url(asset_manifest: dict, rel_path: Path, asset_version: str) -> str:
+    """Public URL of a generated asset: fingerprinted name when listed in the manifest, ?v= otherwise."""
+    hashed = asset_manifest.get(rel_path.as_posix())
+    if hashed:
+        return f"/{hashed}"
+    return f"/{rel_path.as_posix()}?v={asset_version}"
+
+
+# =========================================================
+# BUILD MANIFEST (INCREMENTAL)
+# =========================================================
+def compute_code_version() -> str:
+    """Hash of build.py itself; any code change invalidates cached outputs."""
+    with open(Path(__file__), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+def _hash_default(value):
+    if isinstance(value, LogRecord):
+        return value.hash_fields()
+    return str(value)
+
+
+def hash_inputs(*parts) -> str:
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=_hash_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class BuildManifest:
+    """
+    Maps every tracked output (path relative to DIST) to the hash of its inputs.
+    An output is re-rendered only when its hash changed or the file is missing;
+    outputs tracked by the previous build but not by this one are pruned.
+    With reuse_root (the live output while building into a staging dir), an
+    unchanged output is hardlinked from there instead of being rendered.
+    """
+
+    def __init__(self, code_version: str, previous: dict | None = None, reuse_root: Path | None = None):
+        self.code_version = code_version
+        self.previous = previous or {}
+        self.reuse_root = reuse_root
+        self.current = {}
+        self.rendered = 0
+        self.unchanged = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path, code_version: str, reuse_root: Path | None = None) -> "BuildManifest":
+        try:
+            data = json.loads(read_text(path))
+        except (OSError, ValueError):
+            return cls(code_version, reuse_root=reuse_root)
+        if not isinstance(data, dict) or data.get("code_version") != code_version:
+            return cls(code_version, reuse_root=reuse_root)
+        outputs = data.get("outputs")
+        return cls(code_version, outputs if isinstance(outputs, dict) else {}, reuse_root)
+
+    def is_current(self, rel_path: Path, input_hash: str) -> bool:
+        key = rel_path.as_posix()
+        current = self.previous.get(key) == input_hash and self._carry_over(rel_path)
+        with self._lock:
+            self.current[key] = input_hash
+            if current:
+                self.unchanged += 1
+            else:
+                self.rendered += 1
+        return current
+
+    def _carry_over(self, rel_path: Path) -> bool:
+        """Whether the previous build's output is in DIST, linking it there from reuse_root if needed."""
+        path = DIST / rel_path
+        if self.reuse_root is None:
+            return path.is_file()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.link(self.reuse_root / rel_path, path)
+        except FileExistsError:
+            return path.is_file()
+        except OSError:
+            return False
+        return True
+
+    def prune(self) -> list[str]:
+        """Remove outputs no longer tracked; in a staging dir they were never carried over."""
+        removed = []
+        for key in sorted(set(self.previous) - set(self.current)):
+            path = DIST / key
+            removed.append(key)
+            if path.is_file():
+                path.unlink()
+            parent = path.parent
+            while parent != DIST and parent.is_dir() and not any(parent.iterdir()):
+                parent.rmdir()
+                parent = parent.parent
+        return removed
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"code_version": self.code_version, "outputs": dict(sorted(self.current.items()))}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=0)
+
+
+# =========================================================
+# OUTPUT STAGING
+# =========================================================
+def set_output_root(path: Path) -> None:
+    """Point DIST and the output paths derived from it at path: a staging dir, or DIST_LIVE."""
+    global DIST, BUILD_REPORT_DIR, JS_BUNDLE_DIST, ASSETS_CSS_DIST, ASSETS_DIST, BG_DIST
+    DIST = path
+    BUILD_REPORT_DIR = DIST / "_build"
+    JS_BUNDLE_DIST = DIST / JS_BUNDLE_REL
+    ASSETS_CSS_DIST = DIST / ASSETS_CSS_REL
+    ASSETS_DIST = DIST / "assets"
+    BG_DIST = ASSETS_DIST / "bg"
+
+
+def new_output_build() -> Path:
+    """A fresh staging directory in DIST_BUILDS_DIR, named so that newer builds sort last."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    path = DIST_BUILDS_DIR / f"{stamp}-{os.getpid()}"
+    path.mkdir(parents=True)
+    return path
+
+
+def swap_output_build(build_dir: Path) -> str:
+    """
+    Make build_dir the live output. DIST_LIVE becomes a relative symlink to
+    it, replaced by a single rename, so the server sees either the old build
+    or the new one and never a partial dist/. A real dist/ directory left by
+    an in-place build is first moved into DIST_BUILDS_DIR; that step alone is
+    not atomic and happens once. Where symlinks are unsupported, build_dir
+    itself is renamed to DIST_LIVE instead, after removing a link left there
+    by an earlier build. Returns "symlink" or "rename".
+    """
+    if DIST_LIVE.is_dir() and not DIST_LIVE.is_symlink():
+        DIST_LIVE.rename(build_dir.with_name(f"{build_dir.name}-replaced"))
+    link = DIST_LIVE.with_name(f".{DIST_LIVE.name}.{os.getpid()}.tmp")
+    try:
+        link.unlink(missing_ok=True)
+        link.symlink_to(os.path.relpath(build_dir, link.parent), target_is_directory=True)
+    except (OSError, NotImplementedError):
+        # a directory cannot be renamed over a link, even one to a directory
+        if DIST_LIVE.is_symlink():
+            DIST_LIVE.unlink()
+        build_dir.rename(DIST_LIVE)
+        return "rename"
+    os.replace(link, DIST_LIVE)
+    return "symlink"
+
+
+def unlink_output_build() -> None:
+    """
+    Make DIST_LIVE a real directory again for an in-place build: a link left
+    by a staged build is replaced by the build it points at, moved out of
+    DIST_BUILDS_DIR, so that cleaning dist/ never reaches into the staged builds.
+    """
+    if not DIST_LIVE.is_symlink():
+        return
+    target = DIST_LIVE.resolve()
+    DIST_LIVE.unlink()
+    if target.is_dir():
+        target.rename(DIST_LIVE)
+
+
+def prune_output_builds(keep: int = DIST_BUILDS_KEPT) -> int:
+    """Remove all but the newest keep builds, counting the live one; returns how many were removed."""
+    live = DIST_LIVE.resolve()
+    others = sorted((path for path in DIST_BUILDS_DIR.iterdir() if path.resolve() != live), reverse=True)
+    stale = others[max(keep - 1, 0):]
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+    return len(stale)
+
+
+# =========================================================
+# FRAGMENT CACHE
+# =========================================================
+def fragment_cache_salt(code_version: str) -> str:
+    """Everything besides their inputs that fragments depend on: build.py and the minifier."""
+    minifier = "none"
+    if _MINIFY_HTML_AVAILABLE:
+        try:
+            minifier = importlib.metadata.version("minify_html")
+        except importlib.metadata.PackageNotFoundError:
+            minifier = "unknown"
+    return f"{code_version}:{minifier}"
+
+
+class FragmentCache:
+    """
+    Deterministic page fragments (formatted log text, JSON-LD, minified HTML)
+    kept between builds, one file per fragment under root named by the hash of
+    the salt, the fragment kind and its inputs. A hit refreshes the file's
+    mtime, so prune() can evict the least recently used fragments once the
+    cache outgrows max_bytes. Whole-page kinds (FRAGMENT_CACHE_PAGE_KINDS) live
+    under root/pages with their own, smaller page_max_bytes, so that minified
+    pages cannot crowd out the small fragments or keep a copy of a large site.
+    Files are replaced atomically, so threads and render worker processes share
+    one cache; hits and misses are counted on the running stage's StageCounters.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        salt: str,
+        max_bytes: int = FRAGMENT_CACHE_MAX_BYTES,
+        page_max_bytes: int = FRAGMENT_CACHE_PAGE_MAX_BYTES,
+    ):
+        self.root = root
+        self.pages_root = root / "pages"
+        self.salt = salt
+        self.max_bytes = max_bytes
+        self.page_max_bytes = page_max_bytes
+
+    def path_for(self, kind: str, parts) -> str:
+        # plain strings on the per-fragment path: pathlib and json.dumps would cost more than a hit
+        hasher = hashlib.blake2b(f"{self.salt}\0{kind}\0".encode("utf-8"), digest_size=16)
+        if isinstance(parts, str):
+            hasher.update(b"s")
+            hasher.update(parts.encode("utf-8"))
+        else:
+            hasher.update(b"j")
+            hasher.update(json.dumps(parts, ensure_ascii=False, default=str).encode("utf-8"))
+        key = hasher.hexdigest()
+        root = self.pages_root if kind in FRAGMENT_CACHE_PAGE_KINDS else self.root
+        return f"{root}{os.sep}{key[:2]}{os.sep}{key}.txt"
+
+    def fetch(self, kind: str, parts, compute: Callable[[], str]) -> str:
+        """The fragment for (kind, parts), computing and storing it on a miss."""
+        path = self.path_for(kind, parts)
+        counters = current_stage_counters()
+        try:
+            with open(path, "rb") as f:
+                content = f.read().decode("utf-8")
+            os.utime(path)
+        except (OSError, UnicodeDecodeError):
+            pass
+        else:
+            if counters is not None:
+                counters.fragment_hits += 1
+            return content
+
+        content = compute()
+        data = content.encode("utf-8")
+        tmp_path = f"{path[:-4]}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            # a cache that cannot be written only makes the build slower
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+        if counters is not None:
+            counters.fragment_misses += 1
+            if kind in FRAGMENT_CACHE_PAGE_KINDS:
+                counters.fragment_page_bytes_added += len(data)
+            else:
+                counters.fragment_bytes_added += len(data)
+        return content
+
+    def prune(self, added_bytes: int, added_page_bytes: int = 0) -> tuple[int, int, int]:
+        """
+        Evict least recently used fragments and pages, each down to 90% of
+        its cap once it is exceeded. Returns (entries removed, fragment bytes
+        kept, page bytes kept).
+        """
+        removed, kept = self._prune_dir(self.root, self.max_bytes, added_bytes)
+        page_removed, page_kept = self._prune_dir(self.pages_root, self.page_max_bytes, added_page_bytes)
+        return removed + page_removed, kept, page_kept
+
+    @staticmethod
+    def _prune_dir(root: Path, max_bytes: int, added_bytes: int) -> tuple[int, int]:
+        """
+        prune() for the shard directories under root. The size is tracked in
+        root/usage.json so that they are only scanned when the cap may have
+        been reached. Returns (files removed, bytes kept).
+        """
+        usage_path = root / "usage.json"
+        try:
+            total = int(json.loads(read_text(usage_path))["bytes"]) + added_bytes
+        except (OSError, ValueError, KeyError, TypeError):
+            total = None
+        removed = 0
+        if total is None or total > max_bytes:
+            entries = []
+            if root.is_dir():
+                for shard in os.scandir(root):
+                    # two-character shard names; skips the pages/ tier under the fragment root
+                    if len(shard.name) != 2 or not shard.is_dir():
+                        continue
+                    for entry in os.scandir(shard.path):
+                        st = entry.stat()
+                        entries.append((st.st_mtime_ns, st.st_size, entry.path))
+            total = sum(size for _, size, _ in entries)
+            if total > max_bytes:
+                entries.sort()
+                for _, size, entry_path in entries:
+                    if total <= max_bytes * 0.9:
+                        break
+                    try:
+                        os.unlink(entry_path)
+                    except FileNotFoundError:
+                        pass
+                    total -= size
+                    removed += 1
+        root.mkdir(parents=True, exist_ok=True)
+        with open(usage_path, "w", encoding="utf-8") as f:
+            json.dump({"bytes": total}, f)
+        return removed, total
+
+
+_FRAGMENT_CACHE: FragmentCache | None = None
+
+
+def use_fragment_cache(cache: FragmentCache | None) -> None:
+    global _FRAGMENT_CACHE
+    _FRAGMENT_CACHE = cache
+
+
+def cached_fragment(kind: str, parts, compute: Callable[[], str]) -> str:
+    """compute() through the active FragmentCache, if any; parts must identify its result."""
+    if _FRAGMENT_CACHE is None:
+        return compute()
+    return _FRAGMENT_CACHE.fetch(kind, parts, compute)
+
+
+# =========================================================
+# SOURCE READER
+# =========================================================
+class _JsonStream:
+    """
+    Incremental JSON reader over a binary file. Decodes one value at a time with
+    raw_decode and keeps only the unread tail of the current chunk, tracking the
+    byte offset of every value so it can be read back later.
+    """
+
+    def __init__(self, f, name: str):
+        self.f = f
+        self.name = name
+        self.utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.byte_pos = 0  # file offset of buf[pos]
+        self.eof = False
+
+    def error(self, msg: str) -> ValueError:
+        return ValueError(f"Invalid {self.name}: {msg} (byte {self.byte_pos})")
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(SOURCE_READ_CHUNK)
+        self.eof = not chunk
+        try:
+            text = self.utf8.decode(chunk, final=self.eof)
+        except UnicodeDecodeError as exc:
+            raise self.error(f"not valid UTF-8 ({exc.reason})") from exc
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or '' at end of file."""
+        while True:
+            end = JSON_WS_RE.match(self.buf, self.pos).end()
+            self.byte_pos += end - self.pos  # JSON whitespace is ASCII
+            self.pos = end
+            if end < len(self.buf):
+                return self.buf[end]
+            if not self._fill():
+                return ""
+
+    def take(self, expected: str) -> str:
+        """Consume the next character, which must be one of `expected`."""
+        ch = self.peek()
+        if not ch or ch not in expected:
+            wanted = " or ".join(f"'{c}'" for c in expected)
+            raise self.error(f"expected {wanted}, got {ch!r}" if ch else f"expected {wanted}, got end of file")
+        self.pos += 1
+        self.byte_pos += 1
+        return ch
+
+    def _cut_short(self, exc: json.JSONDecodeError) -> bool:
+        """
+        Whether a decode error may only mean the value continues in the next
+        chunk: it failed at the end of the buffer, or in a string still open
+        there. Anything before that is malformed whatever follows, so it is
+        reported without reading on.
+        """
+        return exc.pos >= len(self.buf) - JSON_CUT_TOKEN_CHARS or exc.msg.startswith("Unterminated string")
+
+    def value(self) -> tuple:
+        """Decode the next value; returns (value, byte_offset, byte_length)."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as exc:
+                if self._cut_short(exc) and self._fill():
+                    continue
+                raise self.error(exc.msg) from exc
+            # a number at the end of the buffer may continue in the next chunk ("1." + "5")
+            if len(self.buf) - end < JSON_CUT_TOKEN_CHARS and self._fill():
+                continue
+            length = len(self.buf[self.pos:end].encode("utf-8"))
+            offset = self.byte_pos
+            self.pos = end
+            self.byte_pos += length
+            return value, offset, length
+
+
+class LogStream:
+    """The 'logs' array of logs.json as an iterator of (raw_log, span) pairs."""
+
+    def __init__(self, stream: _JsonStream):
+        self._items = self._read(stream)
+
+    def __iter__(self):
+        return self._items
+
+    @staticmethod
+    def _read(stream: _JsonStream):
+        stream.take("[")
+        if stream.peek() == "]":
+            stream.take("]")
+            return
+        while True:
+            raw, offset, length = stream.value()
+            yield raw, (offset, length)
+            if stream.take(",]") == "]":
+                return
+
+
+def iter_logs_json(path: Path):
+    """
+    Stream the top-level members of logs.json as (key, value) pairs. An array
+    under 'logs' is yielded as a LogStream, so records are decoded one at a time
+    instead of holding the whole file and its object tree in memory; whatever
+    the caller does not consume is skipped before the next member is read.
+    """
+    with open(path, "rb") as f:
+        stream = _JsonStream(f, path.name)
+        if stream.peek() != "{":
+            raise ValueError(f"Invalid {path.name}: root object must be a JSON object")
+        stream.take("{")
+        if stream.peek() == "}":
+            stream.take("}")
+        else:
+            while True:
+                key, _, _ = stream.value()
+                if not isinstance(key, str):
+                    raise stream.error("object keys must be strings")
+                stream.take(":")
+                if key == "logs" and stream.peek() == "[":
+                    logs = LogStream(stream)
+                    yield key, logs
+                    for _ in logs:
+                        pass
+                else:
+                    yield key, stream.value()[0]
+                if stream.take(",}") == "}":
+                    break
+        if stream.peek():
+            raise stream.error("unexpected data after the root object")
+
+
+class SourceTextStore:
+    """
+    Reads log text bodies back out of logs.json by the byte span of their
+    record, so LogRecords do not keep the text in memory. Thread-safe; pickles
+    as just the path, so each render worker opens its own handle.
+    """
+
+    def __init__(self, path: Path, stat: os.stat_result | None = None):
+        self.path = path
+        self._signature = (stat.st_size, stat.st_mtime_ns) if stat is not None else None
+        self._lock = threading.Lock()
+        self._file = None
+
+    def __getstate__(self) -> dict:
+        return {"path": self.path, "signature": self._signature}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["path"])
+        self._signature = state["signature"]
+
+    def label(self, idx: int, span: tuple[int, int]) -> str:
+        return f"logs[{idx}]"
+
+    def summarize(self, raw: dict, span: tuple[int, int]) -> tuple[str, str]:
+        return summarize_log_text(str(raw.get("text", "")))
+
+    def load(self, span: tuple[int, int]) -> str:
+        offset, length = span
+        with self._lock:
+            if self._file is None:
+                f = open(self.path, "rb")
+                stat = os.fstat(f.fileno())
+                if self._signature is not None and self._signature != (stat.st_size, stat.st_mtime_ns):
+                    f.close()
+                    raise RuntimeError(f"{self.path.name} changed during the build; run it again")
+                self._file = f
+            self._file.seek(offset)
+            data = self._file.read(length)
+        return str(json.loads(data).get("text", ""))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def summarize_log_text(text: str) -> tuple[str, str]:
+    """(digest, head) kept on a LogRecord in place of its text; see LogRecord."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    # first_line() of "<prefix>{text}" only ever sees this much of the text
+    head = text[:SEO_DESCRIPTION_MAX_CHARS + 1].splitlines()
+    return digest, head[0][:SEO_DESCRIPTION_MAX_CHARS] if head else ""
+
+
+def parse_markdown_shard(content: str, name: str) -> dict:
+    """
+    A Markdown log shard: a front matter block of `key: value` lines between
+    `---` lines, then the text body. A value that parses as JSON is taken as
+    JSON (quoted strings, objects such as ui_state), anything else verbatim.
+    One trailing newline of the body is dropped.
+    """
+    lines = content.split("\n")
+    if not lines or lines[0].rstrip("\r") != "---":
+        raise ValueError(f"Invalid {name}: Markdown log must start with a '---' front matter line")
+    raw = {}
+    for n, line in enumerate(lines[1:], start=1):
+        line = line.rstrip("\r")
+        if line == "---":
+            body = "\n".join(lines[n + 1:])
+            raw["text"] = body[:-1] if body.endswith("\n") else body
+            return raw
+        if not line.strip():
+            continue
+        key, sep, value = line.partition(":")
+        if not sep or not key.strip():
+            raise ValueError(f"Invalid {name}: line {n + 1}: expected 'key: value' in front matter")
+        value = value.strip()
+        try:
+            raw[key.strip()] = json.loads(value)
+        except ValueError:
+            raw[key.strip()] = value
+    raise ValueError(f"Invalid {name}: front matter is not closed with a '---' line")
+
+
+def format_markdown_shard(raw: dict) -> str:
+    """Inverse of parse_markdown_shard."""
+    lines = ["---"]
+    for key, value in raw.items():
+        if key == "text":
+            continue
+        if isinstance(value, str) and value and value == value.strip() and "\n" not in value and "\r" not in value:
+            try:
+                json.loads(value)
+            except ValueError:
+                lines.append(f"{key}: {value}")
+                continue
+        lines.append(f"{key}: {json.dumps(value, ensure_ascii=False)}")
+    lines.append("---")
+    return "\n".join(lines) + "\n" + str(raw.get("text", "")) + "\n"
+
+
+def read_log_shard(path: Path) -> dict:
+    name = f"{path.parent.name}/{path.name}"
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        content = f.read()  # keep \r\n inside Markdown bodies as written
+    if path.suffix == ".md":
+        return parse_markdown_shard(content, name)
+    try:
+        raw = json.loads(content)
+    except ValueError as exc:
+        raise ValueError(f"Invalid {name}: {exc}") from exc
+    if not isinstance(raw, dict):
+        raise ValueError(f"Invalid {name}: a log shard must be a JSON object")
+    return raw
+
+
+class ShardTextStore:
+    """
+    Reads log text bodies from their shard under logs/. Text digests and heads
+    come from scan_log_shards, which only opens shards the index does not cover.
+    """
+
+    def __init__(self, logs_dir: Path):
+        self.logs_dir = logs_dir
+        self.summaries: dict[str, tuple[str, str]] = {}
+
+    def __getstate__(self) -> dict:
+        return {"logs_dir": self.logs_dir}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["logs_dir"])
+
+    def label(self, idx: int, name: str) -> str:
+        return f"{self.logs_dir.name}/{name}"
+
+    def summarize(self, raw: dict, name: str) -> tuple[str, str]:
+        return self.summaries.pop(name)
+
+    def load(self, name: str) -> str:
+        return str(read_log_shard(self.logs_dir / name).get("text", ""))
+
+    def close(self) -> None:
+        self.summaries.clear()
+
+
+def scan_log_shards(logs_dir: Path, text_store: ShardTextStore, index_path: Path | None = None) -> list[tuple[dict, str]]:
+    """
+    (raw_log, name) pairs for every shard in logs/, in file-name order, without
+    their text. A shard whose size and mtime match its entry in the index is not
+    opened; its fields, text digest and text head come from the index. Changed
+    and new shards are parsed and the index is rewritten.
+    """
+    index_path = index_path or SOURCE_INDEX_PATH
+    index_key = {
+        "version": SOURCE_INDEX_VERSION,
+        "head_chars": SEO_DESCRIPTION_MAX_CHARS,
+        "dir": logs_dir.resolve().as_posix(),
+    }
+    try:
+        index = json.loads(read_text(index_path))
+    except (OSError, ValueError):
+        index = {}
+    if not isinstance(index, dict) or any(index.get(key) != value for key, value in index_key.items()):
+        index = {}
+    cached = index.get("shards") or {}
+
+    shards = sorted(
+        (entry.name, entry)
+        for entry in os.scandir(logs_dir)
+        if entry.name.endswith(LOG_SHARD_SUFFIXES) and entry.is_file()
+    )
+    entries = []
+    fresh = {}
+    parsed = 0
+    for name, entry in shards:
+        st = entry.stat()
+        hit = cached.get(name)
+        if hit and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+            _, _, raw, digest, head = hit
+        else:
+            raw = read_log_shard(Path(entry.path))
+            digest, head = summarize_log_text(str(raw.pop("text", "")))
+            parsed += 1
+        fresh[name] = [st.st_size, st.st_mtime_ns, raw, digest, head]
+        text_store.summaries[name] = (digest, head)
+        entries.append((raw, name))
+
+    if parsed or len(fresh) != len(cached):
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(index_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {**index_key, "shards": fresh},
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+    print(f"Source shards OK — {len(entries)} in {logs_dir.name}/, {parsed} parsed, {len(entries) - parsed} from index")
+    return entries
+
+
+def split_logs_json(
+    source_path: Path = SOURCE_JSON_PATH,
+    logs_dir: Path = SOURCE_SHARDS_DIR,
+    site_path: Path = SOURCE_SITE_PATH,
+    fmt: str = "json",
+) -> int:
+    """
+    Write logs.json as site.json plus one <id>-<slug>.<fmt> shard per log in
+    logs/. The source file is left in place; the build refuses to run while
+    both layouts exist.
+    """
+    if logs_dir.exists() and any(logs_dir.iterdir()):
+        raise ValueError(f"{logs_dir.name}/ already exists and is not empty")
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    header = {}
+    names = set()
+    count = 0
+    for key, value in iter_logs_json(source_path):
+        if not isinstance(value, LogStream):
+            header[key] = value
+            continue
+        for idx, (raw, _) in enumerate(value):
+            if not isinstance(raw, dict):
+                raise ValueError(f"Cannot split {source_path.name}: logs[{idx}] is not an object")
+            parts = (slugify(str(raw.get("id", ""))), slugify(raw.get("slug") or raw.get("title", "")))
+            stem = "-".join(part for part in parts if part) or f"log-{idx}"
+            if stem in names:
+                stem = f"{stem}-{idx}"
+            names.add(stem)
+            if fmt == "md":
+                content = format_markdown_shard(raw)
+            else:
+                content = json.dumps(raw, ensure_ascii=False, indent=2) + "\n"
+            with open(logs_dir / f"{stem}.{fmt}", "w", encoding="utf-8", newline="") as f:
+                f.write(content)
+            count += 1
+    with open(site_path, "w", encoding="utf-8") as f:
+        json.dump(header, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    return count
+
+
+# =========================================================
+# LOG RECORDS
+# =========================================================
+class LogRecord:
+    """
+    One validated log. Everything the stages derive from a log (parsed id and
+    date, normalized slug, output URL, display titles, disruption identity) is
+    computed once at ingest; the source dict is not kept.
+
+    With a text_store the text body stays in the source (logs.json or its
+    shard): the record keeps a reference to it, a digest for build hashes and
+    the head of its first line for SEO descriptions, and `text` reads the body
+    back when a page needs it.
+    """
+
+    __slots__ = (
+        "id",
+        "id_int",
+        "date",
+        "date_obj",
+        "title",
+        "slug",
+        "tag",
+        "excerpt",
+        "text_ref",
+        "text_store",
+        "text_digest",
+        "text_head",
+        "series",
+        "mode",
+        "status",
+        "system_age_days",
+        "url",
+        "entry_title",
+        "disruption_title",
+        "disruption_name",
+        "disruption_slug",
+    )
+
+    def __init__(self, raw: dict, id_int: int, date_obj, core_date, text_store=None, text_ref=None):
+        self.id = str(raw["id"])
+        self.id_int = id_int
+        self.date = str(raw["date"])
+        self.date_obj = date_obj
+        self.title = str(raw.get("title", ""))
+        self.slug = slugify(raw.get("slug") or raw.get("title", ""))
+        # tag and series repeat across many logs; interning keeps one copy of each
+        self.tag = sys.intern(str(raw.get("tag", "")))
+        self.excerpt = str(raw.get("excerpt", ""))
+        self.text_store = text_store
+        if text_store is None:
+            self.text_ref = str(raw.get("text", ""))
+            self.text_digest, self.text_head = summarize_log_text(self.text_ref)
+        else:
+            self.text_ref = text_ref
+            self.text_digest, self.text_head = text_store.summarize(raw, text_ref)
+        self.series = sys.intern(str(raw.get("series") or raw.get("disruption") or ""))
+        ui_state = raw.get("ui_state") if isinstance(raw.get("ui_state"), dict) else {}
+        self.mode = str(ui_state.get("mode") or "READ_ONLY")
+        self.status = str(ui_state.get("status") or "SYSTEM_PARTIAL")
+        self.system_age_days = str((date_obj - core_date).days)
+        self.url = make_log_url(self.id, date_obj, self.slug)
+        entry_title = derive_mobile_log_entry_title(raw)
+        self.entry_title = self.title if entry_title == self.title else entry_title
+        self.disruption_title = derive_mobile_disruption_title(raw)
+        self.disruption_name, self.disruption_slug = extract_disruption_identity(raw)
+
+    @property
+    def rel_path(self) -> Path:
+        return Path(self.url[1:])
+
+    @property
+    def text(self) -> str:
+        if self.text_store is None:
+            return self.text_ref
+        return self.text_store.load(self.text_ref)
+
+    def hash_fields(self) -> tuple:
+        """
+        Every value a page can show: the source values and the fields derived
+        from them. A source field read only while deriving (such as
+        disruption_title_clean) is not kept, so it reaches the hash through
+        what was derived from it.
+        """
+        return (
+            self.id,
+            self.date,
+            self.title,
+            self.slug,
+            self.tag,
+            self.excerpt,
+            self.text_digest,
+            self.series,
+            self.mode,
+            self.status,
+            self.system_age_days,
+            self.url,
+            self.entry_title,
+            self.disruption_title,
+            self.disruption_name,
+            self.disruption_slug,
+        )
+
+
 # =========================================================
 # VALIDATION
 # =========================================================
-def validate_site_config(data: dict) -> None:
+def validate_site_config(data: dict, source_name: str = "logs.json") -> None:
     if not isinstance(data, dict):
-        raise ValueError("Invalid logs.json: root object must be a JSON object")
+        raise ValueError(f"Invalid {source_name}: root object must be a JSON object")
     site = data.get("site")
     if not isinstance(site, dict):
-        raise ValueError("Invalid logs.json: missing object 'site'")
+        raise ValueError(f"Invalid {source_name}: missing object 'site'")
     required_fields = ["base_url", "og_image", "youtube"]
     missing = [f for f in required_fields if not str(site.get(f, "")).strip()]
     if missing:
         raise ValueError(
-            "Invalid logs.json: missing required site fields: "
+            f"Invalid {source_name}: missing required site fields: "
             + ", ".join(f"site.{m}" for m in missing)
         )
     if not isinstance(data.get("logs"), list):
-        raise ValueError("Invalid logs.json structure: 'logs' must be a list")
+        raise ValueError(f"Invalid {source_name} structure: 'logs' must be a list")
 
 
 def parse_iso_date_strict(date_str: str, context: str):
@@ -483,18 +1608,62 @@ def parse_log_id_strict(raw_id, context: str) -> int:
     s = str(raw_id or "").strip()
     if not s:
         raise ValueError(f"{context}: missing id")
-    if not re.fullmatch(r"\d+", s):
+    if not s.isdecimal():  # same set as \d: Unicode decimal digits
         raise ValueError(f"{context}: id must be numeric, got '{s}'")
     return int(s)
 
 
-def validate_logs(logs: list) -> None:
+def invalid_logs_error(errors: list[str]) -> ValueError:
+    preview = "\n".join(f"- {msg}" for msg in errors[:20])
+    more = f"\n... and {len(errors) - 20} more" if len(errors) > 20 else ""
+    return ValueError(f"Build aborted. Invalid log records:\n{preview}{more}")
+
+
+def date_order_error(prev_log: LogRecord, curr_log: LogRecord) -> ValueError:
+    return ValueError(
+        "Build aborted. Date consistency error by id order: "
+        f"id {prev_log.id} ({prev_log.date}) -> "
+        f"id {curr_log.id} ({curr_log.date})"
+    )
+
+
+def path_collision_error(existing: LogRecord, log: LogRecord) -> ValueError:
+    return ValueError(
+        "Build aborted. Log output path collision for "
+        f"'{log.rel_path.as_posix()}': "
+        f"id={existing.id} date={existing.date} slug={existing.slug} "
+        f"collides with "
+        f"id={log.id} date={log.date} slug={log.slug}"
+    )
+
+
+def ingest_logs(logs_raw, core_date, text_store: SourceTextStore | None = None) -> list[LogRecord]:
+    """
+    Validate and enrich logs.json records in a single pass; each id and date is
+    parsed once. Reports the same errors, in the same order of precedence, as
+    the multi-pass ingest it replaced (kept in bench_build.py for comparison).
+    Only an archive whose ids are not ascending needs an extra sort for the
+    date check.
+
+    logs_raw is any iterable of log dicts, or with a text_store of
+    (raw_log, text_ref) pairs from a LogStream or scan_log_shards; records then
+    leave their text in the source and errors name records the store's way.
+    """
     errors = []
     seen_ids = {}
-    for idx, log in enumerate(logs):
-        ctx = f"logs[{idx}]"
-        log_id_int = None
-
+    records = []
+    path_owner = {}
+    collision = None
+    date_error = None
+    ascending = True
+    prev = None
+    for idx, entry in enumerate(logs_raw):
+        if text_store is None:
+            log, text_ref = entry, None
+            ctx = f"logs[{idx}]"
+        else:
+            log, text_ref = entry
+            ctx = text_store.label(idx, text_ref)
         try:
             log_id_int = parse_log_id_strict(log.get("id"), f"{ctx}.id")
         except ValueError as exc:
@@ -502,36 +1671,47 @@ def validate_logs(logs: list) -> None:
             continue
 
         if log_id_int in seen_ids:
-            first_idx = seen_ids[log_id_int]
             errors.append(
-                f"{ctx}.id: duplicate id '{log_id_int}' (first seen at logs[{first_idx}].id)"
+                f"{ctx}.id: duplicate id '{log_id_int}' (first seen at {seen_ids[log_id_int]}.id)"
             )
             continue
-        seen_ids[log_id_int] = idx
+        seen_ids[log_id_int] = ctx
 
         try:
-            parse_iso_date_strict(log.get("date", ""), f"{ctx}.date (id={log.get('id', '')})")
+            log_date = parse_iso_date_strict(log.get("date", ""), f"{ctx}.date (id={log.get('id', '')})")
         except ValueError as exc:
             errors.append(str(exc))
             continue
+        if errors:
+            continue  # the build aborts anyway; keep collecting errors only
+
+        record = LogRecord(log, log_id_int, log_date, core_date, text_store, text_ref)
+        records.append(record)
+        if prev is not None and ascending:
+            if log_id_int < prev.id_int:
+                ascending = False
+            elif date_error is None and log_date < prev.date_obj:
+                date_error = date_order_error(prev, record)
+        prev = record
+        if collision is None:
+            existing = path_owner.setdefault(record.url, record)
+            if existing is not record:
+                collision = path_collision_error(existing, record)
 
     if errors:
-        preview = "\n".join(f"- {msg}" for msg in errors[:20])
-        more = f"\n... and {len(errors) - 20} more" if len(errors) > 20 else ""
-        raise ValueError(f"Build aborted. Invalid log records:\n{preview}{more}")
-
-
-def enrich_logs(logs: list, core_date) -> list:
-    enriched = []
-    for log in logs:
-        log_id_int = parse_log_id_strict(log.get("id"), "enrich_logs.id")
-        log_date = parse_iso_date_strict(log.get("date", ""), f"enrich_logs.date (id={log.get('id', '')})")
-        new_log = dict(log)
-        new_log["_id_int"] = log_id_int
-        new_log["_date_obj"] = log_date
-        new_log["system_age_days_at_event"] = str((log_date - core_date).days)
-        enriched.append(new_log)
-    return enriched
+        raise invalid_logs_error(errors)
+    if not ascending:
+        date_error = None
+        logs_by_id = sorted(records, key=lambda item: item.id_int)
+        for i in range(1, len(logs_by_id)):
+            if logs_by_id[i].date_obj < logs_by_id[i - 1].date_obj:
+                date_error = date_order_error(logs_by_id[i - 1], logs_by_id[i])
+                break
+    if date_error is not None:
+        raise date_error
+    if collision is not None:
+        raise collision
+    return records
 
 
 def normalize_date(date_str: str) -> str:
@@ -539,9 +1719,6 @@ def normalize_date(date_str: str) -> str:
     return d.isoformat()
 
 
-def ym_from_date(date_str: str):
-    d = parse_iso_date_strict(date_str, "ym_from_date")
-    return f"{d.year:04d}", f"{d.month:02d}"
 
 def compute_next_log_utc(logs_sorted: list) -> str:
     now_utc = datetime.now(timezone.utc)
@@ -549,7 +1726,7 @@ def compute_next_log_utc(logs_sorted: list) -> str:
     nearest_future_raw = None
 
     for log in logs_sorted:
-        raw_date = str(log.get("date", "")).strip()
+        raw_date = log.date.strip()
         if not raw_date:
             continue
         if raw_date.endswith("Z"):
@@ -587,8 +1764,108 @@ def extract_disruption_identity(log: dict) -> tuple[str, str]:
     return disruption_display_name(raw_disruption), disruption_slug(raw_disruption)
 
 
-def write_json(path: Path, payload) -> None:
-    write_text(path, json.dumps(payload, ensure_ascii=False))
+def write_json(path: Path, payload, manifest: BuildManifest | None = None) -> int:
+    """Returns the file's size in bytes, written or not."""
+    content = json.dumps(payload, ensure_ascii=False)
+    if manifest is None or not manifest.is_current(path.relative_to(DIST), hash_inputs(content)):
+        write_text(path, content)
+    return utf8_size(content)
+
+
+class DataFiles:
+    """
+    Writer for the JSON export under data/. With content_hashed, each file is
+    published as <name>.<hash>.json and listed in data/manifest.json, the one
+    data file a client must revalidate; the others can be cached for good.
+    Otherwise files keep their plain names and no manifest is written.
+    """
+
+    def __init__(self, content_hashed: bool = False):
+        self.content_hashed = content_hashed
+        self.files: dict[str, str] = {}
+        self.written = 0
+        self.linked = 0
+
+    def write(self, name: str, payload, manifest: BuildManifest | None = None) -> int:
+        """Write data/<name> (a path below data/) and return its size in bytes."""
+        if not self.content_hashed:
+            return write_json(DIST / "data" / name, payload, manifest)
+        content = json.dumps(payload, ensure_ascii=False)
+        content_hash = hash_inputs(content)
+        hashed = fingerprinted_rel_path(Path(name), content_hash[:DATA_HASH_LENGTH]).as_posix()
+        self.files[name] = hashed
+        # the name is the content, so a hashed file already in the build never needs rewriting
+        if manifest is None or not manifest.is_current(Path("data") / hashed, content_hash):
+            if manifest is not None and self._link_previous(hashed, manifest):
+                self.linked += 1
+            else:
+                write_text(DIST / "data" / hashed, content)
+                self.written += 1
+        return utf8_size(content)
+
+    @staticmethod
+    def _link_previous(hashed: str, manifest: BuildManifest) -> bool:
+        """Whether data/<hashed> is in DIST, hardlinked from the live build being replaced if need be."""
+        path = DIST / "data" / hashed
+        if manifest.reuse_root is None:
+            return path.is_file()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.link(manifest.reuse_root / "data" / hashed, path)
+        except FileExistsError:
+            return path.is_file()
+        except OSError:
+            return False
+        return True
+
+    def write_manifest(self, manifest: BuildManifest) -> None:
+        """
+        Write data/manifest.json, with content_hashed only. The hashed files
+        of the live build's manifest are kept for one more build, so a page
+        loaded before this one went live can still fetch them; older ones are
+        left behind in the staged build (or pruned from an in-place one) like
+        any output this build does not track.
+        """
+        if not self.content_hashed:
+            return
+        previous_root = manifest.reuse_root or DIST
+        previous = read_json(DATA_MANIFEST_REL, previous_root)
+        kept = 0
+        for hashed in sorted(set(previous.get("files", {}).values()) - set(self.files.values())):
+            try:
+                content = read_text(previous_root / "data" / hashed)
+            except OSError:
+                continue
+            # tracked, so that the build after next prunes it from an in-place dist/
+            if manifest.is_current(Path("data") / hashed, hash_inputs(content)) or self._link_previous(
+                hashed, manifest
+            ):
+                kept += 1
+        size = write_json(
+            DIST / DATA_MANIFEST_REL,
+            {"content_hashed": True, "files": dict(sorted(self.files.items()))},
+            manifest,
+        )
+        print(
+            f"Data manifest OK — {len(self.files)} content-hashed files ({self.written} written, "
+            f"{self.linked} linked), {kept} kept from the previous build; "
+            f"{DATA_MANIFEST_REL.as_posix()} {size} bytes"
+        )
+
+
+def read_json(rel_path: Path, root: Path) -> dict:
+    """root/rel_path parsed as a JSON object, or {} when it is missing or unreadable."""
+    try:
+        with open(root / rel_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def json_member_size(key: str, value) -> int:
+    """Bytes that `, "key": value` adds to an object serialized by write_json."""
+    return 4 + utf8_size(json.dumps(key, ensure_ascii=False)) + utf8_size(json.dumps(value, ensure_ascii=False))
 
 
 def iter_page_chunks(items: list, page_size: int):
@@ -599,10 +1876,53 @@ def iter_page_chunks(items: list, page_size: int):
         yield page_num, items[start:start + page_size]
 
 
-def write_paginated_json_files(items: list, page_size: int, file_prefix: str) -> int:
+def iter_anchored_log_chunks(logs_sorted: list, page_size: int):
+    """
+    Pages fixed to id ranges for newest-first logs, counted from the range
+    of the oldest log: with base = oldest id // page_size, page N holds the
+    logs with (base + N - 1) * page_size <= id < (base + N) * page_size, so
+    page 1 is always written. A new log joins the last (head) page or opens
+    the next one, so no other page changes; only removing the oldest logs
+    can move the base. Ranges without a published log give empty pages to
+    keep the numbers contiguous.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    base = logs_sorted[-1].id_int // page_size if logs_sorted else 0
+    pages = [log.id_int // page_size - base + 1 for log in logs_sorted]
+    end = len(pages)
+    for page_num in range(pages[-1], pages[0] + 1) if pages else ():
+        start = end
+        while start > 0 and pages[start - 1] == page_num:
+            start -= 1
+        yield page_num, logs_sorted[start:end]
+        end = start
+
+
+def iter_oldest_anchored_chunks(items: list, page_size: int):
+    """Pages for newest-first items counted from the oldest: only the last page changes on append."""
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    total = len(items)
+    for page_num in range(1, (total + page_size - 1) // page_size + 1):
+        yield page_num, items[max(total - page_num * page_size, 0):total - (page_num - 1) * page_size]
+
+
+def write_paginated_json_files(
+    items: list,
+    page_size: int,
+    file_prefix: str,
+    manifest: BuildManifest | None = None,
+    item_payload: Callable | None = None,
+    data_files: DataFiles | None = None,
+) -> int:
+    """With item_payload, items are mapped to their JSON payload one page at a time."""
+    data_files = data_files or DataFiles()
     total_pages = (len(items) + page_size - 1) // page_size if items else 0
     for page_num, chunk in iter_page_chunks(items, page_size):
-        write_json(DIST / "data" / f"{file_prefix}-page-{page_num}.json", chunk)
+        if item_payload is not None:
+            chunk = [item_payload(item) for item in chunk]
+        data_files.write(f"{file_prefix}-page-{page_num}.json", chunk, manifest)
     return total_pages
 
 
@@ -610,6 +1930,7 @@ def write_paginated_json_files(items: list, page_size: int, file_prefix: str) ->
 # =========================================================
 # DISRUPTION / SERIES CLEANUP
 # =========================================================
+@functools.lru_cache(maxsize=4096)
 def disruption_display_name(raw: str) -> str:
     """
     Converts e.g.:
@@ -633,6 +1954,7 @@ def disruption_display_name(raw: str) -> str:
     return s.strip() or raw.strip()
 
 
+@functools.lru_cache(maxsize=4096)
 def disruption_slug(raw: str) -> str:
     """
     Build the slug from only the disruption title
@@ -742,11 +2064,11 @@ def jsonld_log_creative_work(
     return json.dumps([article, breadcrumbs], ensure_ascii=False, indent=2)
 
 
-def make_recent_logs_markup(logs_sorted: list, rel, url, limit: int = 6) -> list[str]:
+def make_recent_logs_markup(logs_sorted: list[LogRecord], limit: int = 6) -> list[str]:
     recent_logs = []
     for log in logs_sorted[:limit]:
-        up = url(rel(log))
-        raw_title = str(log.get("title", ""))
+        up = log.url
+        raw_title = log.title
         title = re.sub(r"^LOG\s+\d+\s*//\s*", "", raw_title, flags=re.IGNORECASE).strip()
         recent_logs.append(make_log_line_link(up, "//", title or raw_title, extra_class="naked"))
     return recent_logs
@@ -764,6 +2086,36 @@ def make_disruption_nodes_markup(disruption_order: list, disruptions: dict, disr
     return disruption_nodes
 
 
+def make_site_fragment_placeholder(name: str) -> str:
+    return f'<span class="site-fragment" data-site-fragment="{name}" hidden></span>'
+
+
+def resolve_page_fragments(
+    logs_sorted: list,
+    disruption_order: list,
+    disruptions: dict,
+    ctx: SiteContext,
+    next_log_utc: str,
+    url,
+    disruption_rel,
+    shared_fragments: bool,
+):
+    """
+    Site-wide values embedded in log and disruption pages. With shared_fragments
+    they are replaced by placeholders that site-state.js fills from data/site-state.json.
+    """
+    if shared_fragments:
+        return (
+            replace(ctx, available_count=SITE_STATE_AVAILABLE_PLACEHOLDER),
+            "",
+            make_site_fragment_placeholder("recent_logs"),
+            make_site_fragment_placeholder("disruption_nodes"),
+        )
+    recent_logs_markup = make_recent_logs_markup(logs_sorted)
+    disruption_nodes_markup = make_disruption_nodes_markup(disruption_order, disruptions, disruption_rel, url)
+    return ctx, next_log_utc, "\n".join(recent_logs_markup), "\n".join(disruption_nodes_markup)
+
+
 def register_seo_entry(seo_registry: dict, page_key: str, title: str, description: str, canonical: str) -> None:
     title = str(title or "").strip()
     description = str(description or "").strip()
@@ -896,7 +2248,52 @@ def run_checked_process(cmd: list[str], *, error_label: str) -> subprocess.Compl
         sys.exit(1)
 
 
-def stage_minify_css() -> None:
+def esbuild_inputs_key(cmd: list[str], input_root: Path, hash_cache: FileHashCache) -> str:
+    """
+    Fingerprint of an esbuild run: every file under input_root (a superset of the
+    import graph), the esbuild package version and the flags except --outfile.
+    """
+    paths = sorted((p for p in input_root.rglob("*") if p.is_file()), key=lambda x: x.as_posix())
+    esbuild_pkg = ROOT / "node_modules" / "esbuild" / "package.json"
+    if esbuild_pkg.exists():
+        paths.append(esbuild_pkg)
+    digests = hash_cache.digests(paths)
+    return hash_inputs(
+        [arg for arg in cmd if not arg.startswith("--outfile=")],
+        [(p.relative_to(ROOT).as_posix(), digests[p]) for p in paths],
+    )
+
+
+def restore_esbuild_output(name: str, key: str, dst: Path) -> bool:
+    cached = ESBUILD_CACHE_DIR / name
+    key_path = ESBUILD_CACHE_DIR / f"{name}.key"
+    try:
+        if read_text(key_path) != key or not cached.is_file():
+            return False
+    except OSError:
+        return False
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(cached, dst)
+    return True
+
+
+def record_esbuild_output(input_root: Path, suffix: str, dst: Path, minified: bool) -> None:
+    size = dst.stat().st_size
+    if minified:
+        source_size = sum(p.stat().st_size for p in input_root.rglob(f"*{suffix}") if p.is_file())
+        record_write(size, source_size, size)
+    else:
+        record_write(size)
+
+
+def store_esbuild_output(name: str, key: str, src: Path) -> None:
+    ESBUILD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(src, ESBUILD_CACHE_DIR / name)
+    with open(ESBUILD_CACHE_DIR / f"{name}.key", "w", encoding="utf-8") as f:
+        f.write(key)
+
+
+def stage_minify_css(hash_cache: FileHashCache | None = None) -> None:
     css_main = ASSETS_SRC / "css" / "style.css"
     css_core = ASSETS_SRC / "css" / "style-core.css"
     css_entry = ASSETS_SRC / "css" / "style-core.entry.css"
@@ -909,20 +2306,30 @@ def stage_minify_css() -> None:
 
     css_dst.parent.mkdir(parents=True, exist_ok=True)
 
-    run_checked_process(
-        ["node", "node_modules/esbuild/bin/esbuild",
-         str(css_src),
-         "--bundle",
-         "--external:*.woff2",
-         "--minify",
-         f"--outfile={css_dst}"],
-        error_label="CSS minify failed",
-    )
+    cmd = [
+        "node", "node_modules/esbuild/bin/esbuild",
+        str(css_src),
+        "--bundle",
+        "--external:*.woff2",
+        "--minify",
+        f"--outfile={css_dst}",
+    ]
+    cache_key = esbuild_inputs_key(cmd, ASSETS_SRC / "css", hash_cache) if hash_cache else None
+    if cache_key and restore_esbuild_output(css_dst.name, cache_key, css_dst):
+        record_esbuild_output(ASSETS_SRC / "css", ".css", css_dst, minified=True)
+        size_kb = css_dst.stat().st_size / 1024
+        print(f"CSS minify SKIP — inputs unchanged, {ASSETS_CSS_REL.as_posix()} restored ({size_kb:.1f} kB)")
+        return
+
+    run_checked_process(cmd, error_label="CSS minify failed")
+    if cache_key:
+        store_esbuild_output(css_dst.name, cache_key, css_dst)
+    record_esbuild_output(ASSETS_SRC / "css", ".css", css_dst, minified=True)
     size_kb = css_dst.stat().st_size / 1024
     print(f"CSS minify OK — {ASSETS_CSS_REL.as_posix()} ({size_kb:.1f} kB)")
 
 
-def stage_bundle_js() -> None:
+def stage_bundle_js(hash_cache: FileHashCache | None = None) -> None:
     """Bundle assets/js/main.js → dist/assets/js/bundle.js via esbuild."""
     if not JS_ENTRY.exists():
         print(f"SKIP JS bundle — entry not found: {JS_ENTRY}")
@@ -944,133 +2351,1029 @@ def stage_bundle_js() -> None:
     if JS_MINIFY:
         cmd.append("--minify")
 
+    cache_key = esbuild_inputs_key(cmd, JS_ENTRY.parent, hash_cache) if hash_cache else None
+    if cache_key and restore_esbuild_output(JS_BUNDLE_DIST.name, cache_key, JS_BUNDLE_DIST):
+        record_esbuild_output(JS_ENTRY.parent, ".js", JS_BUNDLE_DIST, minified=JS_MINIFY)
+        size_kb = JS_BUNDLE_DIST.stat().st_size / 1024
+        print(f"JS bundle SKIP — inputs unchanged, {JS_BUNDLE_REL.as_posix()} restored ({size_kb:.1f} kB)")
+        return
+
     result = run_checked_process(cmd, error_label="esbuild failed")
+    if cache_key:
+        store_esbuild_output(JS_BUNDLE_DIST.name, cache_key, JS_BUNDLE_DIST)
+    record_esbuild_output(JS_ENTRY.parent, ".js", JS_BUNDLE_DIST, minified=JS_MINIFY)
     size_kb = JS_BUNDLE_DIST.stat().st_size / 1024
     print(f"JS bundle OK — {JS_BUNDLE_REL.as_posix()} ({size_kb:.1f} kB)")
     if result.stderr:
         print(result.stderr.strip())
 
 
-def stage_prepare_output() -> None:
-    if CLEAN_DIST_ON_BUILD and DIST.exists():
+def stage_fingerprint_assets() -> dict:
+    """
+    Publish each generated asset under a name derived from its own bytes
+    (style.<hash>.css, bundle.<hash>.js) and write dist/manifest.json mapping
+    logical paths to fingerprinted ones. The plain files are kept for old pages.
+    """
+    asset_manifest = {}
+    for rel_path in FINGERPRINTED_ASSETS:
+        src = DIST / rel_path
+        if not src.exists():
+            continue
+        with open(src, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:10]
+        hashed_rel = fingerprinted_rel_path(rel_path, digest)
+        hashed_re = re.compile(rf"{re.escape(rel_path.stem)}\.[0-9a-f]{{10}}{re.escape(rel_path.suffix)}")
+        for stale in src.parent.iterdir():
+            if stale.name != hashed_rel.name and hashed_re.fullmatch(stale.name):
+                stale.unlink()
+        copy_file_if_changed(src, DIST / hashed_rel)
+        asset_manifest[rel_path.as_posix()] = hashed_rel.as_posix()
+        print(f"Fingerprint OK — {hashed_rel.as_posix()}")
+
+    write_text(DIST / ASSET_MANIFEST_REL, json.dumps(asset_manifest, ensure_ascii=False, indent=2) + "\n")
+    return asset_manifest
+
+
+def stage_prepare_output(clean: bool = CLEAN_DIST_ON_BUILD) -> None:
+    if clean and DIST.exists():
         shutil.rmtree(DIST)
     DIST.mkdir(parents=True, exist_ok=True)
 
     if ASSETS_SRC.exists():
-        ASSETS_DIST.mkdir(parents=True, exist_ok=True)
-        if CLEAN_DIST_ON_BUILD:
-            shutil.copytree(ASSETS_SRC, ASSETS_DIST, dirs_exist_ok=True)
-        else:
-            copy_tree_if_changed(ASSETS_SRC, ASSETS_DIST)
-        css_dist_dir = ASSETS_DIST / "css"
+        css_dist_dir = ASSETS_CSS_DIST.parent
         if css_dist_dir.exists():
             shutil.rmtree(css_dist_dir)
         css_dist_dir.mkdir(parents=True, exist_ok=True)
 
+
+def stage_publish_assets(link: bool = True, manifest_path: Path = ASSET_PUBLISH_MANIFEST_PATH) -> dict:
+    """
+    Publish the static files the site serves: assets/ without
+    ASSETS_UNPUBLISHED, plus the icons again at the site root. A file is
+    published again only when its source's size or mtime differs from the
+    previous build's manifest or its dist copy is missing, and then as a
+    reflink or hardlink where the filesystem allows (see publish_file).
+    Files published before and no longer wanted are removed, as are dist
+    copies of unpublished sources left by older builds. Returns the manifest.
+    """
+    wanted = {}
+    if ASSETS_SRC.exists():
+        for src in ASSETS_SRC.rglob("*"):
+            rel = src.relative_to(ASSETS_SRC)
+            if rel.parts[0] not in ASSETS_UNPUBLISHED and src.is_file():
+                wanted[(ASSETS_DIST / rel).relative_to(DIST).as_posix()] = src
     if ICONS_SRC.exists():
-        for p in ICONS_SRC.iterdir():
-            if p.is_file():
-                copy_file_if_changed(p, DIST / p.name)
+        for src in ICONS_SRC.iterdir():
+            if src.is_file():
+                wanted[src.name] = src
+
+    try:
+        previous = json.loads(read_text(manifest_path))["files"]
+    except (OSError, ValueError, KeyError, TypeError):
+        previous = {}
+    methods = (["reflink"] if link and _fcntl is not None else []) + (["hardlink"] if link else []) + ["copy"]
+    counters = current_stage_counters()
+    current = {}
+    published = {"reflink": 0, "hardlink": 0, "copy": 0}
+    for rel, src in sorted(wanted.items()):
+        st = src.stat()
+        entry = [src.relative_to(ROOT).as_posix(), st.st_size, st.st_mtime_ns]
+        current[rel] = entry
+        dst = DIST / rel
+        if previous.get(rel) == entry:
+            try:
+                if dst.stat().st_size == st.st_size:
+                    continue
+            except FileNotFoundError:
+                pass
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        method = publish_file(src, dst, methods)
+        published[method] += 1
+        if method == "copy":
+            record_write(st.st_size)
+        elif counters is not None:
+            counters.files_linked += 1
+
+    stale = [DIST / rel for rel in sorted(set(previous) - set(current))]
+    for top in ASSETS_UNPUBLISHED:
+        for src in (ASSETS_SRC / top).rglob("*"):
+            dst = ASSETS_DIST / src.relative_to(ASSETS_SRC)
+            if dst not in (ASSETS_CSS_DIST, JS_BUNDLE_DIST) and dst.is_file():
+                stale.append(dst)
+    for dst in stale:
+        dst.unlink(missing_ok=True)
+        # the css and js stages write into their directories concurrently
+        remove_empty_dirs(dst.parent, DIST, keep=(ASSETS_CSS_DIST.parent, JS_BUNDLE_DIST.parent))
+
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"files": current}, f, ensure_ascii=False, indent=0)
+    linked = published["reflink"] + published["hardlink"]
+    print(
+        f"Assets OK — {len(current)} published: {linked} linked ({published['reflink']} reflinks), "
+        f"{published['copy']} copied, {len(current) - linked - published['copy']} unchanged, {len(stale)} removed"
+    )
+    return current
+
+
+def stage_load_and_validate_source(path: Path | None = None) -> dict:
+    """
+    Load the archive into LogRecords, from logs.json or from a logs/ directory
+    with one shard per log next to site.json (see scan_log_shards); both give
+    the same records and digest. Text bodies stay in the source (see
+    SourceTextStore), so memory grows with the number of logs, not their size.
+
+    logs.json records are streamed when 'site' and 'system' precede 'logs' in
+    the file, as they do in the file the site ships; otherwise they are
+    buffered until the header is complete.
+    """
+    path = path or resolve_source_path()
+    if path.is_dir():
+        site_path = path.parent / SOURCE_SITE_PATH.name
+        try:
+            data = json.loads(read_text(site_path))
+        except FileNotFoundError as exc:
+            raise ValueError(f"{path.name}/ needs a {site_path.name} with the site and system objects") from exc
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid {site_path.name}: root object must be a JSON object")
+        data["logs"] = []
+        header = parse_source_header(data, site_path.name)
+        text_store = ShardTextStore(path)
+        logs = ingest_logs(scan_log_shards(path, text_store), header[3], text_store)
+    else:
+        text_store = SourceTextStore(path, path.stat())
+        data = {}
+        logs = None
+        for key, value in iter_logs_json(path):
+            if isinstance(value, LogStream):
+                if "site" in data and "system" in data:
+                    # the array itself is validated record by record
+                    core_date = parse_source_header({**data, "logs": []}, path.name)[3]
+                    logs = ingest_logs(value, core_date, text_store)
+                    value = []
+                else:
+                    value = list(value)
+            data[key] = value
+        header = parse_source_header(data, path.name)
+        if logs is None:
+            logs = ingest_logs(data["logs"], header[3], text_store)
+
+    site, core_start, sys_ver, _ = header
+    return {
+        "site": site,
+        "core_start": core_start,
+        "sys_ver": sys_ver,
+        "logs": logs,
+        "text_store": text_store,
+        "digest": compute_source_digest(data, logs),
+    }
+
+
+def compute_source_digest(data: dict, logs: list[LogRecord]) -> str:
+    """Content hash of the loaded archive; the same for logs.json and logs/ shards."""
+    hasher = hashlib.sha256(
+        json.dumps([data.get("site"), data.get("system")], ensure_ascii=False, sort_keys=True).encode("utf-8")
+    )
+    for log in sorted(logs, key=lambda item: item.id_int):
+        hasher.update("\x1f".join(log.hash_fields()).encode("utf-8"))
+        hasher.update(b"\x1e")
+    return hasher.hexdigest()
 
 
-def stage_load_and_validate_source() -> dict:
-    data = json.loads(read_text(ROOT / "logs.json"))
-    validate_site_config(data)
+def parse_source_header(data: dict, source_name: str = "logs.json") -> tuple:
+    """Validate the site and system objects; returns (site, core_start, sys_ver, core_date)."""
+    validate_site_config(data, source_name)
 
     site = data["site"]
     system = data.get("system", {})
     core_start = str(system.get("core_start_utc", "")).strip()
     sys_ver = str(system.get("sys_ver", "00.00"))
     if not core_start:
-        raise ValueError("Invalid logs.json: system.core_start_utc missing or empty")
+        raise ValueError(f"Invalid {source_name}: system.core_start_utc missing or empty")
 
     try:
         core_date = datetime.fromisoformat(core_start.replace("Z", "+00:00")).date()
     except Exception as exc:
         raise ValueError(f"Invalid system.core_start_utc value: '{core_start}'") from exc
+    return site, core_start, sys_ver, core_date
 
-    logs_raw = data["logs"]
-    validate_logs(logs_raw)
-    logs = enrich_logs(logs_raw, core_date)
+def resolve_source_path() -> Path:
+    if SOURCE_SHARDS_DIR.is_dir() and SOURCE_JSON_PATH.exists():
+        raise ValueError("Both logs.json and logs/ exist; keep one source layout")
+    return SOURCE_SHARDS_DIR if SOURCE_SHARDS_DIR.is_dir() else SOURCE_JSON_PATH
 
-    logs_by_id = sorted(logs, key=lambda item: item["_id_int"])
-    for i in range(1, len(logs_by_id)):
-        prev_log = logs_by_id[i - 1]
-        curr_log = logs_by_id[i]
-        if curr_log["_date_obj"] < prev_log["_date_obj"]:
-            raise ValueError(
-                "Build aborted. Date consistency error by id order: "
-                f"id {prev_log['id']} ({prev_log.get('date', '')}) -> "
-                f"id {curr_log['id']} ({curr_log.get('date', '')})"
-            )
 
-    path_owner = {}
-    for log in logs:
-        effective_slug = slugify(log.get("slug") or log.get("title", ""))
-        log_for_path = dict(log)
-        log_for_path["slug"] = effective_slug
-        rel_path = make_log_rel_path(log_for_path)
-        existing = path_owner.get(rel_path)
-        if existing is not None:
-            raise ValueError(
-                "Build aborted. Log output path collision for "
-                f"'{rel_path.as_posix()}': "
-                f"id={existing['id']} date={existing.get('date', '')} slug={existing['slug']} "
-                f"collides with "
-                f"id={log.get('id', '')} date={log.get('date', '')} slug={effective_slug}"
+# =========================================================
+# SOURCE SNAPSHOT
+# =========================================================
+def source_snapshot_key(path: Path, code_version: str, hash_cache: FileHashCache) -> str | None:
+    """
+    Identity of a parsed-source snapshot: the source content (the bytes of
+    logs.json, or site.json plus every shard's name, size and mtime as in
+    scan_log_shards), its location, the build.py version and the Python
+    version. None when the source is missing; loading reports that.
+    """
+    hasher = hashlib.sha256()
+    for part in (code_version, f"{sys.implementation.name}-{sys.version_info[0]}.{sys.version_info[1]}", path.resolve().as_posix()):
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    if path.is_dir():
+        site_path = path.parent / SOURCE_SITE_PATH.name
+        if not site_path.is_file():
+            return None
+        hasher.update(hash_cache.digests([site_path])[site_path].encode("ascii"))
+        for entry in sorted(os.scandir(path), key=lambda item: item.name):
+            if entry.name.endswith(LOG_SHARD_SUFFIXES) and entry.is_file():
+                st = entry.stat()
+                hasher.update(f"{entry.name}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+    elif path.is_file():
+        hasher.update(hash_cache.digests([path])[path].encode("ascii"))
+    else:
+        return None
+    return hasher.hexdigest()[:24]
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """
+    Resolves the record classes to this module whichever name build.py ran
+    under when the snapshot was written (__main__ for `python build.py`).
+    """
+
+    def find_class(self, module: str, name: str):
+        if module in ("__main__", "__mp_main__", __name__) and name in ("LogRecord", "SourceTextStore", "ShardTextStore"):
+            return globals()[name]
+        return super().find_class(module, name)
+
+
+def stage_load_source_cached(code_version: str, hash_cache: FileHashCache, path: Path | None = None) -> dict:
+    """
+    stage_load_and_validate_source behind a snapshot in .build-cache. On a hit
+    ingest is skipped entirely and the source dict also carries the
+    disruption grouping saved with it (see save_source_snapshot); either way
+    it carries the key the source_snapshot stage saves under.
+    """
+    path = path or resolve_source_path()
+    key = source_snapshot_key(path, code_version, hash_cache)
+    if key is None:
+        return stage_load_and_validate_source(path)
+    snapshot_path = SOURCE_SNAPSHOT_DIR / f"{key}.pickle"
+    try:
+        # written only by save_source_snapshot into our own cache directory
+        with open(snapshot_path, "rb") as f:
+            source = _SnapshotUnpickler(f).load()
+    except FileNotFoundError:
+        source = None
+    except Exception as exc:
+        print(f"WARN: ignoring unreadable source snapshot {snapshot_path.name}: {exc}")
+        source = None
+    if source is None:
+        source = stage_load_and_validate_source(path)
+        source["snapshot_key"] = key
+        return source
+
+    text_store = ShardTextStore(path) if path.is_dir() else SourceTextStore(path, path.stat())
+    for log in source["logs"]:
+        log.text_store = text_store
+    source["text_store"] = text_store
+    source["snapshot_key"] = key
+    print(f"Source snapshot OK — {len(source['logs'])} logs loaded from {snapshot_path.name}")
+    return source
+
+
+def save_source_snapshot(source: dict, logs_sorted: list, grouping: tuple, warnings: list[str]) -> Path | None:
+    """
+    Pickle the loaded source with the disruption grouping of logs_sorted. Ingest
+    guarantees dates never decrease with id, so the published logs are always
+    the oldest ones: a later build with the same number of published logs has
+    the same published set and can reuse the grouping. Older snapshots are
+    removed.
+    """
+    key = source.get("snapshot_key")
+    if key is None:
+        return None
+    snapshot_path = SOURCE_SNAPSHOT_DIR / f"{key}.pickle"
+    payload = {name: value for name, value in source.items() if name not in ("snapshot_key", "text_store")}
+    payload["grouping"] = (len(logs_sorted), grouping, warnings)
+    SOURCE_SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = snapshot_path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, snapshot_path)
+    for old in SOURCE_SNAPSHOT_DIR.glob("*.pickle"):
+        if old != snapshot_path:
+            old.unlink(missing_ok=True)
+    return snapshot_path
+
+
+# =========================================================
+# SQLITE LOG STORE
+# =========================================================
+LOG_STORE_FIELDS = (
+    "id",
+    "id_int",
+    "date",
+    "title",
+    "slug",
+    "tag",
+    "excerpt",
+    "text_digest",
+    "text_head",
+    "series",
+    "mode",
+    "status",
+    "system_age_days",
+    "url",
+    "entry_title",
+    "disruption_title",
+    "disruption_name",
+    "disruption_slug",
+)
+
+LOG_STORE_SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE logs (
+    id_int INTEGER PRIMARY KEY,
+    rank INTEGER NOT NULL,
+    disruption_rank INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    title TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    excerpt TEXT NOT NULL,
+    text_digest TEXT NOT NULL,
+    text_head TEXT NOT NULL,
+    series TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    status TEXT NOT NULL,
+    system_age_days TEXT NOT NULL,
+    url TEXT NOT NULL,
+    entry_title TEXT NOT NULL,
+    disruption_title TEXT NOT NULL,
+    disruption_name TEXT NOT NULL,
+    disruption_slug TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+"""
+
+LOG_STORE_INDEXES = """
+CREATE UNIQUE INDEX logs_rank ON logs (rank);
+CREATE INDEX logs_day ON logs (day);
+CREATE INDEX logs_slug ON logs (slug);
+CREATE INDEX logs_disruption ON logs (disruption_slug, disruption_rank);
+"""
+
+
+def write_log_store(db_path: Path, source_key: str, source: dict) -> None:
+    """
+    Write the loaded archive to a fresh SQLite database: one row per log with
+    its derived fields and text, `rank` counting from the newest log (0) and
+    `disruption_rank` from the newest log of its disruption, plus the site,
+    system values and source digest in `meta` (JSON values). The file is
+    built next to db_path and swapped in, so readers never see it half written.
+    """
+    logs = sorted(source["logs"], key=lambda log: log.id_int, reverse=True)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = db_path.with_suffix(".tmp")
+    tmp_path.unlink(missing_ok=True)
+    disruption_counts = {}
+
+    def rows():
+        for rank, log in enumerate(logs):
+            disruption_rank = disruption_counts.get(log.disruption_slug, 0)
+            disruption_counts[log.disruption_slug] = disruption_rank + 1
+            yield (
+                rank,
+                disruption_rank,
+                log.date_obj.isoformat(),
+                *(getattr(log, name) for name in LOG_STORE_FIELDS),
+                log.text,
             )
-        path_owner[rel_path] = {
-            "id": str(log.get("id", "")),
-            "date": str(log.get("date", "")),
-            "slug": effective_slug,
-        }
 
+    columns = ("rank", "disruption_rank", "day") + LOG_STORE_FIELDS + ("text",)
+    meta = {
+        "schema_version": LOG_STORE_SCHEMA_VERSION,
+        "source_key": source_key,
+        "site": source["site"],
+        "core_start": source["core_start"],
+        "sys_ver": source["sys_ver"],
+        "digest": source["digest"],
+    }
+    conn = sqlite3.connect(tmp_path)
+    try:
+        # a crash leaves only the temporary file behind, so skip the journal
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(LOG_STORE_SCHEMA)
+        with conn:
+            conn.executemany(
+                f"INSERT INTO logs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                rows(),
+            )
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value, ensure_ascii=False)) for key, value in meta.items()],
+            )
+        conn.executescript(LOG_STORE_INDEXES)
+    finally:
+        conn.close()
+    os.replace(tmp_path, db_path)
+
+
+class SqliteLogStore:
+    """
+    Read side of a database written by write_log_store. Connections are
+    read-only and opened per thread; the store pickles as its path, so render
+    workers open their own. Doubles as the text store of the records it
+    returns: their text_ref is the log's id_int.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
+
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        return self.connection().execute(sql, params).fetchall()
+
+    def meta(self) -> dict:
+        return {key: json.loads(value) for key, value in self.query("SELECT key, value FROM meta")}
+
+    def records(self, where: str, params: tuple = ()) -> list[LogRecord]:
+        rows = self.query(f"SELECT day, {', '.join(LOG_STORE_FIELDS)} FROM logs WHERE {where}", params)
+        records = []
+        for row in rows:
+            log = LogRecord.__new__(LogRecord)
+            for name, value in zip(LOG_STORE_FIELDS, row[1:]):
+                setattr(log, name, value)
+            log.date_obj = datetime.fromisoformat(row[0]).date()
+            log.text_store = self
+            log.text_ref = log.id_int
+            records.append(log)
+        return records
+
+    def count(self, where: str = "1", params: tuple = ()) -> int:
+        return self.query(f"SELECT COUNT(*) FROM logs WHERE {where}", params)[0][0]
+
+    def load(self, id_int: int) -> str:
+        rows = self.query("SELECT text FROM logs WHERE id_int = ?", (id_int,))
+        if not rows:
+            raise RuntimeError(f"{self.path.name} has no log {id_int}; it changed during the build, run it again")
+        return rows[0][0]
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._local = threading.local()
+
+
+class LogStoreView:
+    """
+    Newest-first sequence over store rows: ranks [start, start + length) of
+    the archive or, with disruption_slug, of that disruption. Supports len,
+    indexing, slicing and iteration like the list of LogRecords it stands in
+    for. Rows are fetched LOG_STORE_BLOCK_ROWS at a time and only the last few
+    blocks are kept, so walking the archive with its neighbours holds a window
+    of it in memory rather than all of it.
+    """
+
+    def __init__(self, store: SqliteLogStore, start: int, length: int, disruption_slug: str | None = None):
+        self.store = store
+        self.start = start
+        self.length = length
+        self.disruption_slug = disruption_slug
+        self._blocks = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return (self.store, self.start, self.length, self.disruption_slug)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def _fetch(self, lo: int, hi: int) -> list[LogRecord]:
+        if lo >= hi:
+            return []
+        if self.disruption_slug is None:
+            return self.store.records("rank >= ? AND rank < ? ORDER BY rank", (self.start + lo, self.start + hi))
+        return self.store.records(
+            "disruption_slug = ? AND disruption_rank >= ? AND disruption_rank < ? ORDER BY disruption_rank",
+            (self.disruption_slug, self.start + lo, self.start + hi),
+        )
+
+    def _block(self, block: int) -> list[LogRecord]:
+        with self._lock:
+            rows = self._blocks.pop(block, None)
+            if rows is not None:
+                self._blocks[block] = rows  # most recently used last
+                return rows
+        lo = block * LOG_STORE_BLOCK_ROWS
+        rows = self._fetch(lo, min(lo + LOG_STORE_BLOCK_ROWS, self.length))
+        with self._lock:
+            self._blocks[block] = rows
+            while len(self._blocks) > LOG_STORE_CACHED_BLOCKS:
+                del self._blocks[next(iter(self._blocks))]
+        return rows
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            lo, hi, step = key.indices(self.length)
+            if step != 1:
+                return [self[i] for i in range(lo, hi, step)]
+            return self._fetch(lo, hi)
+        if key < 0:
+            key += self.length
+        if not 0 <= key < self.length:
+            raise IndexError("log store index out of range")
+        return self._block(key // LOG_STORE_BLOCK_ROWS)[key % LOG_STORE_BLOCK_ROWS]
+
+    def __iter__(self):
+        for block in range((self.length + LOG_STORE_BLOCK_ROWS - 1) // LOG_STORE_BLOCK_ROWS):
+            yield from self._block(block)
+
+
+def stage_load_source_sqlite(
+    code_version: str,
+    hash_cache: FileHashCache,
+    path: Path | None = None,
+    db_path: Path | None = None,
+) -> dict:
+    """
+    The source as stage_load_and_validate_source returns it, with "logs" a
+    LogStoreView over a SQLite copy of the archive (LOG_STORE_PATH). The copy
+    is rebuilt when the source key (see source_snapshot_key) changes; a
+    current copy is used without reading the source at all.
+    """
+    path = path or resolve_source_path()
+    db_path = db_path or LOG_STORE_PATH
+    key = source_snapshot_key(path, code_version, hash_cache)
+    if key is None:
+        return stage_load_and_validate_source(path)
+    store = SqliteLogStore(db_path)
+    meta = {}
+    if db_path.exists():
+        try:
+            meta = store.meta()
+        except sqlite3.Error as exc:
+            print(f"WARN: rebuilding unreadable log store {db_path.name}: {exc}")
+        store.close()
+    rebuilt = meta.get("schema_version") != LOG_STORE_SCHEMA_VERSION or meta.get("source_key") != key
+    if rebuilt:
+        source = stage_load_and_validate_source(path)
+        try:
+            write_log_store(db_path, key, source)
+        finally:
+            source["text_store"].close()
+        del source
+        meta = store.meta()
+
+    logs = LogStoreView(store, 0, store.count())
+    print(f"Log store OK — {len(logs)} logs in {db_path.name} ({'rebuilt' if rebuilt else 'current'})")
     return {
-        "site": site,
-        "core_start": core_start,
-        "sys_ver": sys_ver,
+        "site": meta["site"],
+        "core_start": meta["core_start"],
+        "sys_ver": meta["sys_ver"],
         "logs": logs,
+        "text_store": store,
+        "digest": meta["digest"],
     }
 
 
-def stage_load_templates():
-    t_log = read_text(ROOT / "template-log.html")
-    t_index = read_text(ROOT / "template-index.html")
+def prepare_store_logs(logs: LogStoreView, today) -> tuple[LogStoreView, str]:
+    """stage_prepare_logs for the archive view of a SqliteLogStore."""
+    store = logs.store
+    unpublished = store.count("day > ?", (today.isoformat(),))
+    # a date with a UTC offset can fall on the next UTC day, so the day before
+    # today may still hold the next log
+    upcoming = store.count("day >= ?", ((today - timedelta(days=1)).isoformat(),))
+    next_log_utc = compute_next_log_utc(logs[:upcoming])
+    return LogStoreView(store, unpublished, len(logs) - unpublished), next_log_utc
+
+
+def group_store_disruptions(logs_sorted: LogStoreView, warnings: list[str] | None = None):
+    """stage_group_disruptions for the published view of a SqliteLogStore."""
+    store, first = logs_sorted.store, logs_sorted.start
+    names = {}
+    for d_slug, d_name in store.query(
+        "SELECT disruption_slug, disruption_name FROM logs WHERE rank >= ? AND disruption_slug IN ("
+        "SELECT disruption_slug FROM logs WHERE rank >= ? AND disruption_slug != '' "
+        "GROUP BY disruption_slug HAVING COUNT(DISTINCT disruption_name) > 1) ORDER BY rank",
+        (first, first),
+    ):
+        first_name = names.setdefault(d_slug, d_name)
+        if first_name != d_name:
+            warning = f"WARNING: slug collision '{d_slug}': '{first_name}' vs '{d_name}'"
+            if warnings is None:
+                print(warning)
+            else:
+                warnings.append(warning)
+
+    disruptions = {}
+    # the bare columns come from the row holding MIN(rank): each disruption's newest published log
+    for d_slug, d_name, d_start, count, _ in store.query(
+        "SELECT disruption_slug, disruption_name, disruption_rank, COUNT(*), MIN(rank) FROM logs "
+        "WHERE rank >= ? AND disruption_slug != '' GROUP BY disruption_slug ORDER BY MIN(rank)",
+        (first,),
+    ):
+        disruptions[d_slug] = {"name": d_name, "logs": LogStoreView(store, d_start, count, d_slug)}
+    return disruptions, list(disruptions)
 
-    t_node_path = ROOT / "template-disruption.html"
-    t_node = read_text(t_node_path) if t_node_path.exists() else None
 
+def stage_load_templates(base_url: str = ""):
+    t_log = CompiledTemplate(read_text(ROOT / "template-log.html"), "template-log.html", base_url)
+    t_index = CompiledTemplate(read_text(ROOT / "template-index.html"), "template-index.html", base_url)
+
+    t_node_path = ROOT / "template-disruption.html"
     t_series_path = ROOT / "template-series.html"
-    if t_node is None and t_series_path.exists():
-        t_node = read_text(t_series_path)
+    if t_node_path.exists():
+        t_node = CompiledTemplate(read_text(t_node_path), t_node_path.name, base_url)
+    elif t_series_path.exists():
+        t_node = CompiledTemplate(read_text(t_series_path), t_series_path.name, base_url)
+    else:
+        t_node = CompiledTemplate(FALLBACK_DISRUPTION_TEMPLATE, "FALLBACK_DISRUPTION_TEMPLATE", base_url)
 
     return t_log, t_index, t_node
 
 
-def stage_prepare_templates_and_css():
+def stage_prepare_templates_and_css(base_url: str = ""):
     # Backward-compatible wrapper for the previous stage name.
-    return stage_load_templates()
+    return stage_load_templates(base_url)
+
+
+def nav_link_text(prefix: str, target_log: LogRecord) -> str:
+    if not SHOW_PREV_NEXT_TITLES_IN_TEXT:
+        return prefix
+    return f"{prefix}: {target_log.title.strip()}"
+
+
+def compose_log_seo(log: LogRecord) -> tuple[str, str]:
+    seo_title = f"LOG {log.id} // {log.entry_title} | OX500"
+    seo_description = first_line(f"DISRUPTION {log.disruption_title}. {log.text_head}", SEO_DESCRIPTION_MAX_CHARS)
+    return seo_title, seo_description
+
+
+def compose_disruption_seo(d_name: str, d_logs: list[LogRecord]) -> tuple[str, str]:
+    count = len(d_logs)
+    active_log_id = d_logs[0].id if d_logs else ""
+    active_log_text = d_logs[0].text_head if d_logs else ""
+    page_title = f"DISRUPTION // {d_name} [{count}] | OX500"
+    description = first_line(
+        f"Disruption node {d_name} with {count} logs. Latest LOG {active_log_id}: {active_log_text}",
+        SEO_DESCRIPTION_MAX_CHARS,
+    )
+    return page_title, description
+
+
+def log_text_html(log: LogRecord) -> str:
+    """format_log_text of the log's text; keyed by its digest, so a cache hit never loads the text."""
+    return cached_fragment("log-text-html", log.text_digest, lambda: format_log_text(log.text))
+
+
+def log_text_plain(log: LogRecord) -> str:
+    return cached_fragment("log-text-plain", log.text_digest, lambda: " ".join(log.text.split()))
+
+
+# =========================================================
+# PAGE RENDER WORKERS
+# =========================================================
+_RENDER_WORKER_STATE: dict = {}
+
+
+def _init_render_worker(
+    render_fn, state: dict, fragment_cache: FragmentCache | None = None, output_root: Path | None = None
+) -> None:
+    if output_root is not None:
+        set_output_root(output_root)
+    _RENDER_WORKER_STATE["fn"] = render_fn
+    _RENDER_WORKER_STATE["state"] = state
+    use_fragment_cache(fragment_cache)
+
+
+def _run_render_chunk(chunk: list) -> tuple:
+    """Render one chunk in a worker; returns the chunk's StageCounters as a tuple."""
+    render_fn = _RENDER_WORKER_STATE["fn"]
+    state = _RENDER_WORKER_STATE["state"]
+    counters = StageCounters()
+    _STAGE_COUNTERS.current = counters
+    started = time.process_time()
+    try:
+        with OutputWriter():
+            for job in chunk:
+                render_fn(state, job)
+    finally:
+        _STAGE_COUNTERS.current = None
+    counters.worker_cpu_seconds = time.process_time() - started
+    return astuple(counters)
+
+
+def run_render_jobs(
+    render_fn,
+    jobs: list,
+    state: dict,
+    workers: int = 1,
+    profile_path: Path | None = None,
+) -> None:
+    """
+    Run render_fn(state, job) for every job. With workers > 1 the jobs are split
+    into chunks and rendered by a process pool; each worker receives state once.
+    With profile_path the jobs run in this process under cProfile instead.
+    """
+    if profile_path is not None:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            for job in jobs:
+                render_fn(state, job)
+        finally:
+            profiler.disable()
+        write_profile(profiler, profile_path)
+        return
+
+    if workers <= 1 or len(jobs) <= RENDER_CHUNK_SIZE:
+        for job in jobs:
+            render_fn(state, job)
+        return
+
+    chunks = [jobs[start:start + RENDER_CHUNK_SIZE] for start in range(0, len(jobs), RENDER_CHUNK_SIZE)]
+    # spawn, not fork: the stage scheduler may be running other threads at this point
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_render_worker,
+        initargs=(render_fn, state, _FRAGMENT_CACHE, DIST),
+    ) as pool:
+        counters = current_stage_counters()
+        for chunk_counters in pool.map(_run_render_chunk, chunks):
+            if counters is not None:
+                counters.add(StageCounters(*chunk_counters))
+
+
+def render_log_page(state: dict, i: int) -> None:
+    logs_sorted = state["logs_sorted"]
+    ctx: SiteContext = state["ctx"]
+    url = state["url"]
+    disruption_rel = state["disruption_rel"]
+
+    log = logs_sorted[i]
+    rel_path = log.rel_path
+    url_path = log.url
+    canonical = f"{ctx.base_url}{url_path}"
+
+    next_log = logs_sorted[i - 1] if i - 1 >= 0 else None
+    prev_log = logs_sorted[i + 1] if i + 1 < len(logs_sorted) else None
+
+    nav_parts = ['<a class="nav-home" href="/" rel="home"><- CORE INTERFACE</a>']
+    if prev_log:
+        nav_parts.append(
+            f'<span>|</span>\n                  '
+            f'<a class="nav-prev" href="{prev_log.url}" '
+            f'rel="prev" title="LOG {prev_log.id} // {esc(prev_log.title)}">'
+            f'{nav_link_text("PREV", prev_log)}</a>'
+        )
+    if next_log:
+        nav_parts.append(
+            f'<span>|</span>\n                  '
+            f'<a class="nav-next" href="{next_log.url}" '
+            f'rel="next" title="LOG {next_log.id} // {esc(next_log.title)}">'
+            f'{nav_link_text("NEXT", next_log)}</a>'
+        )
+    full_nav = '\n                  '.join(nav_parts)
+
+    disruption_name, disruption_slug_value = log.disruption_name, log.disruption_slug
+    node_meta = ""
+    if disruption_slug_value:
+        d_path = url(disruption_rel(disruption_slug_value))
+        node_meta = f'NODE: <a href="{d_path}" rel="up">{esc(disruption_name)}</a> | '
+
+    entry_title = log.entry_title
+    disruption_label = log.disruption_title
+    seo_title, seo_description = compose_log_seo(log)
+    previous_log_text_plain = log_text_plain(prev_log) if prev_log else ""
+    latest_log_prev_url = prev_log.url if prev_log else ""
+    latest_log_prev_attrs = "" if prev_log else 'aria-disabled="true" tabindex="-1"'
+    disruption_url = canonical
+    if disruption_slug_value:
+        disruption_url = f"{ctx.base_url}{url(disruption_rel(disruption_slug_value))}"
+
+    page_context = f"log_id={log.id} output={rel_path.as_posix()}"
+    template: CompiledTemplate = state["template"]
+    page = template.render(
+        {
+            "LANG": ctx.lang,
+            "SEO_TITLE": esc(seo_title),
+            "SEO_DESCRIPTION": esc(seo_description),
+            "SEO_CANONICAL": canonical,
+            "OG_TITLE": esc(seo_title),
+            "OG_DESC": esc(seo_description),
+            "OG_IMAGE": ctx.og_image,
+            "JSONLD": cached_fragment(
+                "jsonld-log",
+                (ctx.base_url, url_path, log.id, entry_title, log.text_digest, log.date, disruption_label, disruption_url, ctx.og_image),
+                lambda: jsonld_log_creative_work(
+                    ctx.base_url,
+                    url_path,
+                    log.id,
+                    entry_title,
+                    log.text,
+                    log.date,
+                    disruption_label,
+                    disruption_url,
+                    ctx.og_image,
+                ),
+            ),
+            "LOG_ID": esc(log.id),
+            "LOG_TITLE": esc(log.title),
+            "LOG_DATE": esc(log.date),
+            "LOG_TEXT": log_text_html(log),
+            "RECENT_LOGS": state["recent_logs"],
+            "DISRUPTION_NODES": state["disruption_nodes"],
+            "NEXT_LOG_UTC": state["next_log_utc"],
+            "LATEST_LOG_DISRUPTION_TITLE": esc(disruption_label),
+            "LATEST_LOG_ENTRY_TITLE": esc(entry_title),
+            "LATEST_LOG_URL": url_path,
+            "LATEST_LOG_PREV_URL": latest_log_prev_url,
+            "LATEST_LOG_PREV_ATTRS": latest_log_prev_attrs,
+            "PREVIOUS_LOG_TEXT_PLAIN": esc(previous_log_text_plain),
+            "SYSTEM_CORE_START_UTC": esc(ctx.core_start),
+            "AVAILABLE_COUNT": ctx.available_count,
+            "SYS_VER": esc(ctx.sys_ver),
+            "SENSOR_LABEL": "SENSOR DRIFT VECTOR",
+            "SENSOR_CODE": state["sensor_code"],
+            "SYSTEM_AGE_DAYS_AT_EVENT": esc(log.system_age_days),
+            "CURRENT_LOG_ID": esc(log.id),
+            "LOG_MODE": esc(log.mode),
+            "LOG_STATE": esc(log.status),
+            "NODE_META": node_meta,
+            "FULL_NAV": full_nav,
+            "YOUTUBE": ctx.youtube,
+            "BANDCAMP": ctx.bandcamp,
+            "GITHUB": ctx.github_repo,
+            "BASE_URL": ctx.base_url,
+            "ASSET_VERSION": ctx.asset_version,
+            "ASSET_CSS_URL": ctx.asset_css_url,
+            "ASSET_JS_URL": ctx.asset_js_url,
+            "DATA_MANIFEST_URL": ctx.data_manifest_url,
+            "ROBOTS_META": ctx.robots_meta,
+        },
+        context=page_context,
+    )
+    write_text(DIST / rel_path, page, context=page_context)
+
+
+def render_disruption_page(state: dict, d_slug: str) -> None:
+    ctx: SiteContext = state["ctx"]
+    url = state["url"]
+    disruption_rel = state["disruption_rel"]
+
+    d = state["disruptions"][d_slug]
+    d_name = d["name"]
+    d_logs = d["logs"]
+    count = len(d_logs)
+    newest_date = d_logs[0].date
+
+    rel_path = disruption_rel(d_slug)
+    url_path = url(rel_path)
+    canonical = f"{ctx.base_url}{url_path}"
+
+    node_list = []
+    for log in d_logs:
+        node_list.append(make_log_line_link(log.url, f"LOG: {log.id}", log.title))
+
+    active_log = d_logs[0]
+    active_log_id = active_log.id
+    active_log_date = active_log.date
+    active_log_title = active_log.entry_title
+    active_log_text = log_text_html(active_log)
+    page_title, description = compose_disruption_seo(d_name, d_logs)
+    jsonld_items = [
+        {
+            "name": f"LOG {log.id} // {log.entry_title}",
+            "url": f"{ctx.base_url}{log.url}",
+        }
+        for log in d_logs[:50]
+    ]
+
+    page_context = f"disruption_slug={d_slug} output={rel_path.as_posix()}"
+    template: CompiledTemplate = state["template"]
+    node_page = template.render(
+        {
+            "LANG": ctx.lang,
+            "SYSTEM_CORE_START_UTC": esc(ctx.core_start),
+            "SYS_VER": esc(ctx.sys_ver),
+            "AVAILABLE_COUNT": ctx.available_count,
+            "PAGE_TITLE": esc(page_title),
+            "DESCRIPTION": esc(description),
+            "CANONICAL": canonical,
+            "OG_TITLE": esc(page_title),
+            "OG_DESC": esc(description),
+            "OG_IMAGE": ctx.og_image,
+            "JSONLD": cached_fragment(
+                "jsonld-disruption",
+                (ctx.base_url, url_path, d_name, newest_date, ctx.og_image, ctx.github_repo, jsonld_items),
+                lambda: jsonld_disruption_node(
+                    ctx.base_url,
+                    url_path,
+                    d_name,
+                    newest_date,
+                    ctx.og_image,
+                    ctx.github_repo,
+                    log_items=jsonld_items,
+                ),
+            ),
+            "H1": esc(f"DISRUPTION // {d_name} [{count}]"),
+            "META": esc(f"OX500 // DISRUPTION_FEED | NODE | LOGS: {count}"),
+            "CURRENT_LOG_ID": esc(active_log_id),
+            "ACTIVE_LOG_ID": esc(active_log_id),
+            "ACTIVE_LOG_DATE": esc(active_log_date),
+            "ACTIVE_LOG_TEXT": active_log_text,
+            "ACTIVE_DISRUPTION_TITLE": esc(d_name),
+            "ACTIVE_LOG_ENTRY_TITLE": esc(active_log_title),
+            "DISRUPTION_LOG_COUNT": esc(str(count)),
+            "NODE_LOG_LIST": "\n".join(node_list),
+            "RECENT_LOGS": state["recent_logs"],
+            "DISRUPTION_NODES": state["disruption_nodes"],
+            "NEXT_LOG_UTC": state["next_log_utc"],
+            "YOUTUBE": ctx.youtube,
+            "BANDCAMP": ctx.bandcamp,
+            "GITHUB": ctx.github_repo,
+            "BASE_URL": ctx.base_url,
+            "SENSOR_LABEL": "SENSOR DRIFT VECTOR",
+            "SENSOR_CODE": state["sensor_code"],
+            "ASSET_VERSION": ctx.asset_version,
+            "ASSET_CSS_URL": ctx.asset_css_url,
+            "ASSET_JS_URL": ctx.asset_js_url,
+            "DATA_MANIFEST_URL": ctx.data_manifest_url,
+            "ROBOTS_META": ctx.robots_meta,
+        },
+        context=page_context,
+    )
+    write_text(DIST / rel_path, node_page, context=page_context)
 
 
 # =========================================================
 # BUILD PIPELINE
 # =========================================================
-def stage_group_disruptions(logs_sorted: list):
+def stage_prepare_logs(logs: list[LogRecord]) -> tuple[list[LogRecord], str]:
+    """Drop future-dated logs and sort newest first; also returns the next log time."""
+    if isinstance(logs, LogStoreView):
+        return prepare_store_logs(logs, utc_today())
+    logs_sorted_all = sorted(logs, key=lambda x: x.id_int, reverse=True)
+    next_log_utc = compute_next_log_utc(logs_sorted_all)
+
+    # ===== FILTER OUT FUTURE-DATED LOGS (do not generate/publish yet) =====
+    today = utc_today()
+    # newest first
+    logs_sorted = [log for log in logs_sorted_all if log.date_obj <= today]
+    return logs_sorted, next_log_utc
+
+
+def stage_group_disruptions(logs_sorted: list, warnings: list[str] | None = None):
+    """With a warnings list, slug collision warnings are collected there instead of printed."""
+    if isinstance(logs_sorted, LogStoreView):
+        return group_store_disruptions(logs_sorted, warnings)
     disruptions = {}
     for log in logs_sorted:
-        raw = (log.get("series") or log.get("disruption") or "").strip()
-        if not raw:
+        if not log.disruption_slug:
             continue
-        d_name = disruption_display_name(raw)
-        d_slug = disruption_slug(raw)
+        d_name = log.disruption_name
+        d_slug = log.disruption_slug
         if d_slug in disruptions and disruptions[d_slug]["name"] != d_name:
-            print(f"WARNING: slug collision '{d_slug}': '{disruptions[d_slug]['name']}' vs '{d_name}'")
+            warning = f"WARNING: slug collision '{d_slug}': '{disruptions[d_slug]['name']}' vs '{d_name}'"
+            if warnings is None:
+                print(warning)
+            else:
+                warnings.append(warning)
         disruptions.setdefault(d_slug, {"name": d_name, "logs": []})
         disruptions[d_slug]["logs"].append(log)
 
     disruption_order = sorted(
         disruptions.keys(),
-        key=lambda k: disruptions[k]["logs"][0]["_id_int"],
+        key=lambda k: disruptions[k]["logs"][0].id_int,
         reverse=True,
     )
     return disruptions, disruption_order
@@ -1080,75 +3383,36 @@ def stage_build_log_pages(
     logs_sorted: list,
     disruptions: dict,
     disruption_order: list,
-    t_log: str,
+    t_log: CompiledTemplate,
     ctx: SiteContext,
     next_log_utc: str,
     seo_registry: dict,
     seo_warnings: list[str],
     seo_infos: list[str],
-    rel,
     url,
     disruption_rel,
     sitemap_entries: list,
+    manifest: BuildManifest,
+    jobs: int = 1,
+    profile_path: Path | None = None,
+    shared_fragments: bool = False,
 ) -> None:
-    def nav_text(prefix: str, target_log: dict) -> str:
-        if not SHOW_PREV_NEXT_TITLES_IN_TEXT:
-            return prefix
-        return f'{prefix}: {target_log.get("title", "").strip()}'
-
-    recent_logs_markup = make_recent_logs_markup(logs_sorted, rel, url)
-    disruption_nodes_markup = make_disruption_nodes_markup(disruption_order, disruptions, disruption_rel, url)
-    sensor_label = "SENSOR DRIFT VECTOR"
-    sensor_code = derive_sensor_code(ctx.asset_version)
+    ctx, next_log_utc, recent_logs, disruption_nodes = resolve_page_fragments(
+        logs_sorted, disruption_order, disruptions, ctx, next_log_utc, url, disruption_rel, shared_fragments
+    )
+    shared_inputs = hash_inputs(t_log.source, astuple(ctx), next_log_utc, recent_logs, disruption_nodes)
 
+    pending = []
     for i, log in enumerate(logs_sorted):
-        rel_path = rel(log)
-        url_path = url(rel_path)
-        canonical = f"{ctx.base_url}{url_path}"
-
+        rel_path = log.rel_path
+        canonical = f"{ctx.base_url}{log.url}"
         next_log = logs_sorted[i - 1] if i - 1 >= 0 else None
         prev_log = logs_sorted[i + 1] if i + 1 < len(logs_sorted) else None
-
-        nav_parts = ['<a class="nav-home" href="/" rel="home"><- CORE INTERFACE</a>']
-        if prev_log:
-            nav_parts.append(
-                f'<span>|</span>\n                  '
-                f'<a class="nav-prev" href="{url(rel(prev_log))}" '
-                f'rel="prev" title="LOG {prev_log["id"]} // {esc(prev_log.get("title",""))}">'
-                f'{nav_text("PREV", prev_log)}</a>'
-            )
-        if next_log:
-            nav_parts.append(
-                f'<span>|</span>\n                  '
-                f'<a class="nav-next" href="{url(rel(next_log))}" '
-                f'rel="next" title="LOG {next_log["id"]} // {esc(next_log.get("title",""))}">'
-                f'{nav_text("NEXT", next_log)}</a>'
-            )
-        full_nav = '\n                  '.join(nav_parts)
-
-        disruption_name, disruption_slug_value = extract_disruption_identity(log)
-        node_meta = ""
-        if disruption_slug_value:
-            d_path = url(disruption_rel(disruption_slug_value))
-            node_meta = f'NODE: <a href="{d_path}" rel="up">{esc(disruption_name)}</a> | '
-
-        ui_state = log.get("ui_state") if isinstance(log.get("ui_state"), dict) else {}
-        log_mode = str(ui_state.get("mode") or "READ_ONLY")
-        log_state = str(ui_state.get("status") or "SYSTEM_PARTIAL")
-        entry_title = derive_mobile_log_entry_title(log)
-        disruption_label = derive_mobile_disruption_title(log)
-        seo_title = f"LOG {log['id']} // {entry_title} | OX500"
-        seo_description = first_line(f"DISRUPTION {disruption_label}. {log.get('text', '')}", 155)
-        previous_log_text_plain = " ".join(str(prev_log.get("text", "")).split()) if prev_log else ""
-        latest_log_prev_url = url(rel(prev_log)) if prev_log else ""
-        latest_log_prev_attrs = "" if prev_log else 'aria-disabled="true" tabindex="-1"'
-        disruption_url = canonical
-        if disruption_slug_value:
-            disruption_url = f"{ctx.base_url}{url(disruption_rel(disruption_slug_value))}"
+        seo_title, seo_description = compose_log_seo(log)
 
         register_seo_entry(
             seo_registry,
-            page_key=f"log:{log['id']}",
+            page_key=f"log:{log.id}",
             title=seo_title,
             description=seo_description,
             canonical=canonical,
@@ -1156,7 +3420,7 @@ def stage_build_log_pages(
         audit_seo_heuristics(
             warnings=seo_warnings,
             infos=seo_infos,
-            page_key=f"log:{log['id']}",
+            page_key=f"log:{log.id}",
             title=seo_title,
             description=seo_description,
             canonical=canonical,
@@ -1165,126 +3429,62 @@ def stage_build_log_pages(
             og_url=canonical,
             og_image=ctx.og_image,
         )
+        sitemap_entries.append((canonical, log.date))
+        if not manifest.is_current(rel_path, hash_inputs(shared_inputs, log, prev_log, next_log)):
+            pending.append(i)
 
-        page = render(
-            t_log,
-            {
-                "LANG": ctx.lang,
-                "SEO_TITLE": esc(seo_title),
-                "SEO_DESCRIPTION": esc(seo_description),
-                "SEO_CANONICAL": canonical,
-                "OG_TITLE": esc(seo_title),
-                "OG_DESC": esc(seo_description),
-                "OG_IMAGE": ctx.og_image,
-                "JSONLD": jsonld_log_creative_work(
-                    ctx.base_url,
-                    url_path,
-                    str(log["id"]),
-                    entry_title,
-                    str(log.get("text", "")),
-                    str(log.get("date", "")),
-                    disruption_label,
-                    disruption_url,
-                    ctx.og_image,
-                ),
-                "LOG_ID": esc(log["id"]),
-                "LOG_TITLE": esc(log["title"]),
-                "LOG_DATE": esc(log.get("date", "")),
-                "LOG_TEXT": format_log_text(log.get("text", "")),
-                "RECENT_LOGS": "\n".join(recent_logs_markup),
-                "DISRUPTION_NODES": "\n".join(disruption_nodes_markup),
-                "NEXT_LOG_UTC": next_log_utc,
-                "LATEST_LOG_DISRUPTION_TITLE": esc(disruption_label),
-                "LATEST_LOG_ENTRY_TITLE": esc(entry_title),
-                "LATEST_LOG_URL": url_path,
-                "LATEST_LOG_PREV_URL": latest_log_prev_url,
-                "LATEST_LOG_PREV_ATTRS": latest_log_prev_attrs,
-                "PREVIOUS_LOG_TEXT_PLAIN": esc(previous_log_text_plain),
-                "SYSTEM_CORE_START_UTC": esc(ctx.core_start),
-                "AVAILABLE_COUNT": ctx.available_count,
-                "SYS_VER": esc(ctx.sys_ver),
-                "SENSOR_LABEL": sensor_label,
-                "SENSOR_CODE": sensor_code,
-                "SYSTEM_AGE_DAYS_AT_EVENT": esc(log.get("system_age_days_at_event", "")),
-                "CURRENT_LOG_ID": esc(log["id"]),
-                "LOG_MODE": esc(log_mode),
-                "LOG_STATE": esc(log_state),
-                "NODE_META": node_meta,
-                "FULL_NAV": full_nav,
-                "YOUTUBE": ctx.youtube,
-                "BANDCAMP": ctx.bandcamp,
-                "GITHUB": ctx.github_repo,
-                "BASE_URL": ctx.base_url,
-                "ASSET_VERSION": ctx.asset_version,
-                "ROBOTS_META": ctx.robots_meta,
-            },
-            template_name="template-log.html",
-            context=f"log_id={log['id']} output={rel_path.as_posix()}",
-        )
-
-        page = rewrite_css_links(page, ctx.base_url)
-        write_text(DIST / rel_path, page)
-        sitemap_entries.append((canonical, log.get("date", "")))
+    run_render_jobs(
+        render_log_page,
+        pending,
+        {
+            "logs_sorted": logs_sorted,
+            "template": t_log,
+            "ctx": ctx,
+            "next_log_utc": next_log_utc,
+            "recent_logs": recent_logs,
+            "disruption_nodes": disruption_nodes,
+            "sensor_code": derive_sensor_code(ctx.asset_version),
+            "url": url,
+            "disruption_rel": disruption_rel,
+        },
+        workers=jobs,
+        profile_path=profile_path,
+    )
 
 
 def stage_build_disruption_pages(
     logs_sorted: list,
     disruption_order: list,
     disruptions: dict,
-    t_node: str,
+    t_node: CompiledTemplate,
     ctx: SiteContext,
     next_log_utc: str,
     seo_registry: dict,
     seo_warnings: list[str],
     seo_infos: list[str],
-    rel,
     url,
     disruption_rel,
     sitemap_entries: list,
+    manifest: BuildManifest,
+    jobs: int = 1,
+    profile_path: Path | None = None,
+    shared_fragments: bool = False,
 ) -> None:
-    node_template = t_node or FALLBACK_DISRUPTION_TEMPLATE
-    if t_node:
-        if (ROOT / "template-disruption.html").exists():
-            node_template_name = "template-disruption.html"
-        elif (ROOT / "template-series.html").exists():
-            node_template_name = "template-series.html"
-        else:
-            node_template_name = "template-disruption-inline"
-    else:
-        node_template_name = "FALLBACK_DISRUPTION_TEMPLATE"
-
-    recent_logs_markup = make_recent_logs_markup(logs_sorted, rel, url)
-    disruption_nodes_markup = make_disruption_nodes_markup(disruption_order, disruptions, disruption_rel, url)
-    sensor_label = "SENSOR DRIFT VECTOR"
-    sensor_code = derive_sensor_code(ctx.asset_version)
+    ctx, next_log_utc, recent_logs, disruption_nodes = resolve_page_fragments(
+        logs_sorted, disruption_order, disruptions, ctx, next_log_utc, url, disruption_rel, shared_fragments
+    )
+    shared_inputs = hash_inputs(t_node.source, t_node.name, astuple(ctx), next_log_utc, recent_logs, disruption_nodes)
 
+    pending = []
     for d_slug in disruption_order:
         d = disruptions[d_slug]
         d_name = d["name"]
         d_logs = d["logs"]
-        count = len(d_logs)
-        newest_date = d_logs[0].get("date", utc_today_iso())
-
+        newest_date = d_logs[0].date
         rel_path = disruption_rel(d_slug)
-        url_path = url(rel_path)
-        canonical = f"{ctx.base_url}{url_path}"
-
-        node_list = []
-        for log in d_logs:
-            node_list.append(make_log_line_link(url(rel(log)), f'LOG: {log["id"]}', log.get("title", "")))
-
-        active_log = d_logs[0] if d_logs else {}
-        active_log_id = str(active_log.get("id", ""))
-        active_log_date = str(active_log.get("date", ""))
-        active_log_title = derive_mobile_log_entry_title(active_log) if active_log else "UNTITLED"
-        active_log_text = format_log_text(active_log.get("text", "")) if active_log else ""
-
-        page_title = f"DISRUPTION // {d_name} [{count}] | OX500"
-        description = first_line(
-            f"Disruption node {d_name} with {count} logs. Latest LOG {active_log_id}: {active_log.get('text', '')}",
-            155,
-        )
-        og_desc = description
+        canonical = f"{ctx.base_url}{url(rel_path)}"
+        page_title, description = compose_disruption_seo(d_name, d_logs)
+
         register_seo_entry(
             seo_registry,
             page_key=f"disruption:{d_slug}",
@@ -1300,68 +3500,38 @@ def stage_build_disruption_pages(
             description=description,
             canonical=canonical,
             og_title=page_title,
-            og_description=og_desc,
+            og_description=description,
             og_url=canonical,
             og_image=ctx.og_image,
         )
-
-        node_page = render(
-            node_template,
-            {
-                "LANG": ctx.lang,
-                "SYSTEM_CORE_START_UTC": esc(ctx.core_start),
-                "SYS_VER": esc(ctx.sys_ver),
-                "AVAILABLE_COUNT": ctx.available_count,
-                "PAGE_TITLE": esc(page_title),
-                "DESCRIPTION": esc(description),
-                "CANONICAL": canonical,
-                "OG_TITLE": esc(page_title),
-                "OG_DESC": esc(og_desc),
-                "OG_IMAGE": ctx.og_image,
-                "JSONLD": jsonld_disruption_node(
-                    ctx.base_url,
-                    url_path,
-                    d_name,
-                    newest_date,
-                    ctx.og_image,
-                    ctx.github_repo,
-                    log_items=[
-                        {
-                            "name": f'LOG {log["id"]} // {derive_mobile_log_entry_title(log)}',
-                            "url": f'{ctx.base_url}{url(rel(log))}',
-                        }
-                        for log in d_logs[:50]
-                    ],
-                ),
-                "H1": esc(f"DISRUPTION // {d_name} [{count}]"),
-                "META": esc(f"OX500 // DISRUPTION_FEED | NODE | LOGS: {count}"),
-                "CURRENT_LOG_ID": esc(active_log_id),
-                "ACTIVE_LOG_ID": esc(active_log_id),
-                "ACTIVE_LOG_DATE": esc(active_log_date),
-                "ACTIVE_LOG_TEXT": active_log_text,
-                "ACTIVE_DISRUPTION_TITLE": esc(d_name),
-                "ACTIVE_LOG_ENTRY_TITLE": esc(active_log_title),
-                "DISRUPTION_LOG_COUNT": esc(str(count)),
-                "NODE_LOG_LIST": "\n".join(node_list),
-                "RECENT_LOGS": "\n".join(recent_logs_markup),
-                "DISRUPTION_NODES": "\n".join(disruption_nodes_markup),
-                "NEXT_LOG_UTC": next_log_utc,
-                "YOUTUBE": ctx.youtube,
-                "BANDCAMP": ctx.bandcamp,
-                "GITHUB": ctx.github_repo,
-                "BASE_URL": ctx.base_url,
-                "SENSOR_LABEL": sensor_label,
-                "SENSOR_CODE": sensor_code,
-                "ASSET_VERSION": ctx.asset_version,
-                "ROBOTS_META": ctx.robots_meta,
-            },
-            template_name=node_template_name,
-            context=f"disruption_slug={d_slug} output={rel_path.as_posix()}",
+        sitemap_entries.append((canonical, newest_date))
+        node_inputs = hash_inputs(
+            shared_inputs,
+            d_slug,
+            d_name,
+            d_logs[0],
+            [(log.id, log.title, log.date, log.slug) for log in d_logs],
         )
+        if not manifest.is_current(rel_path, node_inputs):
+            pending.append(d_slug)
 
-        node_page = rewrite_css_links(node_page, ctx.base_url)
-        write_text(DIST / rel_path, node_page)
-        sitemap_entries.append((canonical, newest_date))
+    run_render_jobs(
+        render_disruption_page,
+        pending,
+        {
+            "disruptions": disruptions,
+            "template": t_node,
+            "ctx": ctx,
+            "next_log_utc": next_log_utc,
+            "recent_logs": recent_logs,
+            "disruption_nodes": disruption_nodes,
+            "sensor_code": derive_sensor_code(ctx.asset_version),
+            "url": url,
+            "disruption_rel": disruption_rel,
+        },
+        workers=jobs,
+        profile_path=profile_path,
+    )
 
 
 def compose_home_view_models(
@@ -1369,7 +3539,6 @@ def compose_home_view_models(
     disruptions: dict,
     disruption_order: list,
     ctx: SiteContext,
-    rel,
     url,
     disruption_rel,
 ) -> dict:
@@ -1386,17 +3555,17 @@ def compose_home_view_models(
     previous_log_text_plain = ""
 
     if latest_log:
-        latest_log_id = esc(latest_log["id"])
-        latest_log_date = esc(latest_log.get("date", ""))
-        latest_log_text = format_log_text(latest_log.get("text", ""))
-        latest_log_disruption_title = esc(derive_mobile_disruption_title(latest_log))
-        latest_log_entry_title = esc(derive_mobile_log_entry_title(latest_log))
-        latest_log_url = url(rel(latest_log))
+        latest_log_id = esc(latest_log.id)
+        latest_log_date = esc(latest_log.date)
+        latest_log_text = log_text_html(latest_log)
+        latest_log_disruption_title = esc(latest_log.disruption_title)
+        latest_log_entry_title = esc(latest_log.entry_title)
+        latest_log_url = latest_log.url
         older_log = logs_sorted[1] if len(logs_sorted) > 1 else None
         if older_log:
-            latest_log_prev_url = url(rel(older_log))
+            latest_log_prev_url = older_log.url
             latest_log_prev_attrs = ""
-            previous_log_text_plain = " ".join(str(older_log.get("text", "")).split())
+            previous_log_text_plain = log_text_plain(older_log)
 
     blocks = []
     recent_logs = []
@@ -1405,8 +3574,8 @@ def compose_home_view_models(
     disruptions_nav_payload = []
 
     for log in logs_sorted[:6]:
-        up = url(rel(log))
-        raw_title = str(log.get("title", ""))
+        up = log.url
+        raw_title = log.title
         title = re.sub(r"^LOG\s+\d+\s*//\s*", "", raw_title, flags=re.IGNORECASE).strip()
         recent_logs.append(make_log_line_link(up, "//", title or raw_title, extra_class="naked"))
 
@@ -1420,7 +3589,7 @@ def compose_home_view_models(
 
         preview = []
         for log in d_logs[:HOME_DISRUPTION_PREVIEW_LOGS]:
-            preview.append(make_log_line_link(url(rel(log)), f'LOG: {log["id"]}', log.get("title", "")))
+            preview.append(make_log_line_link(log.url, f"LOG: {log.id}", log.title))
 
         blocks.append(
             f'''<details class="log-entry"{open_attr}>
@@ -1462,7 +3631,7 @@ def compose_home_view_models(
     for d_slug in disruption_order[:HOME_DISRUPTION_LIMIT]:
         d = disruptions[d_slug]
         d_name = d["name"]
-        newest_date = d["logs"][0].get("date", utc_today_iso())
+        newest_date = d["logs"][0].date
         node_url = url(disruption_rel(d_slug))
         disruption_series_parts.append(
             {
@@ -1504,61 +3673,234 @@ def compose_home_view_models(
     }
 
 
-def stage_export_json_data(logs_sorted: list, disruptions_nav_payload: list, rel, url) -> None:
+def log_nav_payload(log: LogRecord) -> dict:
+    """A log's entry in data/logs-page-N.json: enough to list, search by title and link it."""
+    return {
+        "id": log.id,
+        "title": log.title,
+        "date": log.date,
+        "url": log.url,
+        "tag": log.tag,
+        "disruption_title_clean": log.disruption_name,
+        "disruption_slug_clean": log.disruption_slug,
+    }
+
+
+def log_text_payload(log: LogRecord) -> dict:
+    """A log's body in data/logs-text-N.json, the shard for the nav page listing it."""
+    return {"text": log.text, "excerpt": log.excerpt}
+
+
+def legacy_log_entry_extra(log: LogRecord) -> int:
+    """Bytes a log's entry carried before the split beyond log_nav_payload; only measured, never written."""
+    return (
+        json_member_size("slug", log.slug)
+        + json_member_size("series", log.series)
+        + json_member_size("text", log.text)
+        + json_member_size("excerpt", log.excerpt)
+    )
+
+
+def stage_export_json_data(
+    logs_sorted: list,
+    disruptions_nav_payload: list,
+    manifest: BuildManifest,
+    disruptions: dict | None = None,
+    pagination: str = "newest-first",
+    hash_data: bool = False,
+    listed_files: dict[str, str] | None = None,
+) -> None:
+    """
+    Write the paginated disruption and log indexes under data/, named by
+    content hash with hash_data (see DataFiles). With
+    pagination="oldest-anchored", log pages are fixed to id ranges (see
+    iter_anchored_log_chunks) and disruptions are listed in the order they
+    first appeared, which needs disruptions; each meta file then names its
+    head page, and the logs meta the pages a new log can no longer change.
+    listed_files are data files written by other stages (site-state.json)
+    that data/manifest.json must list as well.
+    """
+    if pagination not in DATA_PAGINATIONS:
+        raise ValueError(f"unknown pagination '{pagination}' (expected one of {', '.join(DATA_PAGINATIONS)})")
+    anchored = pagination == "oldest-anchored"
+    data_files = DataFiles(content_hashed=hash_data)
+
     disruption_page_size = DISRUPTION_INDEX_PAGE_SIZE
+    disruption_meta = {}
+    if anchored:
+        first_ids = {slug: d["logs"][-1].id_int for slug, d in disruptions.items()}
+        disruptions_nav_payload = sorted(disruptions_nav_payload, key=lambda item: first_ids[item["slug"]])
     disruption_total_pages = write_paginated_json_files(
         items=disruptions_nav_payload,
         page_size=disruption_page_size,
         file_prefix="disruptions",
+        manifest=manifest,
+        data_files=data_files,
     )
-    write_json(
-        DIST / "data" / "disruptions-pages-meta.json",
+    if anchored:
+        # a disruption's count still changes its page, so no page is promised to stay as it is
+        disruption_meta = {"order": pagination, "head_page": disruption_total_pages}
+    data_files.write(
+        "disruptions-pages-meta.json",
         {
             "page_size": disruption_page_size,
             "total_pages": disruption_total_pages,
             "total_items": len(disruptions_nav_payload),
             "total_unique_disruptions": len(disruptions_nav_payload),
+            **disruption_meta,
         },
+        manifest,
     )
 
+    # titles and links go in the nav pages, bodies in a text shard per page fetched on demand
     logs_page_size = LOG_INDEX_PAGE_SIZE
-    logs_nav_payload = []
-    for log in logs_sorted:
-        rel_path = rel(log)
-        disruption_title_clean, disruption_slug_clean = extract_disruption_identity(log)
-        logs_nav_payload.append(
-            {
-                "id": str(log.get("id", "")),
-                "title": str(log.get("title", "")),
-                "date": str(log.get("date", "")),
-                "slug": str(log.get("slug", "")),
-                "url": url(rel_path),
-                "tag": str(log.get("tag", "")),
-                "series": str(log.get("series") or log.get("disruption") or ""),
-                "text": str(log.get("text", "")),
-                "excerpt": str(log.get("excerpt", "")),
-                "disruption_title_clean": disruption_title_clean,
-                "disruption_slug_clean": disruption_slug_clean,
-            }
+    log_chunks = (iter_anchored_log_chunks if anchored else iter_page_chunks)(logs_sorted, logs_page_size)
+    page_of = {}
+    page_nums = []
+    nav_bytes = text_bytes = legacy_extra_bytes = 0
+    for page_num, chunk in log_chunks:
+        page_nums.append(page_num)
+        page_of.update(dict.fromkeys((log.id for log in chunk), page_num))
+        nav_bytes += data_files.write(
+            f"logs-page-{page_num}.json", [log_nav_payload(log) for log in chunk], manifest
         )
-
-    logs_total_pages = write_paginated_json_files(
-        items=logs_nav_payload,
-        page_size=logs_page_size,
-        file_prefix="logs",
+        text_bytes += data_files.write(
+            f"logs-text-{page_num}.json", {log.id: log_text_payload(log) for log in chunk}, manifest
+        )
+        legacy_extra_bytes += sum(legacy_log_entry_extra(log) for log in chunk)
+    legacy_bytes = nav_bytes + legacy_extra_bytes
+    print(
+        f"Logs data OK — nav index {nav_bytes / 1024:.1f} kB in {len(page_nums)} {pagination} pages, "
+        f"{legacy_extra_bytes / 1024:.1f} kB less than with bodies "
+        f"({legacy_extra_bytes * 100 / max(legacy_bytes, 1):.0f}% saved); text shards {text_bytes / 1024:.1f} kB"
     )
-    write_json(
-        DIST / "data" / "logs-pages-meta.json",
+    logs_meta = {}
+    if anchored and page_nums:
+        logs_meta = {
+            "order": pagination,
+            "first_page": page_nums[0],
+            "head_page": page_nums[-1],
+            "immutable_pages": page_nums[:-1],
+        }
+    data_files.write(
+        "logs-pages-meta.json",
         {
             "page_size": logs_page_size,
-            "total_pages": logs_total_pages,
-            "total_items": len(logs_nav_payload),
+            "total_pages": len(page_nums),
+            "total_items": len(logs_sorted),
+            **logs_meta,
+        },
+        manifest,
+    )
+    write_delta_feed(logs_sorted[:DELTA_FEED_CHECKPOINTS], page_of, len(logs_sorted), manifest)
+    if disruptions is not None:
+        write_disruption_data(disruptions, page_of, pagination, manifest, data_files)
+    data_files.files.update(listed_files or {})
+    data_files.write_manifest(manifest)
+
+
+def write_disruption_data(
+    disruptions: dict,
+    page_of: dict,
+    pagination: str,
+    manifest: BuildManifest,
+    data_files: DataFiles | None = None,
+) -> None:
+    """
+    Write data/disruption/<slug>-page-N.json for every disruption: its logs'
+    nav entries with the log index page of each, DISRUPTION_LOG_PAGE_SIZE
+    per page, newest first or counted from the oldest like the log index.
+    Each page carries the disruption's name, count and page total, so a
+    node loads with its first page alone unless it has more logs than that.
+    """
+    anchored = pagination == "oldest-anchored"
+    data_files = data_files or DataFiles()
+    page_size = DISRUPTION_LOG_PAGE_SIZE
+    pages = largest = 0
+    for d_slug, d in disruptions.items():
+        d_logs = d["logs"]
+        total_pages = (len(d_logs) + page_size - 1) // page_size
+        head = {
+            "slug": d_slug,
+            "name": d["name"],
+            "count": len(d_logs),
+            "page_size": page_size,
+            "total_pages": total_pages,
+        }
+        if anchored:
+            head.update(order=pagination, head_page=total_pages)
+        chunks = (iter_oldest_anchored_chunks if anchored else iter_page_chunks)(d_logs, page_size)
+        for page_num, chunk in chunks:
+            entries = [{**log_nav_payload(log), "page": page_of[log.id]} for log in chunk]
+            size = data_files.write(
+                f"disruption/{d_slug}-page-{page_num}.json",
+                {**head, "page": page_num, "logs": entries},
+                manifest,
+            )
+            pages += 1
+            largest = max(largest, size)
+    print(f"Disruption data OK — {len(disruptions)} disruptions in {pages} pages (largest {largest} bytes)")
+
+
+def write_delta_feed(feed_logs: list, page_of: dict, total_items: int, manifest: BuildManifest) -> None:
+    """
+    Write data/since/<id>.json for each of the newest logs (feed_logs, newest
+    first): the latest id plus the nav entries of the logs published after
+    <id>, each with the page that lists it. A returning client asks for the
+    newest id it has and gets an empty list when nothing is new; a 404 means
+    it is further behind than DELTA_FEED_CHECKPOINTS and must reload the
+    pages. Files for logs that dropped out of the window are pruned with the
+    other untracked outputs by BuildManifest.prune. They keep their plain
+    names under --hash-data: a client builds the name from the newest id it
+    holds and has to revalidate the answer on every poll anyway.
+    """
+    entries = [{**log_nav_payload(log), "page": page_of[log.id]} for log in feed_logs]
+    largest = 0
+    for i, log in enumerate(feed_logs):
+        size = write_json(
+            DIST / "data" / "since" / f"{log.id}.json",
+            {"since": log.id, "latest_id": feed_logs[0].id, "total_items": total_items, "logs": entries[:i]},
+            manifest,
+        )
+        largest = max(largest, size)
+    print(f"Delta feed OK — {len(feed_logs)} checkpoints in data/since/ (largest {largest} bytes)")
+
+
+def stage_export_site_state(
+    logs_sorted: list,
+    disruptions: dict,
+    disruption_order: list,
+    ctx: SiteContext,
+    next_log_utc: str,
+    url,
+    disruption_rel,
+    manifest: BuildManifest,
+    data_files: DataFiles | None = None,
+) -> dict[str, str]:
+    """
+    Write data/site-state.json through data_files; returns the data files
+    it adds to data/manifest.json, which the export_json stage writes.
+    """
+    data_files = data_files or DataFiles()
+    data_files.write(
+        SITE_STATE_FILE,
+        {
+            "available_count": ctx.available_count,
+            "next_log_utc": next_log_utc,
+            "fragments": {
+                "recent_logs": "\n".join(make_recent_logs_markup(logs_sorted)),
+                "disruption_nodes": "\n".join(
+                    make_disruption_nodes_markup(disruption_order, disruptions, disruption_rel, url)
+                ),
+            },
         },
+        manifest,
     )
+    return data_files.files
 
 
 def stage_render_homepage(
-    t_index: str,
+    t_index: CompiledTemplate,
     ctx: SiteContext,
     home_vm: dict,
     next_log_utc: str,
@@ -1593,8 +3935,7 @@ def stage_render_homepage(
         og_image=ctx.og_image,
     )
 
-    index_html = render(
-        t_index,
+    index_html = t_index.render(
         {
             "LANG": ctx.lang,
             "SYSTEM_CORE_START_UTC": esc(ctx.core_start),
@@ -1625,54 +3966,15 @@ def stage_render_homepage(
             "PREVIOUS_LOG_TEXT_PLAIN": esc(home_vm["previous_log_text_plain"]),
             "NEXT_LOG_UTC": next_log_utc,
             "ASSET_VERSION": ctx.asset_version,
+            "ASSET_CSS_URL": ctx.asset_css_url,
+            "ASSET_JS_URL": ctx.asset_js_url,
+            "DATA_MANIFEST_URL": ctx.data_manifest_url,
             "INLINE_CSS_HOME": inline_css_home,
             "ROBOTS_META": ctx.robots_meta,
         },
-        template_name="template-index.html",
         context="output=index.html",
     )
-    index_html = rewrite_css_links(index_html, ctx.base_url)
-    write_text(DIST / "index.html", index_html)
-
-
-def stage_build_home_and_exports(
-    logs_sorted: list,
-    disruptions: dict,
-    disruption_order: list,
-    t_index: str,
-    ctx: SiteContext,
-    next_log_utc: str,
-    seo_registry: dict,
-    seo_warnings: list[str],
-    seo_infos: list[str],
-    rel,
-    url,
-    disruption_rel,
-) -> None:
-    home_vm = compose_home_view_models(
-        logs_sorted=logs_sorted,
-        disruptions=disruptions,
-        disruption_order=disruption_order,
-        ctx=ctx,
-        rel=rel,
-        url=url,
-        disruption_rel=disruption_rel,
-    )
-    stage_export_json_data(
-        logs_sorted=logs_sorted,
-        disruptions_nav_payload=home_vm["disruptions_nav_payload"],
-        rel=rel,
-        url=url,
-    )
-    stage_render_homepage(
-        t_index=t_index,
-        ctx=ctx,
-        home_vm=home_vm,
-        next_log_utc=next_log_utc,
-        seo_registry=seo_registry,
-        seo_warnings=seo_warnings,
-        seo_infos=seo_infos,
-    )
+    write_text(DIST / "index.html", index_html, context="output=index.html")
 
 
 def stage_write_robots_and_sitemap(base_url: str, logs_sorted: list, sitemap_entries: list, site_mode: str) -> None:
@@ -1688,7 +3990,7 @@ def stage_write_robots_and_sitemap(base_url: str, logs_sorted: list, sitemap_ent
     write_text(DIST / "robots.txt", "\n".join(robots_lines) + "\n")
 
     if logs_sorted:
-        homepage_lastmod = normalize_date(logs_sorted[0].get("date", utc_today_iso()))
+        homepage_lastmod = normalize_date(logs_sorted[0].date)
     else:
         homepage_lastmod = utc_today_iso()
 
@@ -1718,8 +4020,707 @@ def stage_write_robots_and_sitemap(base_url: str, logs_sorted: list, sitemap_ent
     write_text(DIST / "sitemap.xml", "\n".join(parts))
 
 
-def build():
-    stage_prepare_output()
+# =========================================================
+# BUILD INSTRUMENTATION
+# =========================================================
+@dataclass
+class StageCounters:
+    """Output I/O and fragment cache use of one stage, including pages rendered by its worker processes."""
+    files_written: int = 0
+    bytes_written: int = 0
+    minify_bytes_in: int = 0
+    minify_bytes_out: int = 0
+    files_linked: int = 0
+    fragment_hits: int = 0
+    fragment_misses: int = 0
+    fragment_bytes_added: int = 0
+    fragment_page_bytes_added: int = 0
+    worker_cpu_seconds: float = 0.0
+
+    def add(self, other: "StageCounters") -> None:
+        self.files_written += other.files_written
+        self.bytes_written += other.bytes_written
+        self.minify_bytes_in += other.minify_bytes_in
+        self.minify_bytes_out += other.minify_bytes_out
+        self.files_linked += other.files_linked
+        self.fragment_hits += other.fragment_hits
+        self.fragment_misses += other.fragment_misses
+        self.fragment_bytes_added += other.fragment_bytes_added
+        self.fragment_page_bytes_added += other.fragment_page_bytes_added
+        self.worker_cpu_seconds += other.worker_cpu_seconds
+
+
+_STAGE_COUNTERS = threading.local()
+
+
+def current_stage_counters() -> StageCounters | None:
+    return getattr(_STAGE_COUNTERS, "current", None)
+
+
+def utf8_size(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def record_write(size: int, minify_in: int = 0, minify_out: int = 0) -> None:
+    """Attribute one written file to the stage running on this thread (no-op outside stages)."""
+    counters = current_stage_counters()
+    if counters is None:
+        return
+    counters.files_written += 1
+    counters.bytes_written += size
+    counters.minify_bytes_in += minify_in
+    counters.minify_bytes_out += minify_out
+
+
+# =========================================================
+# OUTPUT WRITER
+# =========================================================
+_OUTPUT_WRITER = threading.local()
+
+
+def current_output_writer() -> "OutputWriter | None":
+    return getattr(_OUTPUT_WRITER, "current", None)
+
+
+class OutputWriter:
+    """
+    Writes output files on a small thread pool so that rendering does not wait
+    on the filesystem. As a context manager it becomes this thread's writer:
+    write_text hands files over (minification included) in batches of
+    OUTPUT_WRITER_BATCH and blocks only while OUTPUT_WRITER_QUEUE of them are
+    pending. Each directory is created once.
+    Leaving the block waits for every file, adds the writer threads' counters
+    to the stage's, and raises the first failed write with the page's context.
+    run_stage_graph opens one per stage, render workers one per chunk.
+    """
+
+    def __init__(
+        self,
+        threads: int = OUTPUT_WRITER_THREADS,
+        queue_size: int = OUTPUT_WRITER_QUEUE,
+        batch_size: int = OUTPUT_WRITER_BATCH,
+    ):
+        self._pool = ThreadPoolExecutor(
+            max_workers=threads,
+            thread_name_prefix="output-writer",
+            initializer=self._init_thread,
+        )
+        self._batch_size = batch_size
+        self._batch = []
+        self._slots = threading.BoundedSemaphore(max(1, queue_size // batch_size))
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._made_dirs = set()
+        self._thread_counters = []
+        self._error = None
+        self._previous = None
+
+    def _init_thread(self) -> None:
+        counters = StageCounters()
+        with self._lock:
+            self._thread_counters.append(counters)
+        _STAGE_COUNTERS.current = counters
+
+    def __enter__(self) -> "OutputWriter":
+        self._previous = current_output_writer()
+        _OUTPUT_WRITER.current = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _OUTPUT_WRITER.current = self._previous
+        self.close(raise_errors=exc_type is None)
+
+    def submit(self, path: Path, content: str, context: str | None = None) -> None:
+        if self._error is not None:
+            raise self._error  # stop rendering at the first failed write
+        self._batch.append((path, content, context))
+        if len(self._batch) >= self._batch_size:
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        batch, self._batch = self._batch, []
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(self._write, batch)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending[future] = None
+        future.add_done_callback(self._done)
+
+    def _write(self, batch: list) -> None:
+        for path, content, context in batch:
+            try:
+                write_output_file(path, content, self._made_dirs)
+            except Exception as exc:
+                raise RuntimeError(f"Failed to write output: {exc} | context: {context or f'output={path}'}") from exc
+
+    def _done(self, future) -> None:
+        self._slots.release()
+        with self._lock:
+            self._pending.pop(future, None)
+        if future.exception() is not None and self._error is None:
+            self._error = future.exception()
+
+    def close(self, raise_errors: bool = True) -> None:
+        if self._batch and self._error is None:
+            self._dispatch()
+        # shutdown returns once every write finished and its callback ran
+        self._pool.shutdown(wait=True)
+        counters = current_stage_counters()
+        if counters is not None:
+            for thread_counters in self._thread_counters:
+                counters.add(thread_counters)
+        self._thread_counters.clear()
+        if raise_errors and self._error is not None:
+            raise self._error
+
+
+def write_profile(profiler: cProfile.Profile, path: Path) -> None:
+    """Dump raw cProfile stats to path and a cumulative-time summary next to it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(path)
+    with open(path.with_suffix(".txt"), "w", encoding="utf-8") as f:
+        pstats.Stats(profiler, stream=f).sort_stats("cumulative").print_stats(40)
+    print(f"PROFILE OK — {path.relative_to(ROOT).as_posix()}")
+
+
+def write_build_report(
+    path: Path,
+    options: BuildOptions,
+    runs: list["StageRun"],
+    path_runs: list["StageRun"],
+    archive: dict,
+) -> None:
+    """Machine-readable per-stage telemetry, for tracking stage growth across builds."""
+    totals = StageCounters()
+    for run in runs:
+        totals.add(run.counters)
+    report = {
+        "generated_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "code_version": compute_code_version(),
+        "options": asdict(options),
+        "archive": archive,
+        "wall_seconds": round(max((r.finished for r in runs), default=0.0), 4),
+        "critical_path": [r.name for r in path_runs],
+        "critical_path_seconds": round(sum(r.seconds for r in path_runs), 4),
+        "memory_traced": options.trace_memory,
+        "stages": [
+            {
+                "name": r.name,
+                "started": round(r.started, 4),
+                "wall_seconds": round(r.seconds, 4),
+                "cpu_seconds": round(r.cpu_seconds, 4),
+                "worker_cpu_seconds": round(r.counters.worker_cpu_seconds, 4),
+                "peak_memory_bytes": r.peak_memory,
+                "files_written": r.counters.files_written,
+                "bytes_written": r.counters.bytes_written,
+                "minify_bytes_in": r.counters.minify_bytes_in,
+                "minify_bytes_out": r.counters.minify_bytes_out,
+                "files_linked": r.counters.files_linked,
+                "fragment_hits": r.counters.fragment_hits,
+                "fragment_misses": r.counters.fragment_misses,
+            }
+            for r in runs
+        ],
+        "totals": {key: round(value, 4) for key, value in asdict(totals).items()},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"REPORT OK — {path.relative_to(ROOT).as_posix()} ({len(runs)} stages)")
+
+
+# =========================================================
+# STAGE GRAPH
+# =========================================================
+@dataclass(frozen=True)
+class Stage:
+    """One build step. run(inputs) receives the declared input artifacts and returns the declared outputs."""
+    name: str
+    run: Callable[[dict], dict]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class StageRun:
+    """Measurements of one executed stage; times are seconds since the graph started."""
+    name: str
+    started: float
+    finished: float
+    cpu_seconds: float
+    peak_memory: int | None
+    counters: StageCounters
+
+    @property
+    def seconds(self) -> float:
+        return self.finished - self.started
+
+
+class StageOutput:
+    """
+    sys.stdout while the stage graph runs. What a stage prints is buffered per
+    thread and written out in one piece when the stage finishes, so the status
+    lines of stages running at the same time do not interleave. Output from
+    other threads passes straight through.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def begin(self) -> None:
+        self._local.buffer = io.StringIO()
+
+    def end(self) -> None:
+        buffer, self._local.buffer = self._local.buffer, None
+        self.emit(buffer.getvalue())
+
+    def emit(self, text: str) -> None:
+        if text:
+            with self._lock:
+                self.stream.write(text)
+                self.stream.flush()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            return buffer.write(text)
+        with self._lock:
+            return self.stream.write(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def validate_stage_graph(stages: list[Stage]) -> dict[str, set[str]]:
+    """
+    Check that stage names and artifacts are unique, every input has a producer
+    and the graph has no cycle. Returns stage name -> names of the stages it waits for.
+    """
+    producers = {}
+    for stage in stages:
+        for artifact in stage.outputs:
+            if artifact in producers:
+                raise ValueError(
+                    f"Build artifact '{artifact}' is produced by both '{producers[artifact]}' and '{stage.name}'"
+                )
+            producers[artifact] = stage.name
+
+    deps = {}
+    for stage in stages:
+        if stage.name in deps:
+            raise ValueError(f"Duplicate build stage '{stage.name}'")
+        missing = [artifact for artifact in stage.inputs if artifact not in producers]
+        if missing:
+            raise ValueError(f"Build stage '{stage.name}' needs artifacts no stage produces: {missing}")
+        deps[stage.name] = {producers[artifact] for artifact in stage.inputs}
+
+    resolved = set()
+    while len(resolved) < len(deps):
+        ready = {name for name, needs in deps.items() if name not in resolved and needs <= resolved}
+        if not ready:
+            raise ValueError(f"Build stage graph has a cycle between: {sorted(set(deps) - resolved)}")
+        resolved |= ready
+    return deps
+
+
+def run_stage_graph(stages: list[Stage], workers: int = 1) -> tuple[dict, list[StageRun]]:
+    """
+    Run every stage once its inputs exist, up to `workers` stages at a time on a
+    thread pool. Ready stages start in declaration order, so workers=1 is the plain
+    sequential build. Returns all artifacts and the stage runs in completion order.
+    Each stage's printed output appears in one block when it finishes (StageOutput).
+    """
+    deps = validate_stage_graph(stages)
+    artifacts = {}
+    runs = []
+    done = set()
+    waiting = list(stages)
+    output = StageOutput(sys.stdout)
+    t0 = time.perf_counter()
+
+    def run_stage(stage: Stage, inputs: dict):
+        counters = StageCounters()
+        _STAGE_COUNTERS.current = counters
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        started = time.perf_counter() - t0
+        cpu_started = time.thread_time()
+        output.begin()
+        try:
+            with OutputWriter():
+                produced = stage.run(inputs) or {}
+        finally:
+            output.end()
+            _STAGE_COUNTERS.current = None
+        cpu_seconds = time.thread_time() - cpu_started
+        peak = tracemalloc.get_traced_memory()[1] if tracing else None
+        return produced, StageRun(stage.name, started, time.perf_counter() - t0, cpu_seconds, peak, counters)
+
+    with contextlib.redirect_stdout(output), ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        running = {}
+        while waiting or running:
+            for stage in [s for s in waiting if deps[s.name] <= done]:
+                if len(running) >= max(1, workers):
+                    break
+                waiting.remove(stage)
+                inputs = {artifact: artifacts[artifact] for artifact in stage.inputs}
+                running[pool.submit(run_stage, stage, inputs)] = stage
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                produced, run = future.result()
+                if set(produced) != set(stage.outputs):
+                    raise RuntimeError(
+                        f"Build stage '{stage.name}' returned {sorted(produced)}, declared {sorted(stage.outputs)}"
+                    )
+                artifacts.update(produced)
+                runs.append(run)
+                done.add(stage.name)
+
+    return artifacts, runs
+
+
+def critical_path(stages: list[Stage], runs: list[StageRun]) -> list[StageRun]:
+    """Longest chain of dependent stages by measured duration."""
+    deps = validate_stage_graph(stages)
+    chains = {}
+    for run in runs:  # completion order is a topological order
+        before = max((chains[name] for name in deps[run.name]), key=lambda c: c[0], default=(0.0, []))
+        chains[run.name] = (before[0] + run.seconds, before[1] + [run])
+    if not chains:
+        return []
+    return max(chains.values(), key=lambda c: c[0])[1]
+
+
+def print_stage_summary(runs: list[StageRun], path_runs: list[StageRun], workers: int) -> None:
+    wall = max((r.finished for r in runs), default=0.0)
+    busy = sum(r.seconds for r in runs)
+    path_s = sum(r.seconds for r in path_runs)
+    print(
+        f"STAGES — {len(runs)} stages on {workers} thread(s): wall {wall:.2f} s, "
+        f"stage total {busy:.2f} s, critical path {path_s:.2f} s"
+    )
+    print("  critical path: " + " → ".join(f"{r.name} {r.seconds:.2f}s" for r in path_runs))
+
+
+def declare_build_stages(
+    options: BuildOptions,
+    hash_cache: FileHashCache,
+    manifest: BuildManifest,
+    site_mode: str,
+    robots_meta: str,
+) -> list[Stage]:
+    """The build as a DAG. Artifacts named seo_* thread the shared SEO registry through the page stages in order."""
+    url = make_url_path
+    disruption_rel = make_disruption_rel_path
+
+    def prepare_output(_):
+        stage_prepare_output(clean=CLEAN_DIST_ON_BUILD and not options.incremental)
+        return {"dist": DIST}
+
+    def publish_assets(_):
+        return {"published_assets": stage_publish_assets(link=options.link_assets)}
+
+    def minify_css(_):
+        stage_minify_css(hash_cache)
+        return {"style_css": ASSETS_CSS_DIST}
+
+    def bundle_js(_):
+        stage_bundle_js(hash_cache)
+        return {"bundle_js": JS_BUNDLE_DIST}
+
+    def fingerprint_assets(_):
+        return {"asset_manifest": stage_fingerprint_assets() if options.fingerprint_assets else {}}
+
+    def load_source(_):
+        if options.log_store == "sqlite":
+            return {"source": stage_load_source_sqlite(manifest.code_version, hash_cache)}
+        return {"source": stage_load_source_cached(manifest.code_version, hash_cache)}
+
+    def asset_version(a):
+        source_digest = "" if options.shared_fragments else a["source"]["digest"]
+        return {"asset_version": compute_asset_version(source_digest, hash_cache=hash_cache)}
+
+    def load_templates(a):
+        return {"templates": stage_load_templates(a["source"]["site"]["base_url"].rstrip("/"))}
+
+    def prepare_logs(a):
+        logs_sorted, next_log_utc = stage_prepare_logs(a["source"]["logs"])
+        return {"logs_sorted": logs_sorted, "next_log_utc": next_log_utc}
+
+    def site_context(a):
+        source = a["source"]
+        site = source["site"]
+        version = a["asset_version"]
+        ctx = SiteContext(
+            base_url=site["base_url"].rstrip("/"),
+            lang=site.get("default_lang", "en"),
+            og_image=site["og_image"],
+            youtube=site["youtube"],
+            bandcamp=site.get("bandcamp", ""),
+            github_repo=site.get("github", ""),
+            core_start=source["core_start"],
+            sys_ver=source["sys_ver"],
+            site_title=site.get("site_title", "OX500 // CORE INTERFACE"),
+            available_count=f"{len(a['logs_sorted']):04d}",
+            asset_version=version,
+            asset_css_url=resolve_asset_url(a["asset_manifest"], ASSETS_CSS_REL, version),
+            asset_js_url=resolve_asset_url(a["asset_manifest"], JS_BUNDLE_REL, version),
+            site_mode=site_mode,
+            robots_meta=robots_meta,
+            data_manifest_url=f"/{DATA_MANIFEST_REL.as_posix()}" if options.hash_data else "",
+        )
+        return {"ctx": ctx}
+
+    def group_disruptions(a):
+        published, grouping, warnings = a["source"].get("grouping") or (None, None, [])
+        if published != len(a["logs_sorted"]):
+            warnings = []
+            grouping = stage_group_disruptions(a["logs_sorted"], warnings)
+        for warning in warnings:
+            print(warning)
+        return {"disruptions": grouping, "disruption_warnings": warnings}
+
+    def source_snapshot(a):
+        source = a["source"]
+        published = (source.get("grouping") or (None,))[0]
+        if published == len(a["logs_sorted"]):
+            return {"source_snapshot": None}  # loaded from a snapshot that is still current
+        path = save_source_snapshot(source, a["logs_sorted"], a["disruptions"], a["disruption_warnings"])
+        return {"source_snapshot": path}
+
+    def log_pages(a):
+        disruptions, disruption_order = a["disruptions"]
+        seo = {"registry": {"title": {}, "description": {}, "canonical": {}}, "warnings": [], "infos": []}
+        sitemap_entries = []
+        stage_build_log_pages(
+            logs_sorted=a["logs_sorted"],
+            disruptions=disruptions,
+            disruption_order=disruption_order,
+            t_log=a["templates"][0],
+            ctx=a["ctx"],
+            next_log_utc=a["next_log_utc"],
+            seo_registry=seo["registry"],
+            seo_warnings=seo["warnings"],
+            seo_infos=seo["infos"],
+            url=url,
+            disruption_rel=disruption_rel,
+            sitemap_entries=sitemap_entries,
+            manifest=manifest,
+            jobs=options.jobs,
+            profile_path=BUILD_REPORT_DIR / "profile-log-pages.prof" if options.profile else None,
+            shared_fragments=options.shared_fragments,
+        )
+        return {"log_sitemap_entries": sitemap_entries, "seo_after_logs": seo}
+
+    def disruption_pages(a):
+        disruptions, disruption_order = a["disruptions"]
+        seo = a["seo_after_logs"]
+        sitemap_entries = []
+        stage_build_disruption_pages(
+            logs_sorted=a["logs_sorted"],
+            disruption_order=disruption_order,
+            disruptions=disruptions,
+            t_node=a["templates"][2],
+            ctx=a["ctx"],
+            next_log_utc=a["next_log_utc"],
+            seo_registry=seo["registry"],
+            seo_warnings=seo["warnings"],
+            seo_infos=seo["infos"],
+            url=url,
+            disruption_rel=disruption_rel,
+            sitemap_entries=sitemap_entries,
+            manifest=manifest,
+            jobs=options.jobs,
+            profile_path=BUILD_REPORT_DIR / "profile-disruption-pages.prof" if options.profile else None,
+            shared_fragments=options.shared_fragments,
+        )
+        return {"disruption_sitemap_entries": sitemap_entries, "seo_after_disruptions": seo}
+
+    def home_view_models(a):
+        disruptions, disruption_order = a["disruptions"]
+        home_vm = compose_home_view_models(
+            logs_sorted=a["logs_sorted"],
+            disruptions=disruptions,
+            disruption_order=disruption_order,
+            ctx=a["ctx"],
+            url=url,
+            disruption_rel=disruption_rel,
+        )
+        return {"home_vm": home_vm}
+
+    def export_json(a):
+        stage_export_json_data(
+            logs_sorted=a["logs_sorted"],
+            disruptions_nav_payload=a["home_vm"]["disruptions_nav_payload"],
+            manifest=manifest,
+            disruptions=a["disruptions"][0],
+            pagination=options.pagination,
+            hash_data=options.hash_data,
+            listed_files=a.get("site_state_files"),
+        )
+        return {"json_data": DIST / "data"}
+
+    def homepage(a):
+        seo = a["seo_after_disruptions"]
+        stage_render_homepage(
+            t_index=a["templates"][1],
+            ctx=a["ctx"],
+            home_vm=a["home_vm"],
+            next_log_utc=a["next_log_utc"],
+            seo_registry=seo["registry"],
+            seo_warnings=seo["warnings"],
+            seo_infos=seo["infos"],
+        )
+        return {"index_html": DIST / "index.html", "seo": seo}
+
+    def site_state(a):
+        disruptions, disruption_order = a["disruptions"]
+        files = stage_export_site_state(
+            logs_sorted=a["logs_sorted"],
+            disruptions=disruptions,
+            disruption_order=disruption_order,
+            ctx=a["ctx"],
+            next_log_utc=a["next_log_utc"],
+            url=url,
+            disruption_rel=disruption_rel,
+            manifest=manifest,
+            data_files=DataFiles(content_hashed=options.hash_data),
+        )
+        return {"site_state_files": files}
+
+    def robots_and_sitemap(a):
+        ctx = a["ctx"]
+        sitemap_entries = a["log_sitemap_entries"] + a["disruption_sitemap_entries"]
+        stage_write_robots_and_sitemap(ctx.base_url, a["logs_sorted"], sitemap_entries, ctx.site_mode)
+        return {"sitemap": DIST / "sitemap.xml"}
+
+    page_inputs = ("dist", "ctx", "templates", "logs_sorted", "next_log_utc", "disruptions")
+    # data/manifest.json lists site-state.json too, so export_json waits for it
+    export_inputs = ("dist", "logs_sorted", "disruptions", "home_vm")
+    if options.shared_fragments:
+        export_inputs += ("site_state_files",)
+    stages = [
+        Stage("prepare_output", prepare_output, (), ("dist",)),
+        Stage("publish_assets", publish_assets, ("dist",), ("published_assets",)),
+        Stage("minify_css", minify_css, ("dist",), ("style_css",)),
+        Stage("bundle_js", bundle_js, ("dist",), ("bundle_js",)),
+        Stage("load_source", load_source, (), ("source",)),
+        Stage(
+            "asset_version",
+            asset_version,
+            () if options.shared_fragments else ("source",),
+            ("asset_version",),
+        ),
+        Stage("fingerprint_assets", fingerprint_assets, ("style_css", "bundle_js"), ("asset_manifest",)),
+        Stage("prepare_logs", prepare_logs, ("source",), ("logs_sorted", "next_log_utc")),
+        Stage("load_templates", load_templates, ("source",), ("templates",)),
+        Stage(
+            "site_context",
+            site_context,
+            ("source", "logs_sorted", "asset_version", "asset_manifest"),
+            ("ctx",),
+        ),
+        Stage(
+            "group_disruptions",
+            group_disruptions,
+            ("source", "logs_sorted"),
+            ("disruptions", "disruption_warnings"),
+        ),
+        Stage(
+            "source_snapshot",
+            source_snapshot,
+            ("source", "logs_sorted", "disruptions", "disruption_warnings"),
+            ("source_snapshot",),
+        ),
+        Stage("log_pages", log_pages, page_inputs, ("log_sitemap_entries", "seo_after_logs")),
+        Stage(
+            "disruption_pages",
+            disruption_pages,
+            page_inputs + ("seo_after_logs",),
+            ("disruption_sitemap_entries", "seo_after_disruptions"),
+        ),
+        Stage("home_view_models", home_view_models, ("ctx", "logs_sorted", "disruptions"), ("home_vm",)),
+        Stage("export_json", export_json, export_inputs, ("json_data",)),
+        Stage(
+            "homepage",
+            homepage,
+            ("dist", "ctx", "templates", "home_vm", "next_log_utc", "style_css", "seo_after_disruptions"),
+            ("index_html", "seo"),
+        ),
+        Stage(
+            "robots_and_sitemap",
+            robots_and_sitemap,
+            ("ctx", "logs_sorted", "log_sitemap_entries", "disruption_sitemap_entries"),
+            ("sitemap",),
+        ),
+    ]
+    if options.shared_fragments:
+        stages.append(
+            Stage(
+                "site_state",
+                site_state,
+                ("dist", "ctx", "logs_sorted", "next_log_utc", "disruptions"),
+                ("site_state_files",),
+            )
+        )
+    return stages
+
+
+def build(options: BuildOptions | None = None):
+    """
+    Build the site. By default every output goes to a new directory in
+    DIST_BUILDS_DIR, which replaces the live dist/ only once all stages have
+    passed (see swap_output_build); a failed build leaves dist/ untouched.
+    An incremental staged build hardlinks its unchanged outputs from the
+    live build. The manifest is saved only for the build that went live.
+    """
+    options = options or BuildOptions()
+    if options.split_source:
+        count = split_logs_json(fmt=options.split_source)
+        print(
+            f"SPLIT OK — {count} logs written to {SOURCE_SHARDS_DIR.name}/ as .{options.split_source}, "
+            f"site and system to {SOURCE_SITE_PATH.name}; remove {SOURCE_JSON_PATH.name} to build from them"
+        )
+        return
+    if not options.staging:
+        unlink_output_build()
+        manifest = build_outputs(options)
+        manifest.save(BUILD_MANIFEST_PATH)
+    else:
+        staging = new_output_build()
+        set_output_root(staging)
+        try:
+            manifest = build_outputs(options, reuse_root=DIST_LIVE.resolve() if DIST_LIVE.is_dir() else None)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            print(f"BUILD FAILED — {DIST_LIVE.name}/ still serves the previous build")
+            raise
+        finally:
+            set_output_root(DIST_LIVE)
+        method = swap_output_build(staging)
+        manifest.save(BUILD_MANIFEST_PATH)
+        removed = prune_output_builds()
+        print(
+            f"Output OK — {DIST_LIVE.name}/ now serves {staging.relative_to(ROOT).as_posix()} "
+            f"(swapped by {method}), {removed} old builds removed"
+        )
+    print("BUILD OK — index, logs, disruption nodes, logs pages json, sitemap, robots, JS bundle generated")
+
+
+def build_outputs(options: BuildOptions, reuse_root: Path | None = None) -> BuildManifest:
+    """Run every stage into DIST and write the build report; returns the manifest, not yet saved."""
     site_mode = str(os.environ.get("SITE_MODE", "test")).strip().lower()
     if site_mode not in {"test", "prod"}:
         print(f"WARN: unsupported SITE_MODE='{site_mode}', defaulting to test")
@@ -1731,120 +4732,205 @@ def build():
         else '<meta name="robots" content="noindex, nofollow, noarchive" />\n'
              '  <meta name="googlebot" content="noindex, nofollow, noarchive" />'
     )
-    stage_minify_css()
-    stage_bundle_js()
-    source = stage_load_and_validate_source()
-    site = source["site"]
-    logs = source["logs"]
-
-    # ===== NORMALIZE SLUGS =====
-    for log in logs:
-        log["slug"] = slugify(log.get("slug") or log.get("title", ""))
-
-    logs_sorted_all = sorted(logs, key=lambda x: x["_id_int"], reverse=True)
-    next_log_utc = compute_next_log_utc(logs_sorted_all)
-
-    # ===== FILTER OUT FUTURE-DATED LOGS (do not generate/publish yet) =====
-    asset_version = compute_asset_version()
-    today = utc_today()
-    logs = [log for log in logs if log["_date_obj"] <= today]
-
-    # newest first
-    logs_sorted = sorted(logs, key=lambda x: x["_id_int"], reverse=True)
-    generated_log_pages = len(logs_sorted)
-    available_count = f"{generated_log_pages:04d}"
-    t_log, t_index, t_node = stage_load_templates()
-
-    ctx = SiteContext(
-        base_url=site["base_url"].rstrip("/"),
-        lang=site.get("default_lang", "en"),
-        og_image=site["og_image"],
-        youtube=site["youtube"],
-        bandcamp=site.get("bandcamp", ""),
-        github_repo=site.get("github", ""),
-        core_start=source["core_start"],
-        sys_ver=source["sys_ver"],
-        site_title=site.get("site_title", "OX500 // CORE INTERFACE"),
-        available_count=available_count,
-        asset_version=asset_version,
-        site_mode=site_mode,
-        robots_meta=robots_meta,
-    )
-
-    sitemap_entries = []
-    seo_registry = {"title": {}, "description": {}, "canonical": {}}
-    seo_warnings: list[str] = []
-    seo_infos: list[str] = []
-    rel = make_log_rel_path
-    url = make_url_path
-    disruption_rel = make_disruption_rel_path
-
-    disruptions, disruption_order = stage_group_disruptions(logs_sorted)
-
-    stage_build_log_pages(
-        logs_sorted=logs_sorted,
-        disruptions=disruptions,
-        disruption_order=disruption_order,
-        t_log=t_log,
-        ctx=ctx,
-        next_log_utc=next_log_utc,
-        seo_registry=seo_registry,
-        seo_warnings=seo_warnings,
-        seo_infos=seo_infos,
-        rel=rel,
-        url=url,
-        disruption_rel=disruption_rel,
-        sitemap_entries=sitemap_entries,
-    )
-
-    stage_build_disruption_pages(
-        logs_sorted=logs_sorted,
-        disruption_order=disruption_order,
-        disruptions=disruptions,
-        t_node=t_node,
-        ctx=ctx,
-        next_log_utc=next_log_utc,
-        seo_registry=seo_registry,
-        seo_warnings=seo_warnings,
-        seo_infos=seo_infos,
-        rel=rel,
-        url=url,
-        disruption_rel=disruption_rel,
-        sitemap_entries=sitemap_entries,
+    hash_cache = FileHashCache.load(ASSET_HASH_CACHE_PATH, options.asset_hash)
+    code_version = compute_code_version()
+    if options.incremental:
+        manifest = BuildManifest.load(BUILD_MANIFEST_PATH, code_version, reuse_root)
+    else:
+        manifest = BuildManifest(code_version, reuse_root=reuse_root)
+
+    stages = declare_build_stages(options, hash_cache, manifest, site_mode, robots_meta)
+    stage_workers = options.stage_workers
+    fragment_cache = None
+    if options.fragment_cache:
+        fragment_cache = FragmentCache(FRAGMENT_CACHE_DIR, fragment_cache_salt(code_version))
+    use_fragment_cache(fragment_cache)
+    if options.trace_memory:
+        # tracemalloc peaks are process-wide, so stages must not overlap to be attributable
+        stage_workers = 1
+        tracemalloc.start()
+    try:
+        artifacts, runs = run_stage_graph(stages, workers=stage_workers)
+    finally:
+        use_fragment_cache(None)
+        if options.trace_memory:
+            tracemalloc.stop()
+    artifacts["source"]["text_store"].close()
+    seo = artifacts["seo"]
+
+    hash_cache.save()
+    print(
+        f"Asset hash OK — {hash_cache.misses} hashed, {hash_cache.hits} cached "
+        f"({options.asset_hash}) in {hash_cache.seconds * 1000:.1f} ms"
     )
 
-    stage_build_home_and_exports(
-        logs_sorted=logs_sorted,
-        disruptions=disruptions,
-        disruption_order=disruption_order,
-        t_index=t_index,
-        ctx=ctx,
-        next_log_utc=next_log_utc,
-        seo_registry=seo_registry,
-        seo_warnings=seo_warnings,
-        seo_infos=seo_infos,
-        rel=rel,
-        url=url,
-        disruption_rel=disruption_rel,
-    )
+    if fragment_cache is not None:
+        totals = StageCounters()
+        for run in runs:
+            totals.add(run.counters)
+        evicted, kept_bytes, kept_page_bytes = fragment_cache.prune(
+            totals.fragment_bytes_added, totals.fragment_page_bytes_added
+        )
+        print(
+            f"Fragment cache OK — {totals.fragment_hits} hits, {totals.fragment_misses} misses, "
+            f"{evicted} evicted ({kept_bytes / (1 << 20):.1f} of {fragment_cache.max_bytes >> 20} MiB fragments, "
+            f"{kept_page_bytes / (1 << 20):.1f} of {fragment_cache.page_max_bytes >> 20} MiB pages)"
+        )
 
-    stage_write_robots_and_sitemap(ctx.base_url, logs_sorted, sitemap_entries, ctx.site_mode)
+    removed_outputs = manifest.prune()
+    if options.incremental:
+        print(
+            f"INCREMENTAL — {manifest.rendered} rendered, {manifest.unchanged} unchanged, "
+            f"{len(removed_outputs)} removed"
+        )
 
-    if seo_warnings:
-        for warning in seo_warnings:
+    if seo["warnings"]:
+        for warning in seo["warnings"]:
             print(warning)
-        print(f"SEO warnings: {len(seo_warnings)}")
+        print(f"SEO warnings: {len(seo['warnings'])}")
     else:
         print("SEO warnings: 0")
-    if seo_infos:
-        for info in seo_infos:
+    if seo["infos"]:
+        for info in seo["infos"]:
             print(info)
-        print(f"SEO info: {len(seo_infos)}")
+        print(f"SEO info: {len(seo['infos'])}")
     else:
         print("SEO info: 0")
 
-    print("BUILD OK — index, logs, disruption nodes, logs pages json, sitemap, robots, JS bundle generated")
+    path_runs = critical_path(stages, runs)
+    print_stage_summary(runs, path_runs, stage_workers)
+    write_build_report(
+        BUILD_REPORT_DIR / "report.json",
+        options,
+        runs,
+        path_runs,
+        archive={
+            "logs_published": len(artifacts["logs_sorted"]),
+            "logs_total": len(artifacts["source"]["logs"]),
+            "disruptions": len(artifacts["disruptions"][0]),
+        },
+    )
+    return manifest
+
+
+def parse_build_options(argv: list[str] | None = None) -> BuildOptions:
+    parser = argparse.ArgumentParser(description="Build the OX500 static site into dist/.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="reuse dist/ and re-render only outputs whose inputs changed (see .build-cache/build-manifest.json)",
+    )
+    parser.add_argument(
+        "--pagination",
+        choices=DATA_PAGINATIONS,
+        default=BuildOptions.pagination,
+        help="number data/*-page-N.json newest first (default), or anchor them to the oldest log so that "
+        "publishing a log only changes the head page",
+    )
+    parser.add_argument(
+        "--hash-data",
+        action="store_true",
+        help="serve the data/ page files and site-state.json under content-hashed names listed in "
+        "data/manifest.json; data/since/<id>.json keeps its plain name, since clients build it from "
+        "the newest id they hold and must revalidate it on every poll anyway",
+    )
+    parser.add_argument(
+        "--in-place",
+        dest="staging",
+        action="store_false",
+        help="write straight into dist/ instead of building in .dist-builds/ and switching dist/ over at the end",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="render log and disruption pages with N worker processes (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--shared-fragments",
+        action="store_true",
+        help="keep site-wide values (recent logs, nodes, counts, next log) out of log and disruption "
+        "pages and publish them once in data/site-state.json",
+    )
+    parser.add_argument(
+        "--fingerprint-assets",
+        action="store_true",
+        help="serve style.css and bundle.js under content-hashed names listed in dist/manifest.json",
+    )
+    parser.add_argument(
+        "--asset-hash",
+        choices=ASSET_HASH_ALGOS,
+        default="sha256",
+        help="digest used for asset fingerprinting (xxh3 needs the xxhash package)",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="record each stage's peak traced memory in dist/_build/report.json (runs stages sequentially)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="render log and disruption pages in-process under cProfile; stats go to dist/_build/profile-*.prof",
+    )
+    parser.add_argument(
+        "--split-source",
+        choices=("json", "md"),
+        metavar="FORMAT",
+        help="convert logs.json into site.json plus one logs/<id>-<slug>.FORMAT file per log (json or md) and exit",
+    )
+    parser.add_argument(
+        "--log-store",
+        choices=("memory", "sqlite"),
+        default=BuildOptions.log_store,
+        help="keep the archive in memory (default) or in .build-cache/logs.sqlite, indexed by id, date, slug "
+        "and disruption and queried by the stages page by page",
+    )
+    parser.add_argument(
+        "--copy-assets",
+        dest="link_assets",
+        action="store_false",
+        help="publish static assets as plain copies instead of reflinks or hardlinks to assets/",
+    )
+    parser.add_argument(
+        "--no-fragment-cache",
+        dest="fragment_cache",
+        action="store_false",
+        help="recompute formatted log text, JSON-LD and minified HTML instead of reusing .build-cache/fragments",
+    )
+    parser.add_argument(
+        "--stage-workers",
+        type=int,
+        default=BuildOptions.stage_workers,
+        metavar="N",
+        help="run up to N independent build stages at once (1 = strictly sequential)",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    if args.stage_workers < 1:
+        parser.error("--stage-workers must be >= 1")
+    jobs = args.jobs or os.cpu_count() or 1
+    return BuildOptions(
+        incremental=args.incremental,
+        jobs=jobs,
+        shared_fragments=args.shared_fragments,
+        fingerprint_assets=args.fingerprint_assets,
+        asset_hash=args.asset_hash,
+        stage_workers=args.stage_workers,
+        trace_memory=args.trace_memory,
+        profile=args.profile,
+        split_source=args.split_source,
+        log_store=args.log_store,
+        fragment_cache=args.fragment_cache,
+        link_assets=args.link_assets,
+        staging=args.staging,
+        pagination=args.pagination,
+        hash_data=args.hash_data,
+    )
 
 
 if __name__ == "__main__":
-    build()
+    build(parse_build_options())
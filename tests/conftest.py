@@ -0,0 +1,152 @@
+"""
+Shared fixtures: a copy of the site sources in a temporary directory, built by
+running build.py there in a subprocess. esbuild is replaced by a `node` shim
+on PATH that copies its input to --outfile and counts its runs, so the tests
+need neither node nor the esbuild binary.
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+LOG_PAGE = "logs/2025/12/log-01617-what-am-i-for.html"  # a log with neighbours on both sides
+SITE_FILES = ("build.py", "logs.json", "template-index.html", "template-log.html", "template-series.html")
+
+NODE_SHIM = """#!{python}
+import sys
+args = sys.argv[1:]
+out = next(a.split("=", 1)[1] for a in args if a.startswith("--outfile="))
+with open(args[1], "rb") as src, open(out, "wb") as dst:
+    dst.write(src.read())
+with open(__file__ + ".calls", "a") as calls:
+    calls.write(" ".join(args) + "\\n")
+"""
+
+
+def incremental_counts(stdout: str) -> tuple[int, int, int]:
+    """(rendered, unchanged, removed) from an --incremental build's output."""
+    match = re.search(r"INCREMENTAL — (\d+) rendered, (\d+) unchanged, (\d+) removed", stdout)
+    assert match, stdout
+    return tuple(int(n) for n in match.groups())
+
+
+class Site:
+    """A site checkout under root; build() runs build.py there."""
+
+    def __init__(self, root: Path, bin_dir: Path):
+        self.root = root
+        self.bin_dir = bin_dir
+
+    @property
+    def dist(self) -> Path:
+        return self.root / "dist"
+
+    def build(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
+        env = dict(os.environ, PATH=f"{self.bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+        result = subprocess.run(
+            [sys.executable, "build.py", *args],
+            cwd=self.root,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if check and result.returncode != 0:
+            raise AssertionError(f"build.py {' '.join(args)} failed:\n{result.stdout}\n{result.stderr}")
+        return result
+
+    def read_logs(self) -> dict:
+        return json.loads((self.root / "logs.json").read_text(encoding="utf-8"))
+
+    def write_logs(self, data: dict) -> None:
+        (self.root / "logs.json").write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def edit_log(self, log_id: str, **fields) -> None:
+        data = self.read_logs()
+        log = next(log for log in data["logs"] if log["id"] == log_id)
+        log.update(fields)
+        self.write_logs(data)
+
+    def add_log(self, **fields) -> dict:
+        """Append a log after the newest one, dated the same day; fields override the defaults."""
+        return self.add_logs(1, **fields)[0]
+
+    def add_logs(self, count: int, **fields) -> list[dict]:
+        data = self.read_logs()
+        added = []
+        for _ in range(count):
+            last = data["logs"][-1]
+            log_id = f"{int(last['id']) + 1:0{len(last['id'])}d}"
+            log = {
+                "id": log_id,
+                "title": f"TEST LOG {log_id}",
+                "date": last["date"],
+                "tag": "DISRUPTION",
+                "series": last["series"],
+                "slug": f"test-log-{log_id}",
+                "excerpt": "test excerpt",
+                "text": f"test text {log_id}\nsecond line",
+                **fields,
+            }
+            data["logs"].append(log)
+            added.append(log)
+        self.write_logs(data)
+        return added
+
+    def outputs(self, root: Path | None = None) -> dict[str, bytes]:
+        """Every file under root (dist/ by default) but the build report, by relative path."""
+        root = root or self.dist
+        return {
+            path.relative_to(root).as_posix(): path.read_bytes()
+            for path in sorted(root.rglob("*"))
+            if path.is_file() and path.relative_to(root).parts[0] != "_build"
+        }
+
+    def esbuild_runs(self) -> int:
+        calls = self.bin_dir / "node.calls"
+        return len(calls.read_text().splitlines()) if calls.exists() else 0
+
+
+def copy_site(dst: Path, bin_dir: Path) -> Site:
+    dst.mkdir(parents=True)
+    for name in SITE_FILES:
+        shutil.copy2(ROOT / name, dst / name)
+    shutil.copytree(ROOT / "assets", dst / "assets")
+    (dst / "node_modules" / "esbuild").mkdir(parents=True)
+    (dst / "node_modules" / "esbuild" / "package.json").write_text('{"version": "0.0.0-test"}\n')
+    return Site(dst, bin_dir)
+
+
+@pytest.fixture
+def node_shim(tmp_path) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    node = bin_dir / "node"
+    node.write_text(NODE_SHIM.format(python=sys.executable))
+    node.chmod(0o755)
+    return bin_dir
+
+
+@pytest.fixture
+def site(tmp_path, node_shim) -> Site:
+    return copy_site(tmp_path / "site", node_shim)
+
+
+@pytest.fixture
+def make_site(tmp_path, node_shim):
+    """Another independent copy of the sources, for clean-versus-incremental comparisons."""
+    count = 0
+
+    def make() -> Site:
+        nonlocal count
+        count += 1
+        return copy_site(tmp_path / f"site-{count}", node_shim)
+
+    return make
@@ -0,0 +1,41 @@
+import json
+import re
+
+LOG_PAGE = "logs/2025/12/log-01617-what-am-i-for.html"
+
+
+def asset_manifest(site) -> dict:
+    return json.loads((site.dist / "manifest.json").read_text(encoding="utf-8"))
+
+
+def test_assets_are_published_under_their_own_hash(site):
+    site.build("--fingerprint-assets")
+    manifest = asset_manifest(site)
+    css, js = manifest["assets/css/style.css"], manifest["assets/js/bundle.js"]
+    assert re.fullmatch(r"assets/css/style\.[0-9a-f]{10}\.css", css)
+    assert re.fullmatch(r"assets/js/bundle\.[0-9a-f]{10}\.js", js)
+    assert (site.dist / css).read_bytes() == (site.dist / "assets/css/style.css").read_bytes()
+    page = (site.dist / LOG_PAGE).read_text(encoding="utf-8")
+    assert f"/{css}" in page and f"/{js}" in page
+    assert "?v=" not in page
+
+
+def test_log_edit_keeps_asset_names(site):
+    site.build("--fingerprint-assets")
+    before = asset_manifest(site)
+    site.edit_log("01617", text="a new body")
+    site.build("--fingerprint-assets")
+    assert asset_manifest(site) == before
+
+
+def test_css_edit_renames_only_the_stylesheet(site):
+    site.build("--fingerprint-assets")
+    before = asset_manifest(site)
+    # the esbuild shim copies the entry file without following its imports
+    css_source = site.root / "assets" / "css" / "style-core.entry.css"
+    css_source.write_text(css_source.read_text(encoding="utf-8") + "\nbody{color:red}\n", encoding="utf-8")
+    site.build("--fingerprint-assets")
+    after = asset_manifest(site)
+    assert after["assets/css/style.css"] != before["assets/css/style.css"]
+    assert after["assets/js/bundle.js"] == before["assets/js/bundle.js"]
+    assert not (site.dist / before["assets/css/style.css"]).exists()
@@ -0,0 +1,97 @@
+import os
+import re
+import threading
+
+import pytest
+
+import build
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"file-{i}.bin"
+        path.write_bytes(os.urandom(64) * (i + 1))
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    calls = []
+    original = build.file_digest
+
+    def counting(path, algo="sha256"):
+        calls.append(path)
+        return original(path, algo)
+
+    monkeypatch.setattr(build, "file_digest", counting)
+    return calls
+
+
+def test_digests_match_file_contents(tmp_path, files):
+    cache = build.FileHashCache(tmp_path / "cache.json", "sha256")
+    digests = cache.digests(files)
+    assert digests == {path: build.file_digest(path) for path in files}
+
+
+def test_warm_cache_reads_only_changed_files(tmp_path, files, hash_calls):
+    cache_path = tmp_path / "cache.json"
+    cache = build.FileHashCache(cache_path, "sha256")
+    cache.digests(files)
+    cache.save()
+    hash_calls.clear()
+
+    warm = build.FileHashCache.load(cache_path, "sha256")
+    warm.digests(files)
+    assert hash_calls == []
+    assert (warm.hits, warm.misses) == (len(files), 0)
+
+    files[2].write_bytes(b"changed")
+    warm.digests(files)
+    assert hash_calls == [files[2]]
+
+
+def test_other_algorithm_starts_a_new_cache(tmp_path, files):
+    cache_path = tmp_path / "cache.json"
+    cache = build.FileHashCache(cache_path, "sha256")
+    cache.digests(files)
+    cache.save()
+    assert build.FileHashCache.load(cache_path, "blake2b").entries == {}
+
+
+def test_concurrent_callers_hash_at_the_same_time(tmp_path, files, monkeypatch):
+    # each caller's hashing waits for the other's: with the lock held while hashing, the barrier times out
+    barrier = threading.Barrier(2, timeout=5)
+    original = build.file_digest
+
+    def waiting(path, algo="sha256"):
+        barrier.wait()
+        return original(path, algo)
+
+    monkeypatch.setattr(build, "file_digest", waiting)
+    cache = build.FileHashCache(tmp_path / "cache.json", "sha256")
+    errors = []
+
+    def run(paths):
+        try:
+            cache.digests(paths)
+        except threading.BrokenBarrierError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=run, args=([path],)) for path in files[:2]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert cache.misses == 2
+
+
+def test_warm_build_reads_no_assets(site):
+    site.build()
+    output = site.build().stdout
+    match = re.search(r"Asset hash OK — (\d+) hashed, (\d+) cached", output)
+    assert match, output
+    assert int(match.group(1)) == 0
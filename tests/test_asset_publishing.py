@@ -0,0 +1,102 @@
+import os
+import re
+
+import pytest
+
+import build
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    """A small assets/ source tree and an empty dist/, with build.py's paths pointed at them."""
+    src = tmp_path / "assets"
+    for rel, content in {
+        "img/logo.png": "png",
+        "fonts/a.woff2": "font",
+        "icons/favicon.ico": "ico",
+        "css/parts/base.css": "partial",
+        "css/style.css": "css source",
+        "js/main.js": "js source",
+    }.items():
+        (src / rel).parent.mkdir(parents=True, exist_ok=True)
+        (src / rel).write_text(content)
+    monkeypatch.setattr(build, "ROOT", tmp_path)
+    monkeypatch.setattr(build, "ASSETS_SRC", src)
+    monkeypatch.setattr(build, "ICONS_SRC", src / "icons")
+    live = build.DIST
+    build.set_output_root(tmp_path / "dist")
+    yield tmp_path
+    build.set_output_root(live)
+
+
+def publish(tree, **kwargs):
+    return build.stage_publish_assets(manifest_path=tree / "published.json", **kwargs)
+
+
+def published(tree):
+    dist = tree / "dist"
+    return sorted(p.relative_to(dist).as_posix() for p in dist.rglob("*") if p.is_file())
+
+
+def assets_line(capsys):
+    match = re.search(
+        r"Assets OK — (\d+) published: (\d+) linked \(\d+ reflinks\), (\d+) copied, (\d+) unchanged, (\d+) removed",
+        capsys.readouterr().out,
+    )
+    assert match
+    return tuple(int(n) for n in match.groups())
+
+
+def test_publishes_only_served_files(tree, capsys):
+    publish(tree)
+    assert published(tree) == ["assets/fonts/a.woff2", "assets/icons/favicon.ico", "assets/img/logo.png", "favicon.ico"]
+    assert assets_line(capsys) == (4, 4, 0, 0, 0)
+    assert os.path.samefile(tree / "dist" / "assets" / "img" / "logo.png", tree / "assets" / "img" / "logo.png")
+
+
+def test_copy_mode_does_not_link(tree, capsys):
+    publish(tree, link=False)
+    assert assets_line(capsys) == (4, 0, 4, 0, 0)
+    assert not os.path.samefile(tree / "dist" / "assets" / "img" / "logo.png", tree / "assets" / "img" / "logo.png")
+
+
+def test_unchanged_sources_are_skipped_and_changed_ones_republished(tree, capsys):
+    publish(tree, link=False)
+    capsys.readouterr()
+    publish(tree, link=False)
+    assert assets_line(capsys) == (4, 0, 0, 4, 0)
+
+    (tree / "assets" / "img" / "logo.png").write_text("new png")
+    publish(tree, link=False)
+    assert assets_line(capsys) == (4, 0, 1, 3, 0)
+    assert (tree / "dist" / "assets" / "img" / "logo.png").read_text() == "new png"
+
+
+def test_missing_dist_copy_is_published_again(tree, capsys):
+    publish(tree, link=False)
+    (tree / "dist" / "favicon.ico").unlink()
+    capsys.readouterr()
+    publish(tree, link=False)
+    assert assets_line(capsys) == (4, 0, 1, 3, 0)
+    assert (tree / "dist" / "favicon.ico").read_text() == "ico"
+
+
+def test_removed_sources_and_unpublished_leftovers_are_pruned(tree, capsys):
+    publish(tree)
+    leftover = tree / "dist" / "assets" / "css" / "parts" / "base.css"
+    leftover.parent.mkdir(parents=True)
+    leftover.write_text("left by an older build")
+    (tree / "assets" / "fonts" / "a.woff2").unlink()
+    capsys.readouterr()
+    publish(tree)
+    assert assets_line(capsys)[-1] == 2
+    assert published(tree) == ["assets/icons/favicon.ico", "assets/img/logo.png", "favicon.ico"]
+    assert not (tree / "dist" / "assets" / "fonts").exists()
+    assert not (tree / "dist" / "assets" / "css" / "parts").exists()
+
+
+def test_site_build_serves_no_asset_sources(site):
+    site.build()
+    outputs = site.outputs()
+    assert not [rel for rel in outputs if rel.startswith("assets/css/parts/") or rel.startswith("assets/js/core/")]
+    assert "assets/css/style.css" in outputs and "assets/js/bundle.js" in outputs
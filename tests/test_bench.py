@@ -0,0 +1,20 @@
+import contextlib
+import io
+
+import bench_build
+
+
+def test_synthetic_archive_builds(site):
+    archive = bench_build.generate_archive(bench_build.ArchiveSpec(logs=120, future_share=0.1))
+    site.write_logs(archive)
+    site.build()
+    pages = list((site.dist / "logs").rglob("*.html"))
+    assert len(pages) == 120 - 12
+
+
+def test_pipeline_benchmark_times_every_stage(tmp_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = bench_build.bench_pipeline_once(bench_build.ArchiveSpec(logs=80), tmp_path, skip_pages=False)
+    assert result["published_logs"] > 0
+    assert {"load_source", "stage_build_log_pages", "stage_export_json_data"} <= result["stages"].keys()
+    assert (tmp_path / "dist" / "sitemap.xml").is_file()
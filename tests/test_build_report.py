@@ -0,0 +1,39 @@
+import json
+
+
+def read_report(site) -> dict:
+    return json.loads((site.dist / "_build" / "report.json").read_text(encoding="utf-8"))
+
+
+def test_report_has_every_stage(site):
+    site.build()
+    report = read_report(site)
+    names = [stage["name"] for stage in report["stages"]]
+    assert {"log_pages", "disruption_pages", "homepage"} <= set(names)
+    assert len(names) == len(set(names))
+    assert report["critical_path"] and set(report["critical_path"]) <= set(names)
+    assert report["memory_traced"] is False
+
+
+def test_counters_add_up(site):
+    site.build()
+    report = read_report(site)
+    log_pages = next(stage for stage in report["stages"] if stage["name"] == "log_pages")
+    assert log_pages["files_written"] == len(site.read_logs()["logs"])
+    assert log_pages["bytes_written"] > 0
+    for key in ("files_written", "bytes_written", "files_linked"):
+        assert report["totals"][key] == sum(stage[key] for stage in report["stages"])
+
+
+def test_trace_memory_records_peaks(site):
+    site.build("--trace-memory")
+    report = read_report(site)
+    assert report["memory_traced"] is True
+    assert all(isinstance(stage["peak_memory_bytes"], int) for stage in report["stages"])
+
+
+def test_profile_writes_stats_for_the_render_loops(site):
+    site.build("--profile")
+    for name in ("profile-log-pages", "profile-disruption-pages"):
+        assert (site.dist / "_build" / f"{name}.prof").is_file()
+        assert "cumulative" in (site.dist / "_build" / f"{name}.txt").read_text(encoding="utf-8")
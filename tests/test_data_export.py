@@ -0,0 +1,37 @@
+import json
+import re
+
+
+def read_data(site, name):
+    return json.loads((site.dist / "data" / name).read_text(encoding="utf-8"))
+
+
+def test_nav_pages_list_every_log_without_bodies(site):
+    site.build()
+    meta = read_data(site, "logs-pages-meta.json")
+    nav = [entry for n in range(1, meta["total_pages"] + 1) for entry in read_data(site, f"logs-page-{n}.json")]
+    logs = site.read_logs()["logs"]
+    assert [entry["id"] for entry in nav] == sorted((log["id"] for log in logs), reverse=True)
+    assert meta["total_items"] == len(logs)
+    for entry in nav:
+        assert set(entry) == {
+            "id", "title", "date", "url", "tag", "disruption_title_clean", "disruption_slug_clean",
+        }
+
+
+def test_text_shard_holds_the_bodies_of_its_nav_page(site):
+    site.build()
+    logs = {log["id"]: log for log in site.read_logs()["logs"]}
+    for n in range(1, read_data(site, "logs-pages-meta.json")["total_pages"] + 1):
+        nav_ids = [entry["id"] for entry in read_data(site, f"logs-page-{n}.json")]
+        shard = read_data(site, f"logs-text-{n}.json")
+        assert list(shard) == nav_ids
+        for log_id, body in shard.items():
+            assert body == {"text": logs[log_id]["text"], "excerpt": logs[log_id]["excerpt"]}
+
+
+def test_build_reports_the_bytes_saved(site):
+    stdout = site.build().stdout
+    match = re.search(r"Logs data OK — nav index [\d.]+ kB in \d+ newest-first pages, ([\d.]+) kB less", stdout)
+    assert match, stdout
+    assert float(match.group(1)) > 0
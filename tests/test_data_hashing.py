@@ -0,0 +1,90 @@
+import json
+import re
+
+import pytest
+
+
+def data_manifest(site):
+    return json.loads((site.dist / "data" / "manifest.json").read_text(encoding="utf-8"))
+
+
+def hashed_files(site):
+    data = site.dist / "data"
+    return {path.relative_to(data).as_posix() for path in data.rglob("*.*.json")}
+
+
+def manifest_counts(stdout):
+    match = re.search(r"\((\d+) written, (\d+) linked\), (\d+) kept from the previous build", stdout)
+    assert match, stdout
+    return tuple(int(n) for n in match.groups())
+
+
+def test_plain_build_writes_no_manifest_and_tells_pages_so(site):
+    site.build()
+    assert not (site.dist / "data" / "manifest.json").exists()
+    assert (site.dist / "data" / "logs-page-1.json").is_file()
+    assert 'data-data-manifest=""' in (site.dist / "index.html").read_text(encoding="utf-8")
+
+
+def test_hashed_build_lists_every_data_file_in_the_manifest(site):
+    site.build("--hash-data")
+    files = data_manifest(site)["files"]
+    assert files["logs-page-1.json"] != "logs-page-1.json"
+    assert not (site.dist / "data" / "logs-page-1.json").exists()
+    for hashed in files.values():
+        assert (site.dist / "data" / hashed).is_file()
+    for page in ("index.html", "logs/2025/12/log-01617-what-am-i-for.html"):
+        assert 'data-data-manifest="/data/manifest.json"' in (site.dist / page).read_text(encoding="utf-8")
+
+
+def test_unchanged_hashed_files_are_linked_not_rewritten(site):
+    site.build("--hash-data")
+    live = site.dist.resolve()
+    written, linked, _ = manifest_counts(site.build("--hash-data").stdout)
+    assert (written, linked) == (0, len(data_manifest(site)["files"]))
+    hashed = data_manifest(site)["files"]["logs-page-1.json"]
+    assert (site.dist / "data" / hashed).samefile(live / "data" / hashed)
+
+
+def test_incremental_build_carries_hashed_files_over_without_linking_them_again(site):
+    site.build("--hash-data", "--incremental")
+    assert manifest_counts(site.build("--hash-data", "--incremental").stdout)[:2] == (0, 0)
+
+
+@pytest.mark.parametrize("mode", [(), ("--incremental",), ("--in-place", "--incremental")])
+def test_previous_hashed_files_are_kept_for_one_build_then_pruned(site, mode):
+    site.build("--hash-data", *mode)
+    first = set(data_manifest(site)["files"].values())
+    site.add_log()
+    site.build("--hash-data", *mode)
+    second = set(data_manifest(site)["files"].values())
+    assert first - second
+    assert hashed_files(site) == first | second
+
+    site.add_log()
+    _, _, kept = manifest_counts(site.build("--hash-data", *mode).stdout)
+    third = set(data_manifest(site)["files"].values())
+    assert kept == len(second - third)
+    assert hashed_files(site) == second | third
+
+
+def test_site_state_is_hashed_and_listed_with_the_pages(site):
+    site.build("--hash-data", "--shared-fragments")
+    files = data_manifest(site)["files"]
+    hashed = files["site-state.json"]
+    assert hashed != "site-state.json" and (site.dist / "data" / hashed).is_file()
+    assert not (site.dist / "data" / "site-state.json").exists()
+
+
+def test_site_state_keeps_its_plain_name_without_hash_data(site):
+    site.build("--shared-fragments")
+    assert (site.dist / "data" / "site-state.json").is_file()
+    assert not (site.dist / "data" / "manifest.json").exists()
+
+
+def test_delta_feed_keeps_plain_names_under_hash_data(site):
+    site.build("--hash-data")
+    newest = max(log["id"] for log in site.read_logs()["logs"])
+    assert (site.dist / "data" / "since" / f"{newest}.json").is_file()
+    assert not any(name.startswith("since/") for name in data_manifest(site)["files"])
+    assert not any(path.startswith("since/") for path in hashed_files(site))
@@ -0,0 +1,46 @@
+import json
+
+import build
+
+
+def read_data(site, name):
+    return json.loads((site.dist / "data" / name).read_text(encoding="utf-8"))
+
+
+def nav_pages(site):
+    meta = read_data(site, "logs-pages-meta.json")
+    return {entry["id"]: n for n in range(1, meta["total_pages"] + 1) for entry in read_data(site, f"logs-page-{n}.json")}
+
+
+def test_checkpoints_cover_the_newest_logs(site):
+    site.build()
+    newest_first = sorted((log["id"] for log in site.read_logs()["logs"]), reverse=True)
+    written = sorted(path.stem for path in (site.dist / "data" / "since").iterdir())
+    assert written == sorted(newest_first[: build.DELTA_FEED_CHECKPOINTS])
+
+    latest = read_data(site, f"since/{newest_first[0]}.json")
+    assert latest["logs"] == [] and latest["latest_id"] == newest_first[0]
+    feed = read_data(site, f"since/{newest_first[3]}.json")
+    assert [entry["id"] for entry in feed["logs"]] == newest_first[:3]
+    assert feed["total_items"] == len(newest_first)
+
+
+def test_feed_entries_name_the_page_that_lists_them(site):
+    site.add_logs(60)
+    site.build()
+    pages = nav_pages(site)
+    oldest_checkpoint = sorted(path.stem for path in (site.dist / "data" / "since").iterdir())[0]
+    feed = read_data(site, f"since/{oldest_checkpoint}.json")
+    assert len(feed["logs"]) == build.DELTA_FEED_CHECKPOINTS - 1
+    assert all(entry["page"] == pages[entry["id"]] for entry in feed["logs"])
+
+
+def test_checkpoints_that_leave_the_window_are_removed(site):
+    site.build("--incremental")
+    oldest_checkpoint = min(path.stem for path in (site.dist / "data" / "since").iterdir())
+    added = site.add_logs(2)
+    site.build("--incremental")
+    written = {path.stem for path in (site.dist / "data" / "since").iterdir()}
+    assert len(written) == build.DELTA_FEED_CHECKPOINTS
+    assert oldest_checkpoint not in written
+    assert {log["id"] for log in added} <= written
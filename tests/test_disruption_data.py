@@ -0,0 +1,66 @@
+import json
+
+import build
+
+
+def disruption_files(site):
+    root = site.dist / "data" / "disruption"
+    return {path.name: json.loads(path.read_text(encoding="utf-8")) for path in root.iterdir()}
+
+
+def nav_pages(site):
+    meta = json.loads((site.dist / "data" / "logs-pages-meta.json").read_text(encoding="utf-8"))
+    return {
+        entry["id"]: n
+        for n in range(1, meta["total_pages"] + 1)
+        for entry in json.loads((site.dist / "data" / f"logs-page-{n}.json").read_text(encoding="utf-8"))
+    }
+
+
+def test_every_log_of_a_disruption_is_listed_once_with_its_index_page(site):
+    site.build()
+    files = disruption_files(site)
+    pages = nav_pages(site)
+    listed = {}
+    for name, data in files.items():
+        assert name == f"{data['slug']}-page-{data['page']}.json"
+        assert data["count"] == len(data["logs"]) and data["total_pages"] == 1
+        ids = [entry["id"] for entry in data["logs"]]
+        assert ids == sorted(ids, reverse=True)
+        for entry in data["logs"]:
+            assert entry["disruption_slug_clean"] == data["slug"]
+            assert entry["page"] == pages[entry["id"]]
+            listed[entry["id"]] = data["slug"]
+    assert sum(len(data["logs"]) for data in files.values()) == len(listed)
+    nav = [
+        entry
+        for n in set(pages.values())
+        for entry in json.loads((site.dist / "data" / f"logs-page-{n}.json").read_text(encoding="utf-8"))
+    ]
+    assert listed == {entry["id"]: entry["disruption_slug_clean"] for entry in nav if entry["disruption_slug_clean"]}
+
+
+def test_large_disruption_is_split_into_pages(site):
+    last = site.read_logs()["logs"][-1]
+    site.add_logs(build.DISRUPTION_LOG_PAGE_SIZE + 5)
+    site.build()
+    slug = next(
+        data["slug"] for data in disruption_files(site).values() if any(e["id"] == last["id"] for e in data["logs"])
+    )
+    first = disruption_files(site)[f"{slug}-page-1.json"]
+    second = disruption_files(site)[f"{slug}-page-2.json"]
+    assert first["total_pages"] == second["total_pages"] == 2
+    assert len(first["logs"]) == build.DISRUPTION_LOG_PAGE_SIZE
+    assert len(first["logs"]) + len(second["logs"]) == first["count"]
+    assert first["logs"][0]["id"] > second["logs"][0]["id"]  # newest first
+
+
+def test_oldest_anchored_disruption_pages_start_with_the_oldest_logs(site):
+    site.add_logs(build.DISRUPTION_LOG_PAGE_SIZE + 5)
+    site.build("--pagination", "oldest-anchored")
+    pages = [data for data in disruption_files(site).values() if data["total_pages"] == 2]
+    assert pages
+    by_page = {data["page"]: data for data in pages}
+    assert len(by_page[1]["logs"]) == build.DISRUPTION_LOG_PAGE_SIZE
+    assert by_page[1]["logs"][0]["id"] < by_page[2]["logs"][-1]["id"]
+    assert by_page[2]["head_page"] == 2
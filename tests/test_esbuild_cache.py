@@ -0,0 +1,26 @@
+def test_unchanged_inputs_skip_esbuild(site):
+    site.build()
+    assert site.esbuild_runs() == 2
+    output = site.build().stdout
+    assert site.esbuild_runs() == 2
+    assert "CSS minify SKIP" in output and "JS bundle SKIP" in output
+    assert (site.dist / "assets/css/style.css").is_file()
+    assert (site.dist / "assets/js/bundle.js").is_file()
+
+
+def test_restored_outputs_match_a_fresh_run(site, make_site):
+    site.build()
+    site.build()
+    fresh = make_site()
+    fresh.build()
+    for rel in ("assets/css/style.css", "assets/js/bundle.js"):
+        assert (site.dist / rel).read_bytes() == (fresh.dist / rel).read_bytes()
+
+
+def test_js_change_reruns_only_the_bundle(site):
+    site.build()
+    module = next((site.root / "assets" / "js" / "core").glob("*.js"))
+    module.write_text(module.read_text(encoding="utf-8") + "\n// changed\n", encoding="utf-8")
+    output = site.build().stdout
+    assert site.esbuild_runs() == 3
+    assert "CSS minify SKIP" in output and "JS bundle OK" in output
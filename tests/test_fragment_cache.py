@@ -0,0 +1,79 @@
+import os
+import re
+
+import pytest
+
+import build
+
+
+@pytest.fixture
+def counters():
+    build._STAGE_COUNTERS.current = counters = build.StageCounters()
+    yield counters
+    build._STAGE_COUNTERS.current = None
+
+
+def cache_files(root):
+    return sorted(path for path in root.rglob("*.txt"))
+
+
+def test_hit_returns_the_stored_fragment_without_computing(tmp_path, counters):
+    cache = build.FragmentCache(tmp_path, "salt")
+    assert cache.fetch("log-text-html", "digest", lambda: "<p>text</p>") == "<p>text</p>"
+    assert cache.fetch("log-text-html", "digest", lambda: pytest.fail("computed on a hit")) == "<p>text</p>"
+    assert (counters.fragment_hits, counters.fragment_misses) == (1, 1)
+    assert counters.fragment_bytes_added == len("<p>text</p>")
+
+
+def test_key_covers_salt_kind_and_inputs(tmp_path, counters):
+    cache = build.FragmentCache(tmp_path, "salt")
+    cache.fetch("log-text-html", "a", lambda: "1")
+    assert build.FragmentCache(tmp_path, "other salt").fetch("log-text-html", "a", lambda: "2") == "2"
+    assert cache.fetch("log-text-plain", "a", lambda: "3") == "3"
+    assert cache.fetch("log-text-html", "b", lambda: "4") == "4"
+    assert counters.fragment_misses == 4
+
+
+def test_pages_are_stored_and_counted_apart_from_fragments(tmp_path, counters):
+    cache = build.FragmentCache(tmp_path, "salt")
+    cache.fetch("minify-html", "<html> page </html>", lambda: "<html>page</html>")
+    cache.fetch("jsonld-log", ["01617"], lambda: "{}")
+    assert [p.relative_to(tmp_path).parts[0] for p in cache_files(cache.pages_root)] == ["pages"]
+    assert counters.fragment_page_bytes_added == len("<html>page</html>")
+    assert counters.fragment_bytes_added == len("{}")
+
+
+def test_prune_evicts_least_recently_used_pages_under_their_own_cap(tmp_path, counters):
+    cache = build.FragmentCache(tmp_path, "salt", max_bytes=1 << 20, page_max_bytes=1000)
+    cache.fetch("jsonld-log", ["01617"], lambda: "x" * 900)
+    for n in range(5):
+        cache.fetch("minify-html", f"page {n}", lambda: "p" * 300)
+        path = cache.path_for("minify-html", f"page {n}")
+        os.utime(path, ns=(n * 10**9, n * 10**9))
+
+    removed, kept, page_kept = cache.prune(counters.fragment_bytes_added, counters.fragment_page_bytes_added)
+    assert removed == 2
+    assert (kept, page_kept) == (900, 900)
+    assert not os.path.exists(cache.path_for("minify-html", "page 0"))
+    assert not os.path.exists(cache.path_for("minify-html", "page 1"))
+    assert os.path.exists(cache.path_for("minify-html", "page 4"))
+    assert os.path.exists(cache.path_for("jsonld-log", ["01617"]))
+
+
+def test_prune_tracks_usage_without_rescanning(tmp_path, counters):
+    cache = build.FragmentCache(tmp_path, "salt", max_bytes=1000, page_max_bytes=1000)
+    cache.fetch("jsonld-log", ["a"], lambda: "x" * 100)
+    assert cache.prune(100, 0) == (0, 100, 0)
+    # usage.json says 100 bytes, so a new 100-byte fragment is added without a scan
+    cache.fetch("jsonld-log", ["b"], lambda: "x" * 100)
+    assert cache.prune(100, 0) == (0, 200, 0)
+
+
+def test_build_reports_fragment_and_page_use(site):
+    stdout = site.build().stdout
+    match = re.search(r"Fragment cache OK — (\d+) hits, (\d+) misses, (\d+) evicted", stdout)
+    assert match, stdout
+    assert int(match.group(2)) > 0
+    assert re.search(r"MiB fragments, [\d.]+ of 64 MiB pages\)", stdout)
+    warm = re.search(r"Fragment cache OK — (\d+) hits, (\d+) misses", site.build().stdout)
+    assert int(warm.group(1)) > 0 and int(warm.group(2)) == 0
@@ -0,0 +1,49 @@
+from conftest import LOG_PAGE, incremental_counts
+
+
+def test_rebuild_without_changes_renders_nothing(site):
+    site.build("--incremental")
+    before = site.outputs()
+    rendered, unchanged, removed = incremental_counts(site.build("--incremental").stdout)
+    assert (rendered, removed) == (0, 0)
+    assert unchanged > 0
+    assert site.outputs() == before
+
+
+def test_edited_log_is_rerendered(site):
+    site.build("--incremental")
+    site.edit_log("01617", text="an edited body\nfor this log")
+    rendered, _, _ = incremental_counts(site.build("--incremental").stdout)
+    assert rendered > 0
+    assert "an edited body" in (site.dist / LOG_PAGE).read_text(encoding="utf-8")
+
+
+def test_removed_log_page_is_pruned(site):
+    site.build("--incremental")
+    assert (site.dist / LOG_PAGE).is_file()
+    data = site.read_logs()
+    data["logs"] = [log for log in data["logs"] if log["id"] != "01617"]
+    site.write_logs(data)
+    _, _, removed = incremental_counts(site.build("--incremental").stdout)
+    assert removed >= 1
+    assert not (site.dist / LOG_PAGE).exists()
+
+
+def test_incremental_output_matches_clean_build(site, make_site):
+    site.build("--incremental")
+    site.edit_log("01617", text="an edited body")
+    site.add_log()
+    site.build("--incremental")
+
+    clean = make_site()
+    clean.write_logs(site.read_logs())
+    clean.build()
+    assert site.outputs() == clean.outputs()
+
+
+def test_code_change_invalidates_every_output(site):
+    site.build("--incremental")
+    build_py = site.root / "build.py"
+    build_py.write_text(build_py.read_text(encoding="utf-8-sig") + "\n# changed\n", encoding="utf-8")
+    _, unchanged, _ = incremental_counts(site.build("--incremental").stdout)
+    assert unchanged == 0
@@ -0,0 +1,65 @@
+from datetime import date
+
+import pytest
+
+import bench_build
+import build
+
+CORE_DATE = date(2025, 1, 1)
+
+
+def raw_log(log_id: str, day: str, slug: str | None = None) -> dict:
+    return {"id": log_id, "date": day, "title": f"LOG {log_id}", "slug": slug or f"log-{log_id}", "text": "t"}
+
+
+def error_of(fn, *args) -> str:
+    with pytest.raises(ValueError) as excinfo:
+        fn(*args)
+    return str(excinfo.value)
+
+
+def test_records_match_the_multi_pass_ingest():
+    logs = bench_build.generate_archive(bench_build.ArchiveSpec(logs=300))["logs"]
+    single = build.ingest_logs(logs, CORE_DATE)
+    legacy = bench_build.legacy_ingest(logs, CORE_DATE)
+    assert [r.hash_fields() for r in single] == [r.hash_fields() for r in legacy]
+
+
+@pytest.mark.parametrize(
+    "logs, expected",
+    [
+        ([raw_log("1", "2025-01-02"), raw_log("x1", "2025-01-03")], "logs[1].id: id must be numeric, got 'x1'"),
+        ([raw_log("", "2025-01-02")], "logs[0].id: missing id"),
+        (
+            [raw_log("1", "2025-01-02"), raw_log("01", "2025-01-03")],
+            "logs[1].id: duplicate id '1' (first seen at logs[0].id)",
+        ),
+        ([raw_log("1", "2025-02-30")], "logs[0].date (id=1): invalid ISO date '2025-02-30'"),
+        (
+            [raw_log("1", "2025-01-05"), raw_log("2", "2025-01-04")],
+            "Date consistency error by id order: id 1 (2025-01-05) -> id 2 (2025-01-04)",
+        ),
+        (
+            [raw_log("2", "2025-01-04"), raw_log("1", "2025-01-05")],
+            "Date consistency error by id order: id 1 (2025-01-05) -> id 2 (2025-01-04)",
+        ),
+    ],
+)
+def test_errors_match_the_multi_pass_ingest(logs, expected):
+    message = error_of(build.ingest_logs, logs, CORE_DATE)
+    assert expected in message
+    assert message == error_of(bench_build.legacy_ingest, logs, CORE_DATE)
+
+
+def test_id_errors_take_precedence_over_date_order():
+    logs = [raw_log("1", "2025-01-05"), raw_log("2", "2025-01-04"), raw_log("bad", "2025-01-06")]
+    message = error_of(build.ingest_logs, logs, CORE_DATE)
+    assert "Invalid log records" in message and "'bad'" in message
+    assert "Date consistency" not in message
+
+
+def test_long_error_lists_are_truncated():
+    logs = [raw_log(f"x{i}", "2025-01-01") for i in range(25)]
+    message = error_of(build.ingest_logs, logs, CORE_DATE)
+    assert message.count("\n- ") == 20
+    assert message.endswith("... and 5 more")
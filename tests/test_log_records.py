@@ -0,0 +1,62 @@
+from datetime import date
+
+import pytest
+
+import build
+from conftest import LOG_PAGE, incremental_counts
+
+CORE_DATE = date(2025, 12, 1)
+RAW = {
+    "id": "01617",
+    "title": "LOG 01617 // WHAT AM I FOR",
+    "date": "2025-12-09",
+    "tag": "DISRUPTION",
+    "series": "DISRUPTION_SERIES // I'M NOT DONE",
+    "slug": "What Am I For",
+    "excerpt": "excerpt",
+    "text": "first line\nsecond line",
+}
+
+
+def record(**fields) -> build.LogRecord:
+    raw = {**RAW, **fields}
+    return build.LogRecord(raw, int(raw["id"]), date.fromisoformat(raw["date"]), CORE_DATE)
+
+
+def test_derived_fields_are_computed_at_ingest():
+    log = record()
+    assert log.slug == "what-am-i-for"
+    assert log.url == "/logs/2025/12/log-01617-what-am-i-for.html"
+    assert log.entry_title == "WHAT AM I FOR"
+    assert log.disruption_title == "I'M NOT DONE"
+    assert log.system_age_days == "8"
+    assert log.text == RAW["text"]
+    assert not hasattr(log, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"disruption_title_clean": "ANOTHER TITLE"},
+        {"series": "DISRUPTION_SERIES // ELSEWHERE"},
+        {"title": "ANOTHER TITLE"},
+        {"slug": "another-slug"},
+        {"text": "another body"},
+        {"ui_state": {"mode": "READ_WRITE"}},
+    ],
+)
+def test_every_field_a_page_shows_changes_the_hash(fields):
+    assert record(**fields).hash_fields() != record().hash_fields()
+
+
+def test_derived_input_edit_rerenders_the_page(site, make_site):
+    site.build("--incremental")
+    site.edit_log("01617", disruption_title_clean="A CLEAN TITLE")
+    rendered, _, _ = incremental_counts(site.build("--incremental").stdout)
+    assert rendered > 0
+    assert "A CLEAN TITLE" in (site.dist / LOG_PAGE).read_text(encoding="utf-8")
+
+    clean = make_site()
+    clean.write_logs(site.read_logs())
+    clean.build()
+    assert site.outputs() == clean.outputs()
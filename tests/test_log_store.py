@@ -0,0 +1,38 @@
+import sqlite3
+
+from conftest import LOG_PAGE
+
+
+def store_path(site):
+    return site.root / ".build-cache" / "logs.sqlite"
+
+
+def test_sqlite_store_builds_the_same_site(site, make_site):
+    site.build("--log-store", "sqlite")
+    memory = make_site()
+    memory.build()
+    assert site.outputs() == memory.outputs()
+
+
+def test_store_is_queryable_by_id_date_and_disruption(site):
+    site.build("--log-store", "sqlite")
+    with sqlite3.connect(store_path(site)) as db:
+        indexes = {row[0] for row in db.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"logs_rank", "logs_day", "logs_slug", "logs_disruption"} <= indexes
+        count = db.execute("SELECT COUNT(*) FROM logs").fetchone()[0]
+        assert count == len(site.read_logs()["logs"])
+        title = db.execute("SELECT title FROM logs WHERE id = '01617'").fetchone()[0]
+        assert title == next(log for log in site.read_logs()["logs"] if log["id"] == "01617")["title"]
+
+
+def test_store_follows_source_edits(site, make_site):
+    site.build("--log-store", "sqlite", "--incremental")
+    site.edit_log("01617", text="stored edit")
+    site.add_log()
+    site.build("--log-store", "sqlite", "--incremental")
+    assert "stored edit" in (site.dist / LOG_PAGE).read_text(encoding="utf-8")
+
+    memory = make_site()
+    memory.write_logs(site.read_logs())
+    memory.build()
+    assert site.outputs() == memory.outputs()
@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+import build
+
+
+def builds(site):
+    return sorted(path.name for path in (site.root / ".dist-builds").iterdir())
+
+
+def test_staged_build_goes_live_through_a_link(site):
+    site.build()
+    first = site.dist.resolve()
+    assert site.dist.is_symlink() and first.parent == site.root / ".dist-builds"
+
+    site.build()
+    second = site.dist.resolve()
+    assert second != first
+    assert builds(site) == sorted([first.name, second.name])
+    site.build()
+    assert first.name not in builds(site)  # only the live build and the one it replaced are kept
+
+
+def test_failed_build_leaves_the_live_build_alone(site):
+    site.build()
+    live = site.dist.resolve()
+    before = site.outputs()
+
+    template = site.root / "template-log.html"
+    template.write_text(template.read_text(encoding="utf-8") + "{{NO_SUCH_TOKEN}}", encoding="utf-8")
+    result = site.build(check=False)
+    assert result.returncode != 0
+    assert "BUILD FAILED — dist/ still serves the previous build" in result.stdout
+    assert site.dist.resolve() == live
+    assert builds(site) == [live.name]
+    assert site.outputs() == before
+
+
+def test_in_place_build_after_a_staged_one_turns_dist_back_into_a_directory(site):
+    site.build()
+    site.build()
+    live = site.dist.resolve()
+    replaced = next(path for path in (site.root / ".dist-builds").iterdir() if path != live)
+    replaced_outputs = site.outputs(replaced)
+
+    site.build("--in-place")
+    assert site.dist.is_dir() and not site.dist.is_symlink()
+    assert (site.dist / "index.html").is_file()
+    assert not live.exists()  # moved to dist/, not cleaned in place through the link
+    assert site.outputs(replaced) == replaced_outputs
+
+    site.build()
+    assert site.dist.is_symlink()
+    assert any(name.endswith("-replaced") for name in builds(site))
+
+
+@pytest.fixture
+def live_link(tmp_path, monkeypatch):
+    monkeypatch.setattr(build, "DIST_LIVE", tmp_path / "dist")
+    monkeypatch.setattr(build, "DIST_BUILDS_DIR", tmp_path / "builds")
+    old = tmp_path / "builds" / "old"
+    old.mkdir(parents=True)
+    (tmp_path / "dist").symlink_to(os.path.relpath(old, tmp_path), target_is_directory=True)
+    return tmp_path
+
+
+def test_rename_fallback_replaces_an_existing_link(live_link, monkeypatch):
+    new = live_link / "builds" / "new"
+    new.mkdir()
+    (new / "index.html").write_text("new")
+
+    def no_symlinks(*args, **kwargs):
+        raise OSError("symlinks unsupported")
+
+    monkeypatch.setattr(build.Path, "symlink_to", no_symlinks)
+    assert build.swap_output_build(new) == "rename"
+    dist = live_link / "dist"
+    assert dist.is_dir() and not dist.is_symlink()
+    assert (dist / "index.html").read_text() == "new"
+    assert (live_link / "builds" / "old").is_dir()
+
+
+def test_unlink_output_build_moves_the_linked_build_to_dist(live_link):
+    (live_link / "builds" / "old" / "index.html").write_text("old")
+    build.unlink_output_build()
+    dist = live_link / "dist"
+    assert dist.is_dir() and not dist.is_symlink()
+    assert (dist / "index.html").read_text() == "old"
+    assert not (live_link / "builds" / "old").exists()
@@ -0,0 +1,54 @@
+import pytest
+
+import build
+
+
+@pytest.fixture
+def counters():
+    build._STAGE_COUNTERS.current = counters = build.StageCounters()
+    yield counters
+    build._STAGE_COUNTERS.current = None
+
+
+def test_writes_every_file_and_adds_the_thread_counters(tmp_path, counters):
+    files = {tmp_path / f"d{n % 3}" / "sub" / f"f{n}.txt": f"content {n}" for n in range(50)}
+    with build.OutputWriter(threads=3, queue_size=8, batch_size=4):
+        for path, content in files.items():
+            build.write_text(path, content, context=f"page={path.name}")
+    assert {path: path.read_text(encoding="utf-8") for path in files} == files
+    assert counters.files_written == 50
+    assert counters.bytes_written == sum(len(content) for content in files.values())
+
+
+def test_write_text_outside_a_writer_writes_immediately(tmp_path, counters):
+    build.write_text(tmp_path / "a" / "b.txt", "now")
+    assert (tmp_path / "a" / "b.txt").read_text(encoding="utf-8") == "now"
+    assert build.current_output_writer() is None
+
+
+def test_failed_write_raises_with_the_page_context(tmp_path, counters):
+    (tmp_path / "blocker").write_text("a file where a directory should be")
+    with pytest.raises(RuntimeError, match=r"Failed to write output: .* \| context: log=01617"):
+        with build.OutputWriter(batch_size=1):
+            build.write_text(tmp_path / "ok.txt", "fine")
+            build.write_text(tmp_path / "blocker" / "page.html", "x", context="log=01617")
+    assert (tmp_path / "ok.txt").read_text(encoding="utf-8") == "fine"
+
+
+def test_writer_restores_the_previous_writer(tmp_path, counters):
+    with build.OutputWriter() as outer:
+        with build.OutputWriter() as inner:
+            assert build.current_output_writer() is inner
+        assert build.current_output_writer() is outer
+    assert build.current_output_writer() is None
+
+
+def test_replaces_a_hardlinked_output_instead_of_writing_through_it(tmp_path, counters):
+    live = tmp_path / "live.html"
+    live.write_text("live build", encoding="utf-8")
+    staged = tmp_path / "staged.html"
+    staged.hardlink_to(live)
+    with build.OutputWriter():
+        build.write_text(staged, "new build")
+    assert live.read_text(encoding="utf-8") == "live build"
+    assert staged.read_text(encoding="utf-8") == "new build"
@@ -0,0 +1,60 @@
+import json
+from types import SimpleNamespace
+
+import build
+
+
+def logs_with_ids(*ids):
+    return [SimpleNamespace(id_int=i) for i in sorted(ids, reverse=True)]
+
+
+def test_anchored_pages_count_from_the_oldest_logs_range():
+    chunks = list(build.iter_anchored_log_chunks(logs_with_ids(1612, 1649, 1650, 1760), 50))
+    assert [(n, [log.id_int for log in chunk]) for n, chunk in chunks] == [
+        (1, [1649, 1612]),
+        (2, [1650]),
+        (3, []),  # no log in 1700-1749: still written, so the numbers stay contiguous
+        (4, [1760]),
+    ]
+
+
+def test_anchored_pages_of_an_empty_archive():
+    assert list(build.iter_anchored_log_chunks([], 50)) == []
+
+
+def data_pages(site):
+    return {rel: data for rel, data in site.outputs().items() if rel.startswith("data/logs-")}
+
+
+def test_oldest_anchored_meta_lists_every_written_page(site):
+    site.add_logs(60)
+    site.build("--pagination", "oldest-anchored")
+    meta = json.loads((site.dist / "data" / "logs-pages-meta.json").read_text(encoding="utf-8"))
+    assert (meta["first_page"], meta["head_page"], meta["total_pages"]) == (1, 3, 3)
+    assert meta["immutable_pages"] == [1, 2]
+    ids = [
+        entry["id"]
+        for n in range(meta["head_page"], 0, -1)
+        for entry in json.loads((site.dist / "data" / f"logs-page-{n}.json").read_text(encoding="utf-8"))
+    ]
+    assert ids == sorted((log["id"] for log in site.read_logs()["logs"]), reverse=True)
+
+
+def test_new_log_changes_only_the_head_page(site):
+    site.add_logs(60)
+    site.build("--pagination", "oldest-anchored")
+    before = data_pages(site)
+    site.add_log()
+    site.build("--pagination", "oldest-anchored")
+    after = data_pages(site)
+    changed = sorted(rel for rel in after if before.get(rel) != after[rel])
+    assert changed == ["data/logs-page-3.json", "data/logs-pages-meta.json", "data/logs-text-3.json"]
+
+
+def test_newest_first_log_pages_are_numbered_from_the_newest(site):
+    site.add_logs(60)
+    site.build()
+    meta = json.loads((site.dist / "data" / "logs-pages-meta.json").read_text(encoding="utf-8"))
+    assert "first_page" not in meta and meta["total_pages"] == 2
+    newest = json.loads((site.dist / "data" / "logs-page-1.json").read_text(encoding="utf-8"))
+    assert newest[0]["id"] == site.read_logs()["logs"][-1]["id"]
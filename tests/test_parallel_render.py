@@ -0,0 +1,20 @@
+import build
+
+
+def test_worker_processes_render_the_same_site(site, make_site):
+    # enough pages for several RENDER_CHUNK_SIZE chunks, or the pool is not used
+    site.add_logs(2 * build.RENDER_CHUNK_SIZE)
+    site.build("--jobs", "1")
+    parallel = make_site()
+    parallel.write_logs(site.read_logs())
+    parallel.build("--jobs", "3")
+    assert parallel.outputs() == site.outputs()
+
+
+def test_worker_processes_in_incremental_mode(site):
+    site.add_logs(2 * build.RENDER_CHUNK_SIZE)
+    site.build("--incremental", "--jobs", "2")
+    site.edit_log("01617", text="rendered by a worker")
+    site.build("--incremental", "--jobs", "2")
+    page = site.dist / "logs/2025/12/log-01617-what-am-i-for.html"
+    assert "rendered by a worker" in page.read_text(encoding="utf-8")
@@ -0,0 +1,44 @@
+import json
+
+
+def changed_html(before: dict, after: dict) -> set[str]:
+    return {
+        path
+        for path in after.keys() | before.keys()
+        if path.endswith(".html") and before.get(path) != after.get(path)
+    }
+
+
+def test_new_log_changes_only_its_neighbourhood(site):
+    site.build("--shared-fragments")
+    before = site.outputs()
+    new_log = site.add_log()
+    site.build("--shared-fragments")
+    after = site.outputs()
+
+    new_page = next(path for path in after if path.startswith("logs/") and new_log["slug"] in path)
+    previous_page = next(path for path in before if path.startswith("logs/") and "log-01644-" in path)
+    changed = changed_html(before, after)
+    expected = {new_page, "index.html", "disruption/authorized-dissent.html"}
+    # the previous log's page changes only if the template shows its next link
+    assert expected <= changed <= expected | {previous_page}
+
+
+def test_site_state_carries_the_volatile_values(site):
+    site.build("--shared-fragments")
+    state = json.loads((site.dist / "data" / "site-state.json").read_text(encoding="utf-8"))
+    page = (site.dist / "logs/2025/12/log-01617-what-am-i-for.html").read_text(encoding="utf-8")
+    assert state["available_count"] not in page
+    site.add_log()
+    site.build("--shared-fragments")
+    newer = json.loads((site.dist / "data" / "site-state.json").read_text(encoding="utf-8"))
+    assert newer != state
+
+
+def test_without_the_option_every_page_embeds_the_fragments(site):
+    site.build()
+    before = site.outputs()
+    site.add_log()
+    site.build()
+    changed = changed_html(before, site.outputs())
+    assert "logs/2025/12/log-01617-what-am-i-for.html" in changed
@@ -0,0 +1,64 @@
+import re
+
+import pytest
+
+import build
+
+
+def split(site, fmt: str) -> None:
+    assert "SPLIT OK" in site.build("--split-source", fmt).stdout
+    (site.root / "logs.json").unlink()
+
+
+def shard_counts(stdout: str) -> tuple[int, int]:
+    match = re.search(r"Source shards OK — \d+ in logs/, (\d+) parsed, (\d+) from index", stdout)
+    assert match, stdout
+    return int(match.group(1)), int(match.group(2))
+
+
+@pytest.mark.parametrize("fmt", ["json", "md"])
+def test_shards_build_the_same_site(site, make_site, fmt):
+    reference = make_site()
+    reference.build()
+    split(site, fmt)
+    assert len(list((site.root / "logs").glob(f"*.{fmt}"))) == len(reference.read_logs()["logs"])
+    site.build()
+    assert site.outputs() == reference.outputs()
+
+
+def test_only_changed_shards_are_parsed(site):
+    split(site, "md")
+    total = len(list((site.root / "logs").iterdir()))
+    assert shard_counts(site.build().stdout) == (total, 0)
+
+    shard = next((site.root / "logs").glob("01617-*.md"))
+    shard.write_text(shard.read_text(encoding="utf-8") + "\nan appended line\n", encoding="utf-8")
+    assert shard_counts(site.build().stdout) == (1, total - 1)
+    page = (site.dist / "logs/2025/12/log-01617-what-am-i-for.html").read_text(encoding="utf-8")
+    assert "an appended line" in page
+
+
+def test_both_layouts_at_once_are_refused(site):
+    site.build("--split-source", "json")
+    result = site.build(check=False)
+    assert result.returncode != 0
+    assert "Both logs.json and logs/ exist" in result.stdout + result.stderr
+
+
+def test_markdown_shards_round_trip():
+    raw = {"id": "00042", "title": "A: B", "ui_state": {"mode": "READ_WRITE"}, "excerpt": "1", "text": "x\n\ny"}
+    assert build.parse_markdown_shard(build.format_markdown_shard(raw), "00042-x.md") == raw
+
+
+def test_markdown_shard_front_matter():
+    raw = build.parse_markdown_shard(
+        '---\nid: "00042"\ndate: 2025-01-02\nui_state: {"mode": "READ_WRITE"}\ntitle: A: B\n---\nbody line\n',
+        "00042-x.md",
+    )
+    assert raw == {
+        "id": "00042",
+        "date": "2025-01-02",
+        "ui_state": {"mode": "READ_WRITE"},
+        "title": "A: B",
+        "text": "body line",
+    }
@@ -0,0 +1,40 @@
+SNAPSHOT_HIT = "Source snapshot OK"
+
+
+def snapshots(site) -> list:
+    return sorted((site.root / ".build-cache" / "source-snapshots").glob("*.pickle"))
+
+
+def test_second_build_loads_the_snapshot(site):
+    assert SNAPSHOT_HIT not in site.build().stdout
+    before = site.outputs()
+    assert len(snapshots(site)) == 1
+    assert SNAPSHOT_HIT in site.build().stdout
+    assert site.outputs() == before
+
+
+def test_source_edit_replaces_the_snapshot(site):
+    site.build()
+    old = snapshots(site)
+    site.edit_log("01617", text="edited after the snapshot")
+    assert SNAPSHOT_HIT not in site.build().stdout
+    assert snapshots(site) != old and len(snapshots(site)) == 1
+    page = (site.dist / "logs/2025/12/log-01617-what-am-i-for.html").read_text(encoding="utf-8")
+    assert "edited after the snapshot" in page
+
+
+def test_unreadable_snapshot_is_ignored(site):
+    site.build()
+    before = site.outputs()
+    snapshots(site)[0].write_bytes(b"not a pickle")
+    output = site.build().stdout
+    assert "ignoring unreadable source snapshot" in output
+    assert site.outputs() == before
+
+
+def test_snapshot_text_is_read_from_the_current_source(site):
+    site.build()
+    site.build()  # pages rendered from snapshot records read their text through a new text store
+    page = (site.dist / "logs/2025/12/log-01617-what-am-i-for.html").read_text(encoding="utf-8")
+    text = next(log for log in site.read_logs()["logs"] if log["id"] == "01617")["text"]
+    assert text.splitlines()[0] in page
@@ -0,0 +1,84 @@
+import io
+import json
+
+import pytest
+
+import build
+
+DOCUMENT = {
+    "site": {"base_url": "https://example.invalid", "og_image": "/og.jpg", "youtube": "https://y.invalid"},
+    "system": {"core_start_utc": "2025-01-01T00:00:00Z", "sys_ver": "01.00"},
+    "logs": [
+        {"id": "1", "date": "2025-01-02", "title": "ÅNGSTRÖM — \U0001f4a1", "text": "a \"quoted\"\nbody\\"},
+        {"id": "2", "date": "2025-01-03", "title": "numbers", "score": -12.5e+3, "flags": [True, False, None]},
+        {"id": "3", "date": "2025-01-04", "title": "escapes \\u00e9", "text": "\té€"},
+    ],
+}
+
+
+class CountingReader(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def read_document(path) -> dict:
+    return {key: list(value) if isinstance(value, build.LogStream) else value for key, value in build.iter_logs_json(path)}
+
+
+@pytest.mark.parametrize("chunk", [1, 2, 3, 5, 7, 64])
+def test_any_chunk_size_reads_the_same_document(tmp_path, monkeypatch, chunk):
+    monkeypatch.setattr(build, "SOURCE_READ_CHUNK", chunk)
+    path = tmp_path / "logs.json"
+    raw = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode("utf-8")
+    path.write_bytes(raw)
+    data = read_document(path)
+    assert [log for log, _ in data["logs"]] == DOCUMENT["logs"]
+    for log, (offset, length) in data["logs"]:
+        assert json.loads(raw[offset:offset + length]) == log
+    assert data["site"] == DOCUMENT["site"]
+
+
+def test_loaded_records_read_their_text_back(tmp_path):
+    path = tmp_path / "logs.json"
+    path.write_text(json.dumps(DOCUMENT, ensure_ascii=False), encoding="utf-8")
+    source = build.stage_load_and_validate_source(path)
+    try:
+        texts = {log.id: log.text for log in source["logs"]}
+        assert texts == {log["id"]: log.get("text", "") for log in DOCUMENT["logs"]}
+        assert all(not isinstance(log.text_ref, str) for log in source["logs"])
+    finally:
+        source["text_store"].close()
+
+
+def test_malformed_record_fails_without_reading_the_rest(monkeypatch):
+    monkeypatch.setattr(build, "SOURCE_READ_CHUNK", 256)
+    padding = b", ".join(b'{"id": "9", "text": "' + b"x" * 200 + b'"}' for _ in range(1000))
+    data = b'[{"id": "1"}, {"id": 2,, "x": 1}, ' + padding + b"]"
+    reader = CountingReader(data)
+    stream = build._JsonStream(reader, "logs.json")
+    with pytest.raises(ValueError, match="Invalid logs.json"):
+        list(build.LogStream(stream))
+    assert reader.bytes_read <= 2 * 256
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (b'{"site": {}, "logs": [{"id": "1"}', "expected ',' or ']', got end of file"),
+        (b'{"site": {}, "logs": [{"id": "1"', "Invalid logs.json"),
+        (b'{"site": {}} trailing', "unexpected data after the root object"),
+        (b'[1, 2]', "root object must be a JSON object"),
+        (b'{"site": "\xff"}', "not valid UTF-8"),
+    ],
+)
+def test_broken_files_are_reported(tmp_path, data, message):
+    path = tmp_path / "logs.json"
+    path.write_bytes(data)
+    with pytest.raises(ValueError, match=message):
+        read_document(path)
@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+
+import build
+from build import Stage
+
+
+def test_artifacts_flow_between_stages():
+    stages = [
+        Stage("sum", lambda a: {"total": a["left"] + a["right"]}, ("left", "right"), ("total",)),
+        Stage("left", lambda a: {"left": 2}, (), ("left",)),
+        Stage("right", lambda a: {"right": 3}, (), ("right",)),
+    ]
+    artifacts, runs = build.run_stage_graph(stages, workers=2)
+    assert artifacts == {"left": 2, "right": 3, "total": 5}
+    assert [run.name for run in runs][-1] == "sum"
+
+
+def test_independent_stages_overlap():
+    # each stage waits for the other: run one after another, the barrier times out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def meet(name):
+        def run(a):
+            barrier.wait()
+            return {name: True}
+
+        return run
+
+    stages = [Stage("a", meet("a"), (), ("a",)), Stage("b", meet("b"), (), ("b",))]
+    artifacts, _ = build.run_stage_graph(stages, workers=2)
+    assert artifacts == {"a": True, "b": True}
+
+
+def test_concurrent_stage_output_does_not_interleave(capsys):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def chatty(name):
+        def run(a):
+            for i in range(3):
+                print(f"{name} line {i}")
+                barrier.wait()
+            return {name: True}
+
+        return run
+
+    stages = [Stage("a", chatty("a"), (), ("a",)), Stage("b", chatty("b"), (), ("b",))]
+    build.run_stage_graph(stages, workers=2)
+    lines = capsys.readouterr().out.splitlines()
+    assert sorted(lines) == [f"{name} line {i}" for name in "ab" for i in range(3)]
+    first = lines[0].split()[0]
+    assert [line.split()[0] for line in lines] == [first] * 3 + [{"a": "b", "b": "a"}[first]] * 3
+
+
+def test_failed_stage_output_is_kept(capsys):
+    def fail(a):
+        print("about to fail")
+        raise RuntimeError("stage failed")
+
+    with pytest.raises(RuntimeError, match="stage failed"):
+        build.run_stage_graph([Stage("x", fail, (), ())])
+    assert "about to fail" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "stages, message",
+    [
+        ([Stage("a", dict, ("b_out",), ("a_out",)), Stage("b", dict, ("a_out",), ("b_out",))], "cycle"),
+        ([Stage("a", dict, ("missing",), ())], "needs artifacts no stage produces"),
+        ([Stage("a", dict, (), ("x",)), Stage("b", dict, (), ("x",))], "produced by both"),
+        ([Stage("a", dict), Stage("a", dict)], "Duplicate build stage"),
+    ],
+)
+def test_invalid_graphs_are_rejected(stages, message):
+    with pytest.raises(ValueError, match=message):
+        build.validate_stage_graph(stages)
+
+
+def test_stage_must_return_its_declared_outputs():
+    with pytest.raises(RuntimeError, match="declared"):
+        build.run_stage_graph([Stage("a", lambda a: {"other": 1}, (), ("a_out",))])
+
+
+def test_critical_path_follows_dependencies():
+    stages = [
+        Stage("a", lambda a: {"a": 1}, (), ("a",)),
+        Stage("b", lambda a: {"b": 1}, ("a",), ("b",)),
+        Stage("c", lambda a: {"c": 1}, (), ("c",)),
+    ]
+    runs = [
+        build.StageRun("a", 0.0, 1.0, 0.0, None, build.StageCounters()),
+        build.StageRun("c", 0.0, 1.5, 0.0, None, build.StageCounters()),
+        build.StageRun("b", 1.0, 2.0, 0.0, None, build.StageCounters()),
+    ]
+    assert [run.name for run in build.critical_path(stages, runs)] == ["a", "b"]
+
+
+def test_threaded_build_matches_sequential_build(site, make_site):
+    site.build("--stage-workers", "1")
+    threaded = make_site()
+    threaded.build("--stage-workers", "4")
+    assert threaded.outputs() == site.outputs()
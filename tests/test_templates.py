@@ -0,0 +1,53 @@
+import pytest
+
+import build
+from conftest import ROOT
+
+BASE_URL = "https://ox500.com"
+
+
+def compile_log_template() -> tuple[str, build.CompiledTemplate]:
+    source = build.read_text(ROOT / "template-log.html")
+    return source, build.CompiledTemplate(source, "template-log.html", BASE_URL)
+
+
+def test_render_matches_legacy_render_and_css_rewrite():
+    source, template = compile_log_template()
+    mapping = {key: f"<value {key.lower()}>" for key in template.slots}
+    legacy = build.rewrite_css_links(build.render(source, mapping, "template-log.html"), BASE_URL)
+    assert template.render(mapping) == legacy
+
+
+def test_missing_token_fails_on_first_render():
+    template = build.CompiledTemplate("<p>{{KNOWN}} {{UNKNOWN_A}} {{UNKNOWN_B}}</p>", "t.html")
+    with pytest.raises(ValueError) as excinfo:
+        template.render({"KNOWN": "x"}, context="output=a.html")
+    message = str(excinfo.value)
+    assert "['UNKNOWN_A', 'UNKNOWN_B']" in message
+    assert "t.html" in message and "output=a.html" in message
+
+
+def test_tokens_are_checked_once_per_template(monkeypatch):
+    _, template = compile_log_template()
+    mapping = dict.fromkeys(template.slots, "v")
+    calls = []
+    original = build.CompiledTemplate.check_tokens
+    monkeypatch.setattr(
+        build.CompiledTemplate, "check_tokens", lambda self, *a, **kw: calls.append(1) or original(self, *a, **kw)
+    )
+    for _ in range(5):
+        template.render(mapping)
+    assert len(calls) == 1
+
+
+def test_none_values_render_empty():
+    template = build.CompiledTemplate("a{{X}}b", "t.html")
+    assert template.render({"X": None}) == "ab"
+
+
+def test_build_rejects_a_template_token_no_page_provides(site):
+    log_template = site.root / "template-log.html"
+    log_template.write_text(log_template.read_text(encoding="utf-8") + "{{NOT_A_TOKEN}}", encoding="utf-8")
+    result = site.build(check=False)
+    assert result.returncode != 0
+    assert "Unresolved template tokens in 'template-log.html': ['NOT_A_TOKEN']" in result.stdout + result.stderr